@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Command line interface.
+
+    scriptum compile data.rdf -o data.rdfc
+    python -m Scriptum compile data.rdf
+"""
+
+import argparse
+import sys
+from typing import Sequence
+
+from .rdf.compiled import compileRdf
+
+
+def _compile(args: argparse.Namespace) -> int:
+    try:
+        output = compileRdf(args.rdf, args.output, cache=args.cache, workers=args.workers)
+    except Exception as exc:
+        print(f"{args.rdf}: failed to compile RDF file:\n{exc}")
+        return 1
+    print(f"{args.rdf}: compiled to {output}")
+    return 0
+
+
+def _parse_arguments(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="scriptum", description="Scriptum report tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compile_ = commands.add_parser(
+        "compile",
+        help="Parse an RDF file with all includes and write it as compiled file (.rdfc).",
+    )
+    compile_.add_argument("rdf", help="RDF file to compile.")
+    compile_.add_argument("-o", "--output", help="Compiled file, default: RDF file with suffix .rdfc.")
+    compile_.add_argument("--cache", help="Directory of a parse cache to use.")
+    compile_.add_argument("--workers", type=int, help="Processes to parse &include=loopfiles: files.")
+    compile_.set_defaults(run=_compile)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_arguments(argv if argv is not None else sys.argv[1:])
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,6 +5,7 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import Any, List, Mapping, Tuple
 
+from ...element.image_optimizer import placePicture
 from ...rdf.values import ImageValue
 from ...tag import Tag
 from ..paragraphs import DocParagraphElement
@@ -53,10 +54,15 @@ class DocImageBlockElement(StructuredElement):
 
             #print(imagename,width,height)
             found = image_par.replaceTag(self.tag, "")
-            try:
-                found.add_picture(imagename, width=width, height=height)
-            except UnrecognizedImageError:
-                found.text = f'WARNING: python-docx cannot handle image "{imagename}"'
+
+            def insert(filename):
+                try:
+                    found.add_picture(filename, width=width, height=height)
+                except UnrecognizedImageError:
+                    found.text = f'WARNING: python-docx cannot handle image "{imagename}"'
+
+            # right away or, with an ImageOptimizer, resampled once all is filled
+            placePicture(imagename, width, height, insert)
 
             for key, val in actions.items():
                 for t, element in _structure:
@@ -70,7 +76,7 @@ class DocImageBlockElement(StructuredElement):
 
         self.tag.burn()
 
-    def copy(self, anchor, parent, newpath=None, newname="", section=None):
+    def copy(self, anchor, parent, newpath=None, newname="", index=None):
         """Copy all elements just before the anchor."""
 
         if newpath is None:
@@ -118,9 +124,6 @@ class DocImageBlockElement(StructuredElement):
                 etag, newpath, parent, newUnfoldedElements, None
             )
             mycopy.explore()
-        
-            if mycopy.subtype == 'structure':
-                section.addressbook[".".join(mycopy.path)] = mycopy
         else:
             
             mycopy = DocImageBlockElement(
@@ -128,9 +131,9 @@ class DocImageBlockElement(StructuredElement):
             )
             mycopy.path = parent.path + [newname]
             mycopy.structure = [(etag,newElements[0])]
-            # add this one into the parents structure
         
-        parent.structure.append(('image',mycopy))
+        # add this one into the parents structure
+        index.append(parent, ('image',mycopy))
 
         return mycopy
 
@@ -34,14 +34,17 @@ class DocParagraphElement(DocElement,ParagraphElement):
             if t.args and 'template' in t.args:
                 self.isTemplate = True
             # clean comments
+            comments = {}
             for tag in tags:
                 if tag.ns == 'comment':
-                    self.replaceTag(tag,'')
+                    comments[tag.puretag] = ''
                     tag.burn()
                 elif tag.ns == 'marker':
                     self.tags += [tag] # we still keep those active
                 else:
                     self.tags += [tag]
+            if comments:
+                self.replaceTags(comments)
 
         self.content = elem.text
              
@@ -66,11 +69,9 @@ class DocParagraphElement(DocElement,ParagraphElement):
         self.deepcopy = [deepcopy(self.thing._p)]
         return self.deepcopy
 
-    def copy(self, anchor, parent, newpath=[], newname='', section=None):
+    def copy(self, anchor, parent, newpath=[], newname='', index=None):
         """copy all elements just before the anchor,
-        in case of self.type == 'struct', rename the first and last element if newname is set
-        
-        in this case we ignore section since we don't deliver a structure"""
+        in case of self.type == 'struct', rename the first and last element if newname is set"""
         #print('newpath', newpath)
         newElement = DocParagraphElement(
                 copy_paragraph_before(anchor.thing,  
@@ -88,7 +89,7 @@ class DocParagraphElement(DocElement,ParagraphElement):
         #print('\n tag rewritten\n',tag.puretag, tag.burned)
             
         # add this one into the parents structure
-        parent.structure.append((tag,newElement))
+        index.append(parent, (tag,newElement))
         return newElement
 
 def delete_paragraph(paragraph):
@@ -147,7 +148,7 @@ class DocTextBlockElement(StructuredElement):
         self.structure[0][1].replaceTag(self.tag, '')
         self.tag.burn()
 
-    def copy(self, anchor, parent, newpath=None, newname="", section=None):
+    def copy(self, anchor, parent, newpath=None, newname="", index=None):
         """Copy all elements just before the anchor."""
 
         if newpath is None:
@@ -185,9 +186,7 @@ class DocTextBlockElement(StructuredElement):
         )
         mycopy.explore()
     
-        section.addressbook[".".join(mycopy.path)] = mycopy
-        
-        parent.structure.append(('text',mycopy))
+        index.append(parent, ('text',mycopy))
 
         return mycopy
 
@@ -15,8 +15,12 @@
 
 from docx import Document
 from docx.oxml.ns import qn
-from .section import Sections
+from .section import Sections, DocumentIndex
 from ..rdf.tasks.report_task import ReportTask
+from ..rdf.compiled import reportData
+from ..rdf.prefetch import prefetch as prefetchValues, DEFAULT_WORKERS
+from ..element.image_optimizer import optimizing
+from ..rdf.connections import connectionPool
 from ..tag import Tag
 
 import os
@@ -36,7 +40,7 @@ class ManagedDocx:
         #self.elements = []
 
         # in that simple command all work is done to read and organize the document!
-        self.sections = Sections(self.document.sections)
+        self.sections = Sections(self.document)
         # at least there is always one section
 
         # collect all errors and warnings
@@ -63,6 +67,8 @@ class ManagedDocx:
         else:
             # get usable templates
             self.templates = self.sections.templates
+            # and find everything without walking the document again
+            self.index = DocumentIndex(self.sections)
 
             self.toc = self.findTableOfContents()
          
@@ -76,11 +82,10 @@ class ManagedDocx:
 
         if type(what) == str:
             # this may return many nad is used in global search only!
-            found = self.sections.findGlobal(what)
+            found = self.index.findGlobal(what)
         else:
             # this will return one and is used in each single task
-            root = self.sections.byName(what[0])
-            parent = root.addressbook.get('.'.join(what[:-1]),None)
+            parent = self.index.address(what[:-1])
             if parent:
                 found = parent.findExact(what)
                 #print('F',found)
@@ -152,7 +157,9 @@ class ManagedDocx:
                     cleanup=True,
                     removetemplate=True,
                     cleardust=True,
-                    setproperties=True
+                    setproperties=True,
+                    prefetch=False,
+                    images=None
                     ):
         """the final marriage between document and rdf and content
         
@@ -166,7 +173,18 @@ class ManagedDocx:
         * removetemplate - remove the template section
         * cleardust - remove paragraphs initially marked for deletion
         * setproperties - set document properties
+
+        prefetch - read all files (tables, images...) before, in that many threads (True: DEFAULT_WORKERS)
+        images - an ImageOptimizer to embed the pictures with the size they are placed with
+
+        rdf can be a ReportDataFile, a CompiledReport or the name of a .rdf or .rdfc file
         """
+        rdf = reportData(rdf)
+        if prefetch:
+            workers = DEFAULT_WORKERS if prefetch is True else int(prefetch)
+            print(f'   prefetch files in {workers} threads ...')
+            for filename, error in prefetchValues(rdf.tasks, workers).items():
+                print(f'WARNING: cannot prefetch {filename!r}: {error}')
         print('check consistency')
 
         if not addcopy:
@@ -181,7 +199,7 @@ class ManagedDocx:
                     #print('\nto %s  *******************\n'%t.what, 
                     #      f'{t.path} - {t.myAddress} - {t.where}')
 
-                    root = self.sections.byName(t.myAddress[0])
+                    root = self.index.byName(t.myAddress[0])
 
                     if not root:
                         print(f'ERROR: cannot find section: {t.myAddress[0]}')
@@ -193,12 +211,12 @@ class ManagedDocx:
                         # will just fill the already existing content later
                         # but we will remove any subAnchor from parent if it exists
                         # this happens always befor we do 'copy' a new section below!
-                        parent = root.addressbook.get('.'.join(t.myAddress[:-1]),None)
+                        parent = self.index.address(t.myAddress[:-1])
                         if not parent:
                             print('\naddress is', t.myAddress)
                             print('t is',t)
                             print('parent is',parent)
-                            print('addressbook\n', root.addressbook)
+                            print('addresses\n', self.index.addresses)
                         
                         #print('remove one anchor from', parent)
                         struct = parent.findExact(t.myAddress)
@@ -209,7 +227,7 @@ class ManagedDocx:
 
                     if t.what == 'add':
                         # 'add' is used when we add by '+' new content from templates after an @anchor
-                        parent = root.addressbook.get('.'.join(t.myAddress[:-1]),None)
+                        parent = self.index.address(t.myAddress[:-1])
                         if not parent:
                             print(
                                 f'WARNING: No such parent structure: {(".".join(t.myAddress[:-1]))}'
@@ -223,27 +241,27 @@ class ManagedDocx:
                             continue
                         
                         anchor = where[0][1]
-                        tpl = self.sections.findTemplate(t.target)
+                        tpl = self.index.findTemplate(t.target)
                         #print('   add tpl and anchor 0', t.myAddress, where, anchor, tpl)
                         
                         if tpl:
                             #print('   add tpl and anchor 1', parent)
-                            newElement = tpl.copy(anchor, parent=parent, newpath=t.myAddress[:-1], newname=t.myAddress[-1], section=root)
+                            newElement = tpl.copy(anchor, parent=parent, newpath=t.myAddress[:-1], newname=t.myAddress[-1], index=self.index)
                             
 
                     elif t.what == 'copy':
                         # 'copy' is used in any case we need to duplicate e.g. a section while the existing one is already in place
                         #print('addressbook is:')
-                        #for k,v in root.addressbook.items():
+                        #for k,v in self.index.addresses.items():
                         #    print(' k,v',k,v)
                         #print('looking for',t.myAddress)
-                        parent = root.addressbook.get('.'.join(t.myAddress[:-1]), None)
+                        parent = self.index.address(t.myAddress[:-1])
                         #print('parent is', parent)
                         if not parent or not parent.anchor:
                             print(f'WARNING: No place to copy found: {(".".join(t.myAddress[:-1]))}')
                             continue
                         
-                        tpl = self.sections.findTemplate(t.path)
+                        tpl = self.index.findTemplate(t.path)
 
                         if parent.subAnchors:
                             #print('subAnchors')
@@ -255,28 +273,31 @@ class ManagedDocx:
                             anchor = parent.anchor
 
                         if tpl:
-                            newElements = tpl.copy(anchor, parent=parent, newpath=t.myAddress[:-1], newname=t.myAddress[-1], section=root)
+                            newElements = tpl.copy(anchor, parent=parent, newpath=t.myAddress[:-1], newname=t.myAddress[-1], index=self.index)
 
-        if not directfill:                
-            print('   SKIP: fill the content...')
-        else:
-            print('   fill the content...')
-            for t in rdf.tasks:
-                if t.path[0] == 'global': continue # apply the global tasks at the end
-                #print('\n',t.isCopy, t.path,t.myAddress,t.target,t.value)
-                if t.target:
-                    # apply it on path, means: apply it on exact this item
-                    #print('  apply to', t.myAddress, t.target, 'v',t.value.object, 'v')
-                    self.apply(t.myAddress,t)
-
-        if not globalfill:                
-            print('   SKIP: fill the global content...')
-        else:
-            print('   fill the global content...')
-            # apply the global tasks
-            for t in rdf.tasks:
-                if t.path[0] == 'global' and t.target:
-                    self.apply(t.target,t)
+        # pictures are embedded when all is filled, optimized if images is given;
+        # the tables of a database share one connection until all is filled
+        with optimizing(images), connectionPool:
+            if not directfill:                
+                print('   SKIP: fill the content...')
+            else:
+                print('   fill the content...')
+                for t in rdf.tasks:
+                    if t.path[0] == 'global': continue # apply the global tasks at the end
+                    #print('\n',t.isCopy, t.path,t.myAddress,t.target,t.value)
+                    if t.target:
+                        # apply it on path, means: apply it on exact this item
+                        #print('  apply to', t.myAddress, t.target, 'v',t.value.object, 'v')
+                        self.apply(t.myAddress,t)
+
+            if not globalfill:                
+                print('   SKIP: fill the global content...')
+            else:
+                print('   fill the global content...')
+                # apply the global tasks
+                for t in rdf.tasks:
+                    if t.path[0] == 'global' and t.target:
+                        self.apply(t.target,t)
 
         if not cleanup:                
             print('   SKIP: clean up...')
@@ -284,14 +305,19 @@ class ManagedDocx:
             print('   clean up...')
             # finally remove all tags which are not yet "burned"
             for sec in self.sections:
+                # all tags of one element are removed in one go
+                pending = {}
                 for t,e in sec:
                     #print('clean1', sec, t)
                     if t in ['text','image','table','struct']:
                         e.clean()
                         continue
                     if not t or t.burned: continue
-                    e.replaceTagInAll(t.puretag,'')
-                    t.burn()
+                    pending.setdefault(id(e), (e, []))[1].append(t)
+                for e, tags in pending.values():
+                    e.replaceTagsInAll({ t.puretag: '' for t in tags })
+                    for t in tags:
+                        t.burn()
 
             # for t,e in self.sections.copies:
             #     if not t or e.anchor or t.burned: continue
@@ -303,7 +329,7 @@ class ManagedDocx:
             print('   SKIP: remove template section...')
         else:
             print('   remove template section...')
-            self.sections.delete('template')
+            self.index.delete('section:template')
 
         if not cleardust:                
             print('   SKIP: clearing all the dust...')
@@ -1,6 +1,7 @@
 """Section(s) package."""
 
 from .sections import Sections
+from .index import DocumentIndex
 
-__all__ = ["Sections"]
+__all__ = ["Sections", "DocumentIndex"]
 
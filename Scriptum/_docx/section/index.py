@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# part of:
+#   S C R I P T U M
+#
+
+###################
+# MODULE _docx.section.index
+# PROVIDES
+#   class DocumentIndex - where to find sections, structures, templates and tags of a document,
+#                         built once and kept up to date by copy() and delete()
+
+from ...tag.tag import Tag
+from ..structure import StructuredElement
+
+
+def _elements(structure):
+    """ids of all elements and structures inside a structure"""
+    for t, e in structure.structure:
+        yield id(e)
+        if isinstance(e, StructuredElement):
+            yield from _elements(e)
+
+
+class DocumentIndex:
+    """all lookups of ManagedDocx in dictionaries instead of walking the document
+
+    * sections: name -> section (the first one with that name)
+    * addresses: 'section:a.subsection:b' -> structure
+    * templates: path -> template
+    * tags: puretag -> occurrences as found by a global search
+    """
+    def __init__(self, sections):
+        self.sections = {}
+        self.addresses = {}
+        self.templates = {}
+        self.tags = {}
+
+        for sec in sections:
+            self.sections.setdefault(sec.name, sec)
+            if sec.name != 'template': # never change anything in the template by a global search
+                self._addTags(sec.structure)
+        # the first section of a name wins, as in byName
+        for sec in reversed(list(sections)):
+            self._addAddresses(sec)
+        for t, e in reversed(sections.templates):
+            self.templates[tuple(e.path)] = e
+
+    #
+    # build and update
+    #
+    def _addAddresses(self, structure):
+        self.addresses['.'.join(structure.path)] = structure
+        for e in structure.iterOnStructures():
+            self.addresses['.'.join(e.path)] = e
+
+    def _addTags(self, entries):
+        """the occurrences as (tag, element, table) where table is the table holding the tag if any"""
+        for t, e in entries:
+            if not t or t == 'text':
+                continue # for now we ignore textblock inner tags
+            elif t == 'struct':
+                self._addTags(e.structure)
+            elif t == 'table':
+                for st, se in e.structure:
+                    if type(st) == Tag:
+                        self.tags.setdefault(st.puretag, []).append((st, se, e))
+            elif t == 'image':
+                self.tags.setdefault(e.path[-1], []).append((t, e, None))
+            else:
+                self.tags.setdefault(t.puretag, []).append((t, e, None))
+
+    def _searched(self, structure) -> bool:
+        """is the content of that structure part of a global search"""
+        while structure:
+            if structure.HEADER != StructuredElement.HEADER or (structure.name == 'template' and not structure.parent):
+                return False
+            structure = structure.parent
+        return True
+
+    def append(self, parent, entry):
+        """add a new (tag, element) to the structure of parent, e.g. a copy of a template"""
+        parent.structure.append(entry)
+        t, e = entry
+        if isinstance(e, StructuredElement):
+            self._addAddresses(e)
+        if self._searched(parent):
+            self._addTags([entry])
+
+    def delete(self, address: str):
+        """delete a structure (or a section by its name) from the document and from the index"""
+        structure = self.addresses.get(address) or self.byName(address)
+        if structure is None:
+            print(f'WARNING: Nothing to delete: {address}')
+            return
+        structure.delete()
+
+        path = '.'.join(structure.path)
+        for a in [ a for a in self.addresses if a == path or a.startswith(path+'.') ]:
+            del self.addresses[a]
+        for p in [ p for p in self.templates if p[:len(structure.path)] == tuple(structure.path) ]:
+            del self.templates[p]
+        if self.sections.get(structure.name) is structure:
+            del self.sections[structure.name]
+
+        removed = set(_elements(structure))
+        for puretag, occurrences in self.tags.items():
+            self.tags[puretag] = [ o for o in occurrences if id(o[1]) not in removed and id(o[2]) not in removed ]
+
+    #
+    # lookups
+    #
+    def byName(self, name):
+        """find a section by name"""
+        return self.sections.get(name.replace('section:',''))
+
+    def address(self, path):
+        """find a structure by its path (list) or address (string)"""
+        if type(path) != str:
+            path = '.'.join(path)
+        return self.addresses.get(path)
+
+    def findTemplate(self, name):
+        """find one template by path or string <- name"""
+        if type(name) == str:
+            # we expect this template inside the section:template
+            name = ['section:template', name]
+        if (template := self.templates.get(tuple(name))) is None:
+            print(f'WARNING: No such template in document: {name}')
+        return template
+
+    def findGlobal(self, what: str) -> list:
+        """find a tag in all sections but the template"""
+        found = []
+        for t, e, table in self.tags.get(what, ()):
+            if table is not None:
+                if table.anchor or t.burned: continue
+            elif e.anchor: continue # never change anchors
+            found += [(t, e)]
+        return found
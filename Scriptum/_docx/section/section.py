@@ -15,7 +15,7 @@ from itertools import chain
 #from ..template import copy_paragraph_before, copy_table_before
 
 class Section(StructuredElement):
-    def __init__(self,section):
+    def __init__(self, section, blocks=None):
         """take a section object from python-pptx
         iterate and check it
         
@@ -29,54 +29,57 @@ class Section(StructuredElement):
 
         Maybe future option: ignore empty paragraphs from the last filled...
         But that allows for some misaligned documents ... probably...
+
+        blocks are the paragraphs and tables of the section if already known (see Sections),
+        otherwise they are taken from the section
         """
 
         self.section = section # native section...
         # start empty init later
         self.parent = '' # sections don't have a parent other than the document itself
         self.name = ''
+        self.tag = None
         self.markedForDeletion = []
         self.structure = [] # will be reinitialized later
 
         _error = []
         _warning = []
 
+        # every paragraph and table is read once, with all its tags
+        if blocks is None:
+            blocks = section.iter_inner_content()
+        elements = [ self._element(elem, _warning) for elem in blocks ]
+
         # FIRST OF ALL
-        # find the very first paragraph and the last and check if that is a valid section
+        # check the very first paragraph and the last if that is a valid section
         # set its main tag and name
         # <section:foo>
         # </section:foo> -> anchor
-        iterator = section.iter_inner_content()
-        first = last = next(iterator, None)
-        if not first:
+        if not elements:
             _error += ['Empty section found - check your document']
         else:
+            first, last = elements[0], elements[-1]
             # first one has to start as a paragraph!
-            if type(first) != Paragraph:
+            if type(first) != DocParagraphElement:
                 _error += ['Section is not starting with a Paragraph - check your document']
             else:
-                obj = DocParagraphElement(first)
-                if not obj.tags or obj.tags[0].ns != "section":
+                if not first.tags or first.tags[0].ns != "section":
                     _error += ["Section doesn't start with a 'section'-tag - check your document",
                                    'Paragraph is:',
-                                   f'  {obj.thing.text!r}',
+                                   f'  {first.thing.text!r}',
                                    '  if empty: search for empty paragraphs between section tags']
                 else:
-                    self.tag = obj.tags[0]
+                    self.tag = first.tags[0]
                     self.name = self.tag.name
                     # now we don't need that tag anymore
-                    self.markForDeletion(obj)
+                    self.markForDeletion(first)
                     #obj.delete()
 
-                # go to the last
-                for last in iterator:
-                    pass
-                
-                obj = DocParagraphElement(last)
-                if not obj.tags or obj.tags[-1].ns != "section":
+                # and the last
+                if type(last) != DocParagraphElement or not last.tags or last.tags[-1].ns != "section":
                     _error += ["Section doesn't end with a 'section'-tag - check your document"]
                 else:
-                    if self.tag and self.tag.name != obj.tags[-1].name:
+                    if self.tag and self.tag.name != last.tags[-1].name:
                         _error += [
                             f"Section {self.tag.name!r} doesn't end with the same name - check your document"
                         ]
@@ -90,7 +93,7 @@ class Section(StructuredElement):
             self.warning = _warning
             return
         
-        # NEXT STEP, rewind and
+        # NEXT STEP,
         # unfold it all -> make a long list of elements
         # for each tag get its element/paragraph or table it is connected to
         # keep elements without any tag in the order they do belong to
@@ -99,27 +102,18 @@ class Section(StructuredElement):
 
         # for a section we take the footers/headers as well and inject them into the section elements
 
-        _elements = [ elem for elem in section.iter_inner_content() ]
-        _lastelement = _elements[-1]
         if self.name != 'template': # ignore footer/header in template section
-            _elements = _elements[:-1]+[ elem for elem in chain(
+            elements = elements[:-1]+[ self._element(elem, _warning) for elem in chain(
                             section.header.iter_inner_content(),
                             section.footer.iter_inner_content()) 
-                            ] + [_lastelement]
+                            ] + elements[-1:]
         
         unfolded = []
-        for elem in _elements:
-            if type(elem) == Paragraph:
-                obj = DocParagraphElement(elem)
-                anchor = obj # keep last
-            elif type(elem) == Table:
-                obj = DocTableElement(elem)
-            else:
-                # note: image elements are part of a paragraph (even in table)
-                # floating images are yet not supported (not implemented in python-docx v1.2)
-                # thus, this error message will point to something unknown!
-                _warning += [f"Unknown element type found {type(elem)!r}. Ignored!"]
+        for obj in elements:
+            if obj is None:
                 continue
+            if type(obj) == DocParagraphElement:
+                anchor = obj # keep last
             if not obj.tags:
                 # simple and untagged element
                 unfolded += [(None,obj)]
@@ -147,11 +141,8 @@ class Section(StructuredElement):
         self.warning = _warning + self.warning
 
         # extract the whole structure
+        # (all structures are found fast by the DocumentIndex of the document)
         self.explore()
-
-        # extract all strcutures such taht we are able to find them fast
-        self.addressbook = {}
-        self.buildAddressbook()
         
     def delete(self):
         """remove the whole section
@@ -232,20 +223,19 @@ class Section(StructuredElement):
         except:
             pass
 
+    @staticmethod
+    def _element(elem, warning):
+        """the element for a paragraph or table"""
+        if type(elem) == Paragraph:
+            return DocParagraphElement(elem)
+        elif type(elem) == Table:
+            return DocTableElement(elem)
+        # note: image elements are part of a paragraph (even in table)
+        # floating images are yet not supported (not implemented in python-docx v1.2)
+        # thus, this error message will point to something unknown!
+        warning += [f"Unknown element type found {type(elem)!r}. Ignored!"]
+
     def markForDeletion(self,elem):
         # overwrite the base class
         self.markedForDeletion += [elem]
-    
-    def buildAddressbook(self):
-        """in order to store all structures in an addressable way, we setup a dictionary
-        since the have to be unique..."""
-
-        # the full organization of all structures:
-        # base entry is this section
-        # self.name = tag.name + self.type = tag.ns
-        
-        self.addressbook = {'.'.join(self.path): self}
-
-        for e in self.iterOnStructures():
-            self.addressbook['.'.join(e.path)] = e
 
@@ -5,15 +5,43 @@
 #   S C R I P T U M 
 #
 
+from docx.oxml.table import CT_Tbl
+from docx.oxml.text.paragraph import CT_P
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
 from .section import Section
 
+def partition(document):
+    """all sections of the document with their paragraphs and tables, in one pass over the body
+
+    python-docx searches the body from its start for each section (section.iter_inner_content),
+    here a section ends with the paragraph holding its w:sectPr, the last one at the end of the body
+    """
+    parts = []
+    blocks = []
+    for elem in document.element.body.iterchildren():
+        if isinstance(elem, CT_P):
+            blocks.append(elem)
+            if elem.pPr is not None and elem.pPr.sectPr is not None:
+                parts.append(blocks)
+                blocks = []
+        elif isinstance(elem, CT_Tbl):
+            blocks.append(elem)
+    parts.append(blocks)
+
+    for section, blocks in zip(document.sections, parts):
+        yield section, [ Paragraph(b, section) if isinstance(b, CT_P) else Table(b, section) for b in blocks ]
+
 class Sections:
     """contains only sections as structured elements"""
-    def __init__(self, sections):
+    def __init__(self, document):
         """will create the root elements of all and parse them
-        sections are always the container everything is in"""
+        sections are always the container everything is in
+        
+        document is a python-docx Document"""
         
-        self._sections = [ Section(s) for s in sections ]
+        self._sections = [ Section(s, blocks) for s, blocks in partition(document) ]
         self._fillTemplates()
 
     def __iter__(self):
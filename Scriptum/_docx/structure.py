@@ -346,11 +346,13 @@ class StructuredElement:
                 self.deepcopy += [deepcopy(elem.thing._p)]
         return self.deepcopy
 
-    def copy(self, anchor, parent, newpath=[], newname='', section=None):
+    def copy(self, anchor, parent, newpath=[], newname='', index=None):
         """redfined in the subclasses, however here used to copy the structure allowever
 
         copy all elements just before the anchor,
-        in case of self.type == 'struct', rename the first and last element if newname is set"""
+        in case of self.type == 'struct', rename the first and last element if newname is set
+        
+        the copy is added to the parent and to the index (DocumentIndex) of the document"""
         
         from .paragraphs import DocParagraphElement
         from .tables import DocTableElement
@@ -415,16 +417,10 @@ class StructuredElement:
         parent.subAnchors = _subs
         mycopy.explore()
         #print('mycopy', mycopy.path, 'into', parent.path, 'at', anchor.path)
-        # add this one into the parents structure
-        parent.structure.append(('struct',mycopy))
-        #print(parent.path)
-        #print(parent.structure)
-        # and to the addressbook:
+        # add this one into the parents structure and to the index:
         # in this case we may have a series of new entries structures of structures with images and tables
-        section.buildAddressbook()
+        index.append(parent, ('struct',mycopy))
         #print('MMMM',mycopy.path)
-        #print(section.addressbook.keys())
-        #section.addressbook['.'.join(mycopy.path)] = mycopy
         return mycopy
 
     def clean(self):
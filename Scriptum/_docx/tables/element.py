@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Tuple, Union
 
 from docx.oxml.table import CT_Tbl
 
@@ -28,9 +28,16 @@ class DocTableElement(DocElement, TableElement):
         self.path = []
         self.anchor = False
 
+        # every paragraph of the table is read once,
+        # its tags are found by puretag -> [(cell, paragraph element), ...]
         tags = []
+        self.cells = {}
+        seen = set()
         for row in elem.rows:
             for cell in row.cells:
+                if cell._tc in seen:
+                    continue # merged cells are given once for every grid column
+                seen.add(cell._tc)
                 for p in cell.paragraphs:
                     obj = DocParagraphElement(p)
                     found = []
@@ -46,22 +53,29 @@ class DocTableElement(DocElement, TableElement):
                             tag.burn()
                         else:
                             found += [tag]
+                        where = self.cells.setdefault(tag.puretag, [])
+                        if not where or where[-1][1] is not obj:
+                            where.append((cell, obj))
                     tags += found
         self.tags = tags
 
+    def hastag(self, tag: str) -> Union[bool,Tag]:
+        """check if tag-string is in one of the tags of this table"""
+        for cell, obj in self.cells.get(tag, ()):
+            return obj.hastag(tag)
+        return False
+
     #
     # replace tags
     #
     def replaceTag(self, tag: Tag, replace: str) -> Optional[Any]:
-        table = self.thing
-        for row in table.rows:
-            for cell in row.cells:
-                for paragraph in cell.paragraphs:
-                    obj = DocParagraphElement(paragraph)
-                    #print('RT',paragraph.text,tag, obj)
-                    run = obj.replaceTag(tag,replace)
-                    if run is not None:
-                        return run
+        for cell, obj in self.cells.get(tag.puretag, ()):
+            if obj.thing._p.getparent() is not cell._tc:
+                continue # the cell got a new content, e.g. by a table value
+            #print('RT',obj.thing.text,tag, obj)
+            run = obj.replaceTag(tag,replace)
+            if run is not None:
+                return run
         return None
 
 def delete_table(table):
@@ -88,7 +102,7 @@ class DocTableBlockElement(StructuredElement):
         super().__init__(tag, path, parent, content, None)
         self.subtype = "structure"
 
-    def copy(self, anchor, parent, newpath=None, newname="", section=None):
+    def copy(self, anchor, parent, newpath=None, newname="", index=None):
         """Copy the table block just before the anchor."""
 
         if newpath is None:
@@ -133,8 +147,7 @@ class DocTableBlockElement(StructuredElement):
             newElements[0].tags[0], newpath, parent, newUnfoldedElements, None
         )
         mycopy.explore()
-        parent.structure.append(("table", mycopy))
-        section.addressbook[".".join(mycopy.path)] = mycopy
+        index.append(parent, ("table", mycopy))
         return mycopy
 
     def fill(self, task) -> None:
@@ -173,5 +186,6 @@ class DocTableBlockElement(StructuredElement):
                 continue
             element.replaceTag(t, "")
             t.burn()
-            element.deleteIfEmpty()
+            if isinstance(element, DocParagraphElement):
+                element.deleteIfEmpty() # a table stays, even without text
 
@@ -106,45 +106,46 @@ def genericFill(
             match[0].fillAnimation(match[1], task)
 
     elif value.type == 'file' and value.subtype == 'text':
-        text = value.load().content
-        for element in iterable:
-            found = element.replaceTagInAll(target,text)
-            if found and onlyOne:
-                break
+        replaceInElements(iterable, {target: value.load().content}, onlyOne)
 
     elif value.type == 'parfile':
         value.load()
-        for element in iterable:
-            found = element.replaceTagInAll(target,value.content)
-            if found and onlyOne:
-                break
+        replaceInElements(iterable, {target: value.content}, onlyOne)
 
     elif value.type == 'float':
-        val = str(value.object)
-        for element in iterable:
-            found = element.replaceTagInAll(target,val)
-            if found and onlyOne:
-                break
+        replaceInElements(iterable, {target: str(value.object)}, onlyOne)
 
     else:
-        val = str(value)
-        #print('TEXT?', val)
-        for element in iterable:
-            found = element.replaceTagInAll(target,val)
-            if found and onlyOne:
-                break
+        #print('TEXT?', str(value))
+        replaceInElements(iterable, {target: str(value)}, onlyOne)
     
     # finally look in the task modifier if there is any
     if task.modified:
-        actions = task.actions 
-        for ktag, action in actions.items():
-            what = action.type
-            val = action.object
-            if what in ['str','datetime','int','float']:
-                val = str(val)
-                if match := findTargetAndTagInElements(ktag, iterable):
-                    # returned an element and a tag
-                    match[0].replaceAndBurnTag(match[1],val)
+        modifiers = { ktag: str(action.object) for ktag, action in task.actions.items()
+                      if action.type in ['str','datetime','int','float'] }
+        # each tag in one element only, see findTargetAndTagInElements
+        found = replaceInElements(iterable, modifiers, onlyOne=True)
+        for ktag in modifiers:
+            if ktag not in found:
+                print(f'WARNING: Target not identified: {ktag}')
+
+def replaceInElements(
+    elements: Sequence[Element],
+    mapping: Dict[str, str],
+    onlyOne: bool = False,
+) -> Dict[str, Any]:
+    """replace the tags {puretag: replace} in the elements, each element in one pass
+    onlyOne - a tag is replaced in the first element holding it only
+
+    return {puretag: found} for the tags found
+    """
+    found = {}
+    for element in elements:
+        todo = { t: r for t, r in mapping.items() if t not in found } if onlyOne else mapping
+        if not todo:
+            break
+        found.update(element.replaceTagsInAll(todo))
+    return found
 
 def findTargetAndTagInElements(
     target: str,
@@ -2,8 +2,8 @@
 
 from typing import TYPE_CHECKING
 
-from .element import PptImageElement, delete_shape, getSizeFrom
+from .element import PptImageElement, delete_shape, getSizeFrom, pictureInserter
 from .template import ImageTemplate, AnimationTemplate
 
-__all__ = ["PptImageElement", "ImageTemplate", "AnimationTemplate", "delete_shape", "getSizeFrom"]
+__all__ = ["PptImageElement", "ImageTemplate", "AnimationTemplate", "delete_shape", "getSizeFrom", "pictureInserter"]
 
@@ -1,8 +1,11 @@
 """Image element helpers for PowerPoint rendering."""
 
-from typing import Any, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Mapping, Optional, Sequence, Tuple
+
+from lxml import etree
 
 #from ...element.element_image import ImageElement
+from ...element.image_optimizer import placePicture
 from ...rdf import ReportTask
 from ...rdf.values import ImageValue
 from ...tag import Tag
@@ -23,11 +26,12 @@ class PptImageElement(PptElement):# , ImageElement):
     def fillImage(self, tag: Tag, task: ReportTask) -> None:
         value = task.value
         if value.type == "file" and value.object.exists:
-            tag.args["shape"] = True
+            tag.setArg("shape", True)
 
             width, height, top, left = getSizeFrom(tag=tag, image=value.object, shape=self, units=units)
             slide = self.thing._parent._parent
-            slide.shapes.add_picture(value.object.filename, top=top, left=left, width=width, height=height)
+            placePicture(value.object.filename, width, height,
+                         pictureInserter(slide, top=top, left=left, width=width, height=height))
             delete_shape(self.thing)
         else:
             self.leaveAMissingNote(tag, str(value.object))
@@ -39,7 +43,7 @@ class PptImageElement(PptElement):# , ImageElement):
         if value.type == "file" and value.object.exists:
             posterimage = actions.get("image:poster") or actions.get("image")
 
-            tag.args["shape"] = True
+            tag.setArg("shape", True)
 
             width, height, top, left = getSizeFrom(tag=tag, image=posterimage.object, shape=self, units=units)
             slide = self.thing._parent._parent
@@ -142,3 +146,22 @@ def delete_shape(shape: Any) -> None:
     if shape_element.getparent() is not None:
         shape_element.getparent().remove(shape_element)
         shape_element._element = None
+
+
+def pictureInserter(slide: Any, top: int, left: int, width: int, height: int) -> Callable[[str], Any]:
+    """insert(filename) adding a picture to the slide, for placePicture
+
+    the place in the shape order is taken now: a picture embedded later (ImageOptimizer)
+    is still below all shapes added after it
+    """
+    spTree = slide.shapes._spTree
+    marker = etree.Comment(" picture ")
+    spTree.insert_element_before(marker, "p:extLst")
+
+    def insert(filename: str) -> Any:
+        picture = slide.shapes.add_picture(filename, top=top, left=left, width=width, height=height)
+        marker.addnext(picture._element) # moves it
+        spTree.remove(marker)
+        return picture
+
+    return insert
@@ -13,6 +13,8 @@ from ..template_utils import (
 
 from ...tag.tag import getReTag, createTag
 from ...element.base import replaceTextInRuns
+from ...element.image_optimizer import placePicture
+from .element import pictureInserter
 
 debug = False
 
@@ -111,12 +113,9 @@ class ImageTemplate:
                         value.object, element_width, element_height
                         )
                     #print('N', img_width, img_height)
-                    slide.shapes.add_picture(
-                        value.object.filename,
-                        top=element_top,
-                        left=element_left,
-                        width=img_width,
-                        height=img_height,
+                    placePicture(
+                        value.object.filename, img_width, img_height,
+                        pictureInserter(slide, top=element_top, left=element_left, width=img_width, height=img_height),
                         )
                 else:
                     # a pure warning on top?
@@ -143,7 +142,7 @@ class ImageTemplate:
                     else:
                         replacestring = newtag.rawtag
                     replaceTextInRuns(
-                        text_frame.paragraphs[0].runs, shape.text, oldre, replacestring
+                        text_frame.paragraphs[0].runs, oldre, replacestring
                     )
                     copiedtags[0] = newtag
 
@@ -266,7 +265,7 @@ class AnimationTemplate(ImageTemplate):
                     else:
                         replacestring = newtag.rawtag
                     replaceTextInRuns(
-                        text_frame.paragraphs[0].runs, shape.text, oldre, replacestring
+                        text_frame.paragraphs[0].runs, oldre, replacestring
                     )
                     copiedtags[0] = newtag
 
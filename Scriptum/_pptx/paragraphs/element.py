@@ -34,6 +34,26 @@ class PptTextElement(PptElement):
                 return True
         return False
 
+    def replaceTagsInAll(self, mapping):
+        """replace several tags {puretag: replace}, each paragraph in one pass, and burn them if found"""
+        if self.isplaceholder:
+            return super().replaceTagsInAll(mapping)
+
+        tags = {}
+        for tagname in mapping:
+            if (tag := self.hastag(tagname)) != False and not tag.burned:
+                tags[tagname] = tag
+        found = {}
+        for paragraph in self.paragraphs:
+            # as replaceTag: a tag is replaced in the first paragraph holding it
+            todo = { tagname: mapping[tagname] for tagname in tags if tagname not in found }
+            if not todo:
+                break
+            found.update(paragraph.replaceTags(todo))
+        for tagname in found:
+            tags[tagname].burn()
+        return found
+
 
 class PptParagraphElement(ParagraphElement):
     """Paragraphs inside a text element."""
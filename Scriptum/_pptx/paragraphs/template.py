@@ -100,7 +100,7 @@ class TextTemplate:
                 content = str(value.object.content)
                 if jumpingfox in element.thing.text_frame.text:
                     # this happens only in the first paragraph
-                    replaceTextInRuns(text_frame.paragraphs[0].runs, shape.text, foxre,'')
+                    replaceTextInRuns(text_frame.paragraphs[0].runs, foxre,'')
                 #print('3', shape.text)
                 
 
@@ -109,7 +109,7 @@ class TextTemplate:
 
             #print('4', shape.text, content)
             replaceTextInRuns(
-                text_frame.paragraphs[0].runs, shape.text, oldre, content
+                text_frame.paragraphs[0].runs, oldre, content
                 )
             #print('5', shape.text)
             attrs.setFontAttrs(text_frame)
@@ -35,6 +35,10 @@ from .slide import Slide
 from .. import version
 
 from ..rdf.tasks.report_task import ReportTask
+from ..rdf.compiled import reportData
+from ..rdf.prefetch import prefetch as prefetchValues, DEFAULT_WORKERS
+from ..element.image_optimizer import optimizing
+from ..rdf.connections import connectionPool
 
 # and what not
 #_NOT_ALLOWED = '\\,:;~+*#&%$' # by default OPENING and CLOSING will be added to this list, never tested for unicode characters
@@ -365,28 +369,45 @@ class ManagedPptx:
                directfill=True,
                globalfill=True,
                cleardust=True,
-               setproperties=True):
-        """the final marriage between document and rdf"""
+               setproperties=True,
+               prefetch=False,
+               images=None):
+        """the final marriage between document and rdf
+
+        prefetch - read all files (tables, images...) before, in that many threads (True: DEFAULT_WORKERS)
+        images - an ImageOptimizer to embed the pictures with the size they are placed with
+
+        rdf can be a ReportDataFile, a CompiledReport or the name of a .rdf or .rdfc file
+        """
+        rdf = reportData(rdf)
         print('painting the shapes:')
-        if not directfill:                
-            print('   SKIP: fill the canvas...')
-        else:
-            print('   fill the canvas...')
-            for task in rdf.tasks:
-                # print(task, task.value, task.value.type)
-                self.applyTask(task)
+        if prefetch:
+            workers = DEFAULT_WORKERS if prefetch is True else int(prefetch)
+            print(f'   prefetch files in {workers} threads ...')
+            for filename, error in prefetchValues(rdf.tasks, workers).items():
+                print(f'WARNING: cannot prefetch {filename!r}: {error}')
+        # pictures are embedded when all is filled, optimized if images is given;
+        # the tables of a database share one connection until all is filled
+        with optimizing(images), connectionPool:
+            if not directfill:                
+                print('   SKIP: fill the canvas...')
+            else:
+                print('   fill the canvas...')
+                for task in rdf.tasks:
+                    # print(task, task.value, task.value.type)
+                    self.applyTask(task)
         
-        if not globalfill:                
-            print('   SKIP: fill the global canvas...')
-        else:
-            print('   fill the global canvas...')
-            if self.collectglobal:
-                #print(self.collectglobal)
-                # do now the global tasks
-                for where, task in self.collectglobal:
-                    elems = self.findElements(inall=where)
-                    if elems:
-                        genericFill(elems, task)
+            if not globalfill:                
+                print('   SKIP: fill the global canvas...')
+            else:
+                print('   fill the global canvas...')
+                if self.collectglobal:
+                    #print(self.collectglobal)
+                    # do now the global tasks
+                    for where, task in self.collectglobal:
+                        elems = self.findElements(inall=where)
+                        if elems:
+                            genericFill(elems, task)
         
         if not cleardust:                
             print('   SKIP: clearing all the dust...')
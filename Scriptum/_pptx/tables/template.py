@@ -106,7 +106,7 @@ class TableTemplate:
                         replacestring = newtag.rawtag
                     #print('NNN',newtag.printable)
                     replaceTextInRuns(
-                        text_frame.paragraphs[0].runs, shape.text, oldre, replacestring
+                        text_frame.paragraphs[0].runs, oldre, replacestring
                     )
                     copiedtags[0] = newtag
 
@@ -5,10 +5,12 @@ from .element_paragraph import ParagraphElement
 from .element_table import TableElement
 from .element_image import ImageElement
 from .base import Element
+from .image_optimizer import ImageOptimizer
 
 __all__ = [
     'Element',
     'ParagraphElement',
     'TableElement',
     'ImageElement',
+    'ImageOptimizer',
     ]
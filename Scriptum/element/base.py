@@ -5,8 +5,10 @@
 #   S C R I P T U M
 #
 
+from bisect import bisect_right
+from itertools import accumulate
 from re import Pattern
-from typing import Any, Callable, Mapping, MutableSequence, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Iterable, Mapping, MutableSequence, Optional, Sequence, Tuple, Union
 
 from ..tag import Tag
 
@@ -47,78 +49,97 @@ class Element(object):
             found = False
         return found
 
-def replaceTextInRuns(
-    runs: MutableSequence[Any],
-    text: str,
-    regex: Pattern[str],
-    replace: str,
-    ) -> Optional[Any]:
-    """there is one issue with that routine:
-    
-    it looks that non-printable characters like newlines, at least in PPT, will fail this routine
+    def replaceTagsInAll(self, mapping: Mapping[str, str]) -> Dict[str, Any]:
+        """replace several tags {puretag: replace} and burn them if found,
+        return {puretag: found} for the tags found"""
+        result = {}
+        for tagname, replace in mapping.items():
+            if found := self.replaceTagInAll(tagname, replace):
+                result[tagname] = found
+        return result
 
-    in that case the loop after print(SE...) will not start due to wrong indices?
-    @TODO: further inevstigate
+class RunTable(object):
+    """the runs of a paragraph together with the offset of every run in the full text
+
+    the full text is the text of the runs only, thus positions found in it always fit to the runs
+    (paragraph.text may contain more, e.g. line breaks in pptx or hyperlinks in docx)
     """
-    
-    # now it is quite tricky to replace and search in the same loop
-    runraster: list[int] = []
-    s = 0
-    # we may have several independent runs, which tells us the start indices in the full string
-    for l in [ len(r.text) for r in runs ]:
-        runraster += [s]
-        s += l
-    runraster += [s]
-    
-    # find inside full text the regex "tagre"
-    # foundraster is a list of tuples telling the indices of matches start and end
-    # old: foundraster = [ (f.start(),f.start()+len(f.group())) for f in tagre.finditer(text) ]
-    foundraster = [ (f.start(),f.end()) for f in regex.finditer(text) ]
-    #print('>>>',text,runraster, foundraster)
-    
-    # now we run the foundraster reversed since we replace which changes the indices of the matches at the right
-    startrun: Optional[Any] = None
-    for s,e in reversed(foundraster):
-        #print('loop',s,e,text[s:e])
-        eir = -1
-        for ir,rr in enumerate(runraster):
-            #print(s,e,rr,ir)
-            if s>=rr: 
-                sir = ir
-            if e <= rr and eir == -1:
-                eir = ir
-        injected = False
-        #print('SE', sir, eir)
-        for ir in range(sir,eir):
-            r = runs[ir]
-            #print('work on run',ir,r.text,runraster[ir],s,runraster[ir+1],e)
-            if runraster[ir] >= s and runraster[ir]+len(r.text) <= e:
-                # fully clean some runs
-                #print('case 1')
-                r.text = ''
-                startrun = r
-            elif runraster[ir] <= s and runraster[ir+1] >= e:
+    def __init__(self, runs: Sequence[Any]):
+        self.runs = list(runs)
+        self.texts = [ r.text for r in self.runs ]
+        self.lent: set[int] = set() # runs given away, their text may be changed outside
+        self._update()
+
+    def _update(self) -> None:
+        self.offsets = [0, *accumulate(map(len, self.texts))]
+        self.text = ''.join(self.texts)
+
+    def refresh(self) -> "RunTable":
+        """read the runs given away once again"""
+        changed = False
+        for ir in self.lent:
+            text = self.runs[ir].text
+            if text != self.texts[ir]:
+                self.texts[ir] = text
+                changed = True
+        if changed:
+            self._update()
+        return self
+
+    def fits(self, runs: Sequence[Any]) -> bool:
+        """are the runs still the ones of the table, with the same text"""
+        return len(runs) == len(self.runs) and all(r.text == t for r, t in zip(runs, self.texts))
+
+    def run(self, pos: int) -> int:
+        """index of the run holding the character at pos, empty runs are skipped"""
+        return bisect_right(self.offsets, pos, hi=len(self.runs)) - 1
+
+    def replace(self, spans: Iterable[Tuple[int, int, str]]) -> list[Any]:
+        """replace text[start:end] by replace for every (start, end, replace)
+
+        spans are sorted and do not overlap;
+        the replace is added to the run where the span starts, all runs stay as they are,
+        returns one run for every span
+        """
+        spans = list(spans)
+        texts, offsets = self.texts, self.offsets
+        started = []
+        # reversed: a replace changes the positions on the right only
+        for s, e, replace in reversed(spans):
+            sir = self.run(s)
+            eir = self.run(e-1) if e > s else sir
+            if sir == eir:
                 # fully inside
-                #print('case 2')
-                startrun = r
-                r.text = r.text[:s-runraster[ir]]+replace+r.text[e-runraster[ir]:]
-                injected = True
-            elif runraster[ir] <= s and runraster[ir+1] > s:
-                # middle of one run it starts
-                #print('case 3', r.text, s-runraster[ir], r.text[:s-runraster[ir]])
-                startrun = r
-                r.text = r.text[:s-runraster[ir]]
-            elif runraster[ir] <= e and runraster[ir+1] > e:
-                # middle of one run it ends
-                #print('case 4', r.text, e-runraster[ir], r.text[e-runraster[ir]:])
-                r.text = r.text[e-runraster[ir]:]
+                t = texts[sir]
+                texts[sir] = t[:s-offsets[sir]]+replace+t[e-offsets[sir]:]
             else:
-                print('ERROR: uncaught situation, results might be unexpected')
-                
-            if not injected:
-                r.text += replace
-                injected = True
-        #print()        
-    #print('rt end   ',paragraph.text)
-    return startrun
+                # starts in one run, ends in another one, all between are cleared
+                texts[sir] = texts[sir][:s-offsets[sir]]+replace
+                for ir in range(sir+1, eir):
+                    texts[ir] = ''
+                texts[eir] = texts[eir][e-offsets[eir]:]
+            # given back is the last run the tag covered completely (if any),
+            # its text may be replaced without touching the text around the tag
+            lent = sir
+            for ir in range(sir, eir+1):
+                if self.runs[ir].text != texts[ir]:
+                    self.runs[ir].text = texts[ir]
+                if offsets[ir] >= s and offsets[ir+1] <= e:
+                    lent = ir
+            started.append(lent)
+        if spans:
+            self._update()
+        self.lent.update(started)
+        return [ self.runs[ir] for ir in reversed(started) ]
 
+def replaceTextInRuns(
+    runs: Sequence[Any],
+    regex: Pattern[str],
+    replace: str,
+    ) -> Optional[Any]:
+    """replace all matches of regex in the text of the runs,
+    return the run of the first replace
+    """
+    table = RunTable(runs)
+    started = table.replace((m.start(), m.end(), replace) for m in regex.finditer(table.text))
+    return started[0] if started else None
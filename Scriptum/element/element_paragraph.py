@@ -5,11 +5,11 @@
 #   S C R I P T U M
 #
 
-from typing import Any, Optional
+from typing import Any, Dict, Mapping, Optional
 
-from ..tag.tag import Tag, getReTag
+from ..tag.tag import Tag, getReTag, findTags
 from ..rdf.tasks.report_task import ReportTask
-from .base import Element, replaceTextInRuns
+from .base import Element, RunTable
 
 VISIBLE_CHARS = 20
 
@@ -18,6 +18,7 @@ class ParagraphElement(Element):
     def __init__(self):
         """feed it with one element"""
         super().__init__()
+        self._runtable = None
 
     def __repr__(self) -> str:
         extra = f"--> {self.thing.text.encode('utf8')[:VISIBLE_CHARS]}..."
@@ -32,6 +33,14 @@ class ParagraphElement(Element):
     #
     # replace tags
     #
+    def runTable(self) -> RunTable:
+        """the runs and their offsets, built once and kept up to date by the replacements,
+        built again if the runs were changed elsewhere"""
+        runs = self.thing.runs
+        if self._runtable is None or not self._runtable.refresh().fits(runs):
+            self._runtable = RunTable(runs)
+        return self._runtable
+
     def replaceTag(self, tag: Tag, replace: str) -> Optional[Any]:# Optional[thing], but what is thing?
         """replace <tag>, </tag>, <tag/> 
         in a paragraph object with multiple runs, every run stays as it is.
@@ -49,13 +58,36 @@ class ParagraphElement(Element):
         # in a placeholder it is quite simple - it is always "empty"
         if hasattr(self.thing, 'is_placeholder') and self.thing.is_placeholder:
             self.thing.text = replace
+            self._runtable = None
             tag.burned = True
             return None
         
-        # full text
-        text = self.thing.text
-        #ltext = len(text)
+        table = self.runTable()
         tagre = getReTag(tag)
+        started = table.replace((m.start(), m.end(), replace) for m in tagre.finditer(table.text))
+        return started[0] if started else None
+
+    def replaceTags(self, mapping: Mapping[str, str]) -> Dict[str, Any]:
+        """replace all tags <tag>, </tag>, <tag/> given as {puretag: replace} in one pass,
+        as replaceTag does for one tag
 
-        return replaceTextInRuns(self.thing.runs, text, tagre, replace)
+        return {puretag: run} with the run where the first replace of each tag started
+        """
+        table = self.runTable()
+        found = [ (s, e, puretag) for s, e, puretag in findTags(table.text) if puretag in mapping ]
+        runs = table.replace((s, e, mapping[puretag]) for s, e, puretag in found)
+        started = {}
+        for (s, e, puretag), run in zip(found, runs):
+            started.setdefault(puretag, run)
+        return started
 
+    def replaceTagsInAll(self, mapping: Mapping[str, str]) -> Dict[str, Any]:
+        """replace several tags {puretag: replace} in one pass and burn them if found"""
+        tags = {}
+        for tagname in mapping:
+            if (tag := self.hastag(tagname)) != False and not tag.burned:
+                tags[tagname] = tag
+        found = self.replaceTags({ tagname: mapping[tagname] for tagname in tags })
+        for tagname in found:
+            tags[tagname].burn()
+        return found
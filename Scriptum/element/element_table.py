@@ -62,20 +62,18 @@ class TableElement(Element):
 
         table = self.thing.table
         if tableValueObject.exists: # file exists
-            data = tableValueObject.content.data
-            cols = tableValueObject.content.cols
-            rows = tableValueObject.content.rows
-            #print('work in existing table', cols, rows, data)
-            self.resizeTable(cols,rows)
-            for i,row in enumerate(table.rows):
-                #print(i,row)
-                for j,cell in enumerate(row.cells):
-                    #print(j,cell)
-                    try: # in case table is bigger than data
-                        cell.text = str(data[i][j]) 
-                    except Exception as e:
-                        #print('EXCEPTION',e)
-                        pass
+            content = tableValueObject.content
+            #print('work in existing table', content.cols, content.rows)
+            self.resizeTable(content.cols, 0)
+            # rows are added while the data comes, thus a query is not counted before;
+            # rows of a table bigger than the data stay as they are
+            rows = iter(table.rows)
+            for values in content.iterRows():
+                row = next(rows, None)
+                if row is None:
+                    row = table.add_row()
+                for cell, value in zip(row.cells, values):
+                    cell.text = str(value)
         else:
             # add a message
             table.rows[0].cells[0].text = str(tableValueObject.object)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# coding: utf-8
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Downsample and recompress images before they are embedded.
+
+A 6000x4000 render placed 8 cm wide needs about 470 pixels at 150 dpi, the
+rest only makes the document big and slow. With an ImageOptimizer the fill
+loops do not embed the pictures right away but hand them to placePicture;
+once all content is filled, all pictures are resampled to the placed size
+at the given dpi in a pool of processes and embedded then:
+
+    ManagedPptx('template.pptx').artist(rdf, images=ImageOptimizer(dpi=150))
+
+Results are stored in a cache directory, named by content hash, target size
+and quality, thus the next document with the same pictures is fast. Pictures
+python-docx/-pptx cannot read (e.g. WebP) are transcoded to PNG on the way.
+"""
+
+import contextvars
+import hashlib
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+from PIL import Image
+
+from ..rdf.contentcache import contentCache
+from ..rdf.values.image_value import probeImage
+
+# EMU per inch, the unit of all lengths in docx and pptx
+EMU_PER_INCH = 914400
+# what python-docx and python-pptx can embed
+EMBEDDABLE = {'BMP', 'GIF', 'JPEG', 'PNG', 'TIFF', 'WMF', 'EMF'}
+
+
+def _digest(filename):
+    h = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _resample(job):
+    """the work of one picture, in another process: (source, output, size, quality)"""
+    source, output, size, quality = job
+    with Image.open(source) as image:
+        image.load()
+        if size and size != image.size:
+            image = image.resize(size, Image.LANCZOS)
+        if output.endswith('.jpg'):
+            if image.mode not in ('RGB', 'L', 'CMYK'):
+                image = image.convert('RGB')
+            options = {'quality': quality, 'optimize': True}
+        else:
+            if image.mode not in ('RGB', 'RGBA', 'L', 'LA', 'P', '1', 'I', 'I;16'):
+                image = image.convert('RGBA')
+            options = {'optimize': True}
+        # write aside and rename: a cache entry is always complete
+        partial = f'{output}.{os.getpid()}.part'
+        image.save(partial, format='JPEG' if output.endswith('.jpg') else 'PNG', **options)
+    os.replace(partial, output)
+    return output
+
+
+class ImageOptimizer:
+    """bring pictures to the size they are placed with
+
+    dpi - pixels per inch of the placed picture
+    quality - JPEG quality of the recompressed pictures (PNG stays lossless)
+    cache - directory to keep the results
+    workers - processes for resampling, None for as many as CPUs, 1 to do it here
+    """
+
+    def __init__(self, dpi=150, quality=85, cache='.scriptum_images', workers=None):
+        self.dpi = dpi
+        self.quality = quality
+        self.cache = Path(cache)
+        self.workers = workers
+        # pictures waiting to be embedded, see placePicture
+        self._pending = []
+        # filename -> why it is embedded as it is
+        self.errors = {}
+
+    def __repr__(self) -> str:
+        return f'ImageOptimizer(dpi={self.dpi}, quality={self.quality}, cache={str(self.cache)!r})'
+
+    def targetSize(self, size, width, height):
+        """pixels required for size (pixels) placed as width x height (EMU), None if size is fine"""
+        pw, ph = size
+        if pw <= 0 or ph <= 0 or not width or not height:
+            return None
+        scale = min(width / EMU_PER_INCH * self.dpi / pw, height / EMU_PER_INCH * self.dpi / ph)
+        if scale >= 1:
+            return None
+        return max(1, math.ceil(pw * scale)), max(1, math.ceil(ph * scale))
+
+    def job(self, filename, width, height):
+        """(source, output, size, quality) to get filename in shape, None if it is fine as it is"""
+        metadata = contentCache.get('image', filename, (), lambda: probeImage(filename))
+        size = self.targetSize(metadata.size, width, height)
+        if size is None and metadata.format in EMBEDDABLE:
+            return None
+        digest = contentCache.get('sha1', filename, (), lambda: _digest(filename))
+        w, h = size or metadata.size
+        extension = 'jpg' if metadata.format == 'JPEG' else 'png'
+        output = self.cache / f'{digest}_{w}x{h}_q{self.quality}.{extension}'
+        return (str(filename), str(output), size, self.quality)
+
+    def optimize(self, filename, width, height):
+        """the file to embed for filename placed as width x height (EMU)"""
+        return self.optimize_many([(filename, width, height)])[0]
+
+    def optimize_many(self, pictures):
+        """the files to embed for all (filename, width, height), resampled in parallel
+
+        a picture that fails is embedded as it is, the reason is kept in self.errors
+        """
+        files = [str(filename) for filename, _w, _h in pictures]
+        todo = {}
+        for i, picture in enumerate(pictures):
+            try:
+                job = self.job(*picture)
+            except Exception as e:
+                self.errors[files[i]] = f'{type(e).__name__}: {e}'
+                continue
+            if job is not None:
+                todo.setdefault(job[1], (job, []))[1].append(i)
+        if not todo:
+            return files
+
+        self.cache.mkdir(parents=True, exist_ok=True)
+        results = {}
+        if self.workers == 1 or len(todo) == 1:
+            for output, (job, _) in todo.items():
+                results[output] = self._run(lambda: job[1] if os.path.exists(job[1]) else _resample(job))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = {output: pool.submit(_resample, job)
+                           for output, (job, _) in todo.items() if not os.path.exists(output)}
+                for output in todo:
+                    results[output] = self._run(futures[output].result) if output in futures else output
+        for output, (job, indices) in todo.items():
+            if isinstance(results[output], Exception):
+                self.errors[job[0]] = f'{type(results[output]).__name__}: {results[output]}'
+                continue
+            for i in indices:
+                files[i] = output
+        return files
+
+    @staticmethod
+    def _run(work):
+        try:
+            return work()
+        except Exception as e:
+            return e
+
+    def flush(self):
+        """embed all pending pictures"""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        print(f'   optimize {len(pending)} images ...')
+        files = self.optimize_many([p[:3] for p in pending])
+        for filename, error in self.errors.items():
+            print(f'WARNING: cannot optimize image {filename!r}, embed it as it is: {error}')
+        self.errors = {}
+        for (_f, _w, _h, insert), filename in zip(pending, files):
+            insert(filename)
+
+
+# the optimizer of the document that is filled right now, see optimizing;
+# a context variable: documents filled in other threads have their own
+_active = contextvars.ContextVar('imageOptimizer', default=None)
+
+
+@contextmanager
+def optimizing(optimizer):
+    """collect all pictures placed inside and embed them optimized at the end
+
+    optimizer - ImageOptimizer or None to embed them right away
+    """
+    token = _active.set(optimizer)
+    try:
+        yield optimizer
+    except BaseException:
+        if optimizer is not None:
+            optimizer._pending = []
+        raise
+    else:
+        if optimizer is not None:
+            optimizer.flush()
+    finally:
+        _active.reset(token)
+
+
+def placePicture(filename, width, height, insert):
+    """embed a picture by insert(filename), right away or optimized later
+
+    width, height - placed size (EMU), used to find the required pixels
+    """
+    optimizer = _active.get()
+    if optimizer is None:
+        insert(filename)
+    else:
+        optimizer._pending.append((filename, width, height, insert))
@@ -4,5 +4,13 @@
 from .reportDataFile import ReportDataFile
 from .tasks import ReportTask
 from .values import Value
+from .cache import ParseCache
+from .context import ParseContext
+from .compiled import CompiledReport, compileRdf
+from .builder import ReportBuilder
+from .contentcache import ContentCache, contentCache
+from .prefetch import prefetch
+from .connections import ConnectionPool, connectionPool
 
-__all__ = ['ReportDataFile', 'ReportTask', 'Value']
+__all__ = ['ReportDataFile', 'ReportTask', 'Value', 'ParseCache', 'ParseContext', 'CompiledReport', 'compileRdf', 'ReportBuilder',
+           'ContentCache', 'contentCache', 'prefetch', 'ConnectionPool', 'connectionPool']
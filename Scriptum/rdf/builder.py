@@ -0,0 +1,214 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Create the tasks of a report directly from python, without a RDF file.
+
+    report = ReportBuilder(documenttype='pptx', datadir='data')
+    report.slide('Results').set('title', 'Results').at('marker:content')
+    report.add('table:generic', file='cases.csv', description='all cases')
+    ManagedPptx('template.pptx').artist(report)
+
+is the same as the RDF file
+
+    *version=3
+    *documenttype=pptx
+    *datadir=data
+    Results
+      .title='Results'
+      @marker:content
+      +table:generic=file:cases.csv+description='all cases'
+
+and gives the same ReportTasks: serials, addresses (including _c002...),
+what/where and actions.
+"""
+
+from pathlib import Path
+
+from .._docx import docx_sections
+from .._pptx import pptx_sections
+
+from .context import ParseContext
+from .settings import SETTINGS
+from .tasks import ReportTask
+from .values import Value
+
+MIN_REQUIRED_VERSION = 3
+
+
+class ReportBuilder:
+    """collect ReportTasks like ReportDataFile does while reading a RDF file
+
+    every method returns the builder itself, thus calls can be chained;
+    values are python objects, see Value.of, or file names given as file=...
+    any misuse raises a ValueError with the message ReportDataFile would report
+    """
+
+    def __init__(self, documenttype, version=MIN_REQUIRED_VERSION, **settings):
+        """documenttype - 'docx' or 'pptx'
+        settings - any of the global settings (*key=value), e.g. datadir or floatformat
+        """
+        self.errors = []
+        self.tasks = []
+        self.source = '<ReportBuilder>'
+        self.context = ParseContext()
+        self.settings = SETTINGS()
+
+        if int(version) < MIN_REQUIRED_VERSION:
+            self._error(f'Cannot read rdf version lower than {MIN_REQUIRED_VERSION}')
+        self.settings.version = int(version)
+
+        documenttype = str(documenttype).lower()
+        if documenttype == 'pptx':
+            self.namespace = pptx_sections
+        elif documenttype == 'docx':
+            self.namespace = docx_sections
+        else:
+            self._error(f'No idea how to define *documenttype which is {documenttype!r}')
+        self.settings.documenttype = documenttype
+
+        for key, value in settings.items():
+            if key == 'datadir':
+                value = Path(str(value).replace('\\', '/'))
+                if not self.context.index.exists(value):
+                    self._error(f'Non existing *datadir {value!r}')
+            elif key not in SETTINGS.allowed or key in ('version', 'documenttype'):
+                self._error(f'Unknown global setting *{key}')
+            setattr(self.settings, key, value)
+
+        self._currentroot = ['___init___']
+        self._currentmark = ''
+
+    def __repr__(self) -> str:
+        return f'ReportBuilder({self.settings.documenttype!r}, {len(self.tasks)} tasks)'
+
+    def _error(self, message):
+        self.errors += [message]
+        raise ValueError(message)
+
+    ###########################################################################
+    # roots, like lines without '='
+    def slide(self, name):
+        """start a new slide from the layout name (pptx), like the line 'name'"""
+        if self.settings.documenttype != 'pptx':
+            self._error(f'slides are available in pptx documents only, not in {self.settings.documenttype}')
+        return self.root(name)
+
+    def section(self, name, kind='section'):
+        """start a new section (docx)
+
+        kind 'section' is like the line 'section:name', any other level
+        is relative to the current one, e.g. kind='subsection' like '.subsection:name'
+        """
+        if self.settings.documenttype != 'docx':
+            self._error(f'sections are available in docx documents only, not in {self.settings.documenttype}')
+        if kind == self.namespace['order'][0]:
+            return self.root(f'{kind}:{name}')
+        return self.sub(f'{kind}:{name}')
+
+    def subsection(self, name):
+        return self.section(name, 'subsection')
+
+    def subsubsection(self, name):
+        return self.section(name, 'subsubsection')
+
+    def global_(self):
+        """everything set afterwards is used everywhere, like the line 'global'"""
+        self._currentmark = ''
+        self._currentroot = ['global']
+        return self
+
+    def root(self, address):
+        """start a new absolute root, like the line 'address'"""
+        self._currentmark = ''
+        sline = address.lower().split('.')
+        order = self.namespace['order']
+        names = self.namespace['names']
+        for j, sl in enumerate(sline):
+            secname = sl.split(':', 1)[0]
+            if nname := names.get(j, None):
+                if self.namespace['mandatory'] and nname != secname:
+                    self._error(f'section {secname!r} is not in allowed order: {order}')
+            else:
+                self._error(f'section naming {secname!r} is not in allowed namespace[{j}]: {order}')
+        self._currentroot = sline
+        if self.settings.documenttype == 'pptx':
+            self._task('', Value('newsection:', self.settings), what='copy')
+        elif len(self._currentroot) > 1:
+            # we never copy the sections
+            self._task('', Value('newsection:', self.settings), what='copy', ifrequired=True)
+        return self
+
+    def sub(self, address):
+        """go to another level relative to the current root, like the line '.address'"""
+        self._currentmark = ''
+        if self._currentroot == ['___init___']:
+            self._error('Using (.) without a section root is not allowed')
+        order = self.namespace['order']
+        for sl in address.lower().split('.'):
+            secname = sl.split(':', 1)[0]
+            if secname not in order:
+                self._error(f'section {secname!r} is not in allowed order: {order}')
+            index = order.index(secname)
+            if index > len(self._currentroot):
+                self._error(f'section {secname!r} creates a gap in allowed order: {order}')
+            self._currentroot = self._currentroot[:index] + [sl]
+        self._task('', Value('newsection:', self.settings), what='copy')
+        return self
+
+    ###########################################################################
+    # content
+    def set(self, target, value=None, *, file=None, **actions):
+        """fill target in the current root, like '.target=value+action=...'"""
+        self._currentmark = ''
+        if self._currentroot == ['___init___']:
+            self._error('Using (.) without a section root is not allowed')
+        modifier = {}
+        if actions:
+            modifier['actions'] = self._actions(actions)
+        self._task(target, self._value(target, value, file), **modifier)
+        return self
+
+    def at(self, marker):
+        """add the following content at marker, like '@marker'"""
+        self._checkMarkable('@')
+        self._currentmark = marker.lower()
+        return self
+
+    def add(self, target, value=None, *, file=None, **actions):
+        """add target from the templates at the current marker, like '+target=value+action=...'"""
+        self._checkMarkable('+')
+        if not self._currentmark:
+            self._error('Adding content (+) with tag is not allowed without a marked (@) position')
+        self._task(target, self._value(target, value, file),
+                   what='add', where=self._currentmark, actions=self._actions(actions))
+        return self
+
+    def _checkMarkable(self, char):
+        if not self._currentroot or self._currentroot[0] == 'global':
+            self._error(f'Marker ({char}) is not allowed')
+
+    def _value(self, target, value, file):
+        kind = target.lower().split('.')[-1].split(':')[0]
+        if file is not None:
+            if value is not None:
+                self._error(f'either a value or file= for {target!r}, not both')
+            return Value.fromFile(file, self.settings, kind, self.context.index)
+        if value is None:
+            self._error(f'no value for {target!r}')
+        return Value.of(value, self.settings, kind, self.context.index)
+
+    def _actions(self, actions):
+        return {
+            n: Value.of(v, self.settings, n, self.context.index)
+            for n, v in actions.items()
+        }
+
+    def _task(self, target, value, **modifier):
+        self.tasks += [ReportTask(root=self._currentroot, line=target, settings=self.settings,
+                                  context=self.context, value=value, **modifier)]
+
+    ###########################################################################
+    def inspect(self):
+        return [t._inspect() for t in self.tasks]
@@ -0,0 +1,130 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Persistent on-disk cache for parsed RDF files and their &include fragments.
+
+Every RDF file (the master and each included fragment) is stored as its own
+entry. An entry is keyed on the absolute filename, the inherited root and
+marker, the incoming settings and the working directory. It remembers every
+file it depends on (the fragment itself and all files it includes, directly
+or recursively) together with their mtime, size and content hash.
+
+A changed fragment therefore invalidates its own entry and the entries of all
+files including it, while all unchanged siblings are still served from disk.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from .. import __version__
+from .common import expandPattern
+
+# bump whenever the layout of an entry or of the pickled objects changes
+CACHE_FORMAT = 2
+
+
+def fileDependency(filename):
+    """describe a file such that a later change can be detected"""
+    filename = os.path.abspath(filename)
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return ('missing', filename)
+    return ('file', filename, stat.st_mtime_ns, stat.st_size, _digest(filename))
+
+
+def globDependency(pattern, datadir, found):
+    """describe a loopfiles pattern and what it did expand to"""
+    return ('glob', pattern, str(datadir), tuple(found))
+
+
+def _digest(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _isFresh(dependency):
+    kind = dependency[0]
+    if kind == 'file':
+        _, filename, mtime, size, digest = dependency
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+        if stat.st_size != size:
+            return False
+        if stat.st_mtime_ns == mtime:
+            return True
+        # touched only? then the content decides
+        return _digest(filename) == digest
+    elif kind == 'missing':
+        return not os.path.exists(dependency[1])
+    elif kind == 'glob':
+        _, pattern, datadir, found = dependency
+        return tuple(expandPattern(pattern, datadir)) == found
+    return False
+
+
+class ParseCache:
+    """store and retrieve parsed RDF files
+
+    cache = ParseCache('.scriptum_cache')
+    rdf = ReportDataFile('report.rdf', cache=cache)
+    """
+
+    def __init__(self, directory='.scriptum_cache'):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f'ParseCache({str(self.directory)!r}) hits: {self.hits} misses: {self.misses}'
+
+    def _entryFile(self, filename, root, mark, settings, testmode):
+        key = repr((CACHE_FORMAT, __version__, os.path.abspath(filename), tuple(root), mark,
+                    repr(settings), settings.documenttype, os.getcwd(), testmode))
+        return self.directory / (hashlib.sha1(key.encode('utf-8')).hexdigest() + '.pkl')
+
+    def load(self, filename, root, mark, settings, testmode=False):
+        """return the stored entry (a dict) if all its dependencies are unchanged, else None"""
+        entryfile = self._entryFile(filename, root, mark, settings, testmode)
+        entry = None
+        if entryfile.exists():
+            try:
+                with open(entryfile, 'rb') as f:
+                    entry = pickle.load(f)
+            except Exception:
+                # broken or written by an incompatible version, just parse again
+                entry = None
+        if entry is not None and not all(_isFresh(d) for d in entry['dependencies']):
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def store(self, filename, root, mark, settings, entry, testmode=False):
+        """write one entry, silently skip it if that is not possible"""
+        entryfile = self._entryFile(filename, root, mark, settings, testmode)
+        tmpfile = entryfile.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(tmpfile, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmpfile, entryfile)
+        except Exception as e:
+            print(f'WARNING: cannot write RDF cache entry for {filename!r}: {e}')
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
+
+    def clear(self):
+        """remove all entries"""
+        for entryfile in self.directory.glob('*.pkl'):
+            entryfile.unlink()
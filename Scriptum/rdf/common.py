@@ -1,7 +1,8 @@
 """Shared helpers for rdf module."""
 
+import glob
 import os
-from typing import Tuple
+from typing import List, Tuple
 
 _test_debug = False
 
@@ -24,19 +25,32 @@ def removeQuotes(v: str) -> str:
     return v
 
 
-def getCorrectFile(name: str, relative: bool = False, datadir: str = '.') -> Tuple[str, bool]:
-    """Find the correct file, optionally considering relative paths."""
-    exists = False
+def getCorrectFile(name: str, relative: bool = False, datadir: str = '.', index=None) -> Tuple[str, bool]:
+    """Find the correct file, optionally considering relative paths.
+
+    With a FileIndex the answer comes from there instead of the disk.
+    """
+    exists = index.exists if index is not None else os.path.exists
     if name == os.path.abspath(name):
         name = os.path.normpath(os.path.join(datadir, name))
-        if os.path.exists(name):
-            exists = True
+        found = exists(name)
     else:
-        if relative and os.path.exists(name):
-            exists = True
+        if relative and exists(name):
+            found = True
         else:
             name = os.path.normpath(os.path.join(datadir, name))
-            exists = os.path.exists(name)
-    return name, exists
+            found = exists(name)
+    return name, found
+
 
+def expandPattern(pattern: str, datadir='.', index=None) -> List[str]:
+    """Expand a loopfiles pattern, relative to the current directory first, then to datadir.
 
+    The result is sorted to get the same order of included files on every system.
+    With a FileIndex the answer comes from there instead of the disk.
+    """
+    expand = index.glob if index is not None else glob.glob
+    found = expand(pattern)
+    if not found:
+        found = expand(os.path.join(str(datadir), pattern))
+    return sorted(found)
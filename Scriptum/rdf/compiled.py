@@ -0,0 +1,309 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Precompiled RDF files (.rdfc).
+
+A ReportDataFile with all its includes resolved is written once, e.g. on a
+build coordinator, and loaded again by the render workers without the RDF
+tree:
+
+    CompiledReport.fromReportDataFile(ReportDataFile('data.rdf')).dump('data.rdfc')
+    ManagedDocx('template.docx').typesetting(CompiledReport.load('data.rdfc'))
+
+A file is a short header (magic, format, Scriptum version) followed by the
+zlib compressed JSON of tasks and settings: plain data only, the tasks and
+values are built again when the file is loaded (see _encodeTask and
+_decodeTask), thus loading a file never runs code from it. File names inside
+are kept as they were found while parsing, thus the render workers need the
+same relative layout of the data files.
+"""
+
+import json
+import os
+import struct
+import types
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+from .. import __version__
+from .settings import SETTINGS
+from .tasks import ReportTask
+from .values import Value
+from .values.color_value import ColorValue
+from .values.date_value import DateValue
+from .values.file_value import FileValue
+from .values.image_value import AnimationValue, ImageValue
+from .values.length_value import LengthValue
+from .values.namevalues_value import NameValue
+from .values.number_value import FloatValue, IntegerValue, NumberValue
+from .values.table_value import TableValue
+from .values.text_value import StringValue, TextValue
+
+MAGIC = b'SCRIPTUM-RDFC\n'
+# bump whenever the layout of the file or the schema below changes
+FORMAT = 2
+_HEADER = struct.Struct('>HH')
+
+
+class CompiledReport:
+    """the parse result of a ReportDataFile: what is required to render a document
+
+    tasks and settings can be used wherever a ReportDataFile is used, e.g. in
+    ManagedDocx.typesetting or ManagedPptx.artist
+    """
+
+    def __init__(self, tasks, settings, source=''):
+        self.tasks = tasks
+        self.settings = settings
+        self.source = source
+        self.errors = []
+
+    @classmethod
+    def fromReportDataFile(cls, rdf):
+        return cls(list(rdf.tasks), rdf.settings, getattr(rdf, 'source', ''))
+
+    def __repr__(self) -> str:
+        return f'CompiledReport({self.source!r}, {len(self.tasks)} tasks)'
+
+    def inspect(self):
+        return [t._inspect() for t in self.tasks]
+
+    def dump(self, filename):
+        """write it to filename (usually *.rdfc)"""
+        version = __version__.encode('utf-8')
+        data = {
+            'source': self.source,
+            'settings': _encodeSettings(self.settings),
+            'tasks': [_encodeTask(t) for t in self.tasks],
+        }
+        payload = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        with open(filename, 'wb') as f:
+            f.write(MAGIC)
+            f.write(_HEADER.pack(FORMAT, len(version)))
+            f.write(version)
+            f.write(payload)
+
+    @classmethod
+    def load(cls, filename, refresh=True):
+        """read a file written by dump
+
+        refresh - check again whether the files used exist (and evaluate date:now),
+                  the file may have been compiled somewhere else or some time ago
+        """
+        with open(filename, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{str(filename)!r} is not a compiled RDF file')
+            fmt, length = _HEADER.unpack(f.read(_HEADER.size))
+            version = f.read(length).decode('utf-8')
+            if fmt != FORMAT or version != __version__:
+                raise ValueError(
+                    f'{str(filename)!r} was compiled by Scriptum {version} (format {fmt}), '
+                    f'compile it again for Scriptum {__version__} (format {FORMAT})'
+                )
+            data = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+        settings = _decodeSettings(data['settings'])
+        tasks = [_decodeTask(t) for t in data['tasks']]
+        report = cls(tasks, settings, data['source'])
+        if refresh:
+            for task in tasks:
+                task.value.refresh()
+                for action in task.actions.values():
+                    action.refresh()
+        return report
+
+
+def isCompiled(filename) -> bool:
+    """True if filename starts like a file written by CompiledReport.dump"""
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def compileRdf(rdffile, output=None, **kwargs):
+    """parse rdffile and write it as compiled file, return the name of that file
+
+    kwargs are handed to ReportDataFile, e.g. cache or workers
+    """
+    from .reportDataFile import ReportDataFile
+
+    if output is None:
+        output = os.path.splitext(str(rdffile))[0] + '.rdfc'
+    rdf = ReportDataFile(str(rdffile), **kwargs)
+    if rdf.errors:
+        raise Exception('\n'.join(rdf.errors))
+    CompiledReport.fromReportDataFile(rdf).dump(output)
+    return output
+
+
+def reportData(rdf):
+    """take a ReportDataFile, a CompiledReport or the name of a .rdf or .rdfc file"""
+    if isinstance(rdf, (str, Path)):
+        if isCompiled(rdf):
+            return CompiledReport.load(rdf)
+        from .reportDataFile import ReportDataFile
+        return ReportDataFile(str(rdf))
+    return rdf
+
+
+#
+# the schema: tasks, values and settings as plain data
+#
+def _encodeSettings(settings):
+    data = {k: getattr(settings, k) for k in SETTINGS.allowed + ['documenttype']}
+    # *datadir is a Path once it is set
+    data['paths'] = [k for k, v in data.items() if isinstance(v, Path)]
+    for k in data['paths']:
+        data[k] = str(data[k])
+    return data
+
+
+def _decodeSettings(data):
+    settings = SETTINGS()
+    for k in SETTINGS.allowed + ['documenttype']:
+        setattr(settings, k, Path(data[k]) if k in data['paths'] else data[k])
+    return settings
+
+
+def _encodeTask(task):
+    return {
+        'serial': task.serial,
+        'target': task.target,
+        'path': task.path,
+        'address': task.myAddress,
+        'length': task.length,
+        'value': _encodeValue(task.value),
+        'modified': task.modified,
+        'what': task.what,
+        'where': task.where,
+        'actions': {n: _encodeValue(v) for n, v in task.actions.items()},
+        'ifrequired': task.copyifrequired,
+        'finaltarget': getattr(task, 'finaltarget', None),
+    }
+
+
+def _decodeTask(data):
+    task = ReportTask.__new__(ReportTask)
+    task.serial = data['serial']
+    task.target = data['target']
+    task.path = data['path']
+    task.myAddress = data['address']
+    task.length = data['length']
+    task.value = _decodeValue(data['value'])
+    task.modified = data['modified']
+    task.what = data['what']
+    task.where = data['where']
+    task.actions = {n: _decodeValue(v) for n, v in data['actions'].items()}
+    task.copyifrequired = data['ifrequired']
+    if data['finaltarget'] is not None:
+        task.finaltarget = data['finaltarget']
+    if task.actions:
+        # as ReportTask does, e.g. for tables
+        task.value.applyActions(task.actions)
+    return task
+
+
+def _encodeValue(value):
+    return {
+        'type': value.type,
+        'subtype': value.subtype,
+        'tostring': value.tostring,
+        'object': _encodeObject(value.object),
+    }
+
+
+def _decodeValue(data):
+    value = Value.__new__(Value)
+    value.type = data['type']
+    value.subtype = data['subtype']
+    value.tostring = data['tostring']
+    value.object = _decodeObject(data['object'])
+    value.content = None
+    return value
+
+
+# file-backed values: kind -> class, all of them are (filename, exists)
+_FILES = {'file': FileValue, 'text': TextValue, 'image': ImageValue, 'video': AnimationValue}
+
+
+def _encodeObject(o):
+    """the object of a Value as {'kind': ..., ...}"""
+    if o is None or isinstance(o, str):
+        return {'kind': 'plain', 'value': o}
+    if isinstance(o, StringValue):
+        return {'kind': 'string', 'value': o.value}
+    if isinstance(o, IntegerValue):
+        return {'kind': 'int', 'value': o.value}
+    if isinstance(o, FloatValue):
+        return {'kind': 'float', 'value': o.value, 'floatformat': o.floatformat}
+    if isinstance(o, LengthValue):
+        return {'kind': 'length', 'value': o.value, 'unit': o.unit,
+                'floatformat': getattr(o, 'floatformat', None)}
+    if isinstance(o, ColorValue):
+        return {'kind': 'color', 'value': o._raw}
+    if isinstance(o, DateValue):
+        return {'kind': 'date', 'value': o.value, 'format': o.format, 'volatile': o.volatile,
+                'dt': o.dt.isoformat()}
+    if isinstance(o, NumberValue):
+        numbers = list(o.numbers)
+        o.numbers = iter(numbers) # nothing is taken away
+        return {'kind': 'numbering', 'str': o.str, 'numbers': numbers}
+    if isinstance(o, TableValue):
+        return {'kind': 'table', 'filename': o.filename, 'exists': o.exists,
+                'separator': o.separator, 'floatformat': o.floatformat,
+                'parameter': None if o.parameter is None else _encodeObject(o.parameter)}
+    if isinstance(o, NameValue):
+        return {'kind': 'parameter', 'filename': o.filename, 'exists': o.exists,
+                'parameter': o.parameter, 'separator': o.separator,
+                'datetimeformat': o.datetimeformat, 'floatformat': o.floatformat}
+    for kind, cls in _FILES.items():
+        if type(o) is cls:
+            return {'kind': kind, 'filename': o.filename, 'exists': o.exists}
+    raise TypeError(f'cannot compile a value of type {type(o).__name__}')
+
+
+def _decodeObject(data):
+    kind = data['kind']
+    if kind == 'plain':
+        return data['value']
+    if kind == 'string':
+        return StringValue(data['value'])
+    if kind == 'int':
+        return IntegerValue(data['value'])
+    if kind == 'float':
+        return FloatValue(data['value'], types.SimpleNamespace(floatformat=data['floatformat']))
+    if kind == 'length':
+        o = LengthValue('0' + data['unit'])
+        o.value = data['value']
+        if data['floatformat'] is not None:
+            o.floatformat = data['floatformat']
+        return o
+    if kind == 'color':
+        return ColorValue(data['value'])
+    if kind == 'date':
+        o = DateValue.__new__(DateValue)
+        o.value, o.format, o.volatile = data['value'], data['format'], data['volatile']
+        o.dt = datetime.fromisoformat(data['dt'])
+        return o
+    if kind == 'numbering':
+        o = NumberValue.__new__(NumberValue)
+        o.str = data['str']
+        o.numbers = iter(data['numbers'])
+        return o
+    if kind == 'table':
+        settings = types.SimpleNamespace(csvseparator=data['separator'], floatformat=data['floatformat'])
+        o = TableValue(data['filename'], data['exists'], settings)
+        if data['parameter'] is not None:
+            o.parameter = _decodeObject(data['parameter'])
+        return o
+    if kind == 'parameter':
+        settings = types.SimpleNamespace(nvseparator=data['separator'], datetimeformat=data['datetimeformat'],
+                                         floatformat=data['floatformat'])
+        return NameValue(data['filename'], data['exists'], settings, data['parameter'])
+    if kind in _FILES:
+        return _FILES[kind](data['filename'], data['exists'])
+    raise ValueError(f'unknown kind of value in compiled RDF file: {kind!r}')
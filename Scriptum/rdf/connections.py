@@ -0,0 +1,99 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Shared read-only connections to SQLite databases.
+
+Tables may be queried from a database, e.g. dozens of
+
+    .table:generic=file:results.sqlite+query='select name, dp from runs where ok'
+
+All tasks of a render use the same connection per database file, opened
+read-only on first use. The renders close them when they are done
+(with connectionPool: ...): the last one of several renders running at
+the same time closes them, the next query opens them again.
+"""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class ConnectionPool:
+    """one connection per database file
+
+    with connectionPool:                 # nested or in several threads
+        with connectionPool.use(filename) as db:
+            db.execute(...)
+    # closed by the outermost exit, or by connectionPool.close()
+    """
+
+    def __init__(self):
+        self._connections = {}
+        self._lock = threading.Lock()
+        self._users = 0
+
+    def __repr__(self) -> str:
+        return f'ConnectionPool({len(self._connections)} open)'
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def __enter__(self):
+        with self._lock:
+            self._users += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self._users -= 1
+            if self._users:
+                return
+            connections, self._connections = self._connections, {}
+        self._close(connections)
+
+    def connect(self, filename):
+        """the connection to filename and its lock, opened if required"""
+        filename = os.path.abspath(filename)
+        with self._lock:
+            if filename not in self._connections:
+                # prefetch reads from several threads, the lock keeps them apart
+                connection = sqlite3.connect(f'{Path(filename).as_uri()}?mode=ro', uri=True,
+                                             check_same_thread=False)
+                self._connections[filename] = (connection, threading.RLock())
+            return self._connections[filename]
+
+    def use(self, filename):
+        """the connection to filename, locked inside the with block"""
+        return _Locked(*self.connect(filename))
+
+    def close(self):
+        """close all connections"""
+        with self._lock:
+            connections, self._connections = self._connections, {}
+        self._close(connections)
+
+    @staticmethod
+    def _close(connections):
+        for connection, lock in connections.values():
+            with lock:
+                connection.close()
+
+
+class _Locked:
+    def __init__(self, connection, lock):
+        self.connection = connection
+        self.lock = lock
+
+    def __enter__(self):
+        self.lock.acquire()
+        return self.connection
+
+    def __exit__(self, *exc):
+        self.lock.release()
+
+
+# used by all tables of this process
+connectionPool = ConnectionPool()
@@ -0,0 +1,107 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Process-wide cache of what was read from data files.
+
+Many values may point at one file, e.g. fifty parfile:results.nv:... lines
+or one picture used on several slides. The file is read and parsed for the
+first of them, all others get the same (shared, never changed) result:
+parsed NV files, CSV tables and image headers.
+
+An entry is keyed on the file (absolute name, mtime and size), the kind of
+content and the settings used to read it; a changed file is therefore read
+again. The least recently used entries are dropped beyond maxsize entries
+or beyond maxbytes, the approximate memory of all entries (see sizeOf).
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+# about the memory of one cell or value kept in a python list
+CELL_BYTES = 64
+
+
+def sizeOf(content) -> int:
+    """about the bytes content keeps in memory: nbytes if it tells, the length of a text"""
+    nbytes = getattr(content, 'nbytes', None)
+    if nbytes is not None:
+        return int(nbytes)
+    if isinstance(content, (str, bytes)):
+        return len(content)
+    return sys.getsizeof(content)
+
+
+class ContentCache:
+    """keep the parsed content of files in memory
+
+    contentCache.get('nv', filename, (separator,), lambda: NameValueReader(...))
+    contentCache.hits, contentCache.misses, contentCache.nbytes
+    contentCache.clear()
+
+    an entry larger than maxbytes is not kept at all
+    """
+
+    def __init__(self, maxsize=256, maxbytes=1 << 30):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict() # key -> (content, bytes)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (f'ContentCache({len(self._entries)}/{self.maxsize} entries, '
+                f'{self.nbytes}/{self.maxbytes} bytes, {self.hits} hits, {self.misses} misses)')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind, filename, params, load):
+        """the content of filename as created by load(), read once per file and params"""
+        filename = os.path.abspath(filename)
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            # nothing to check against, load() tells what is wrong
+            return load()
+        key = (kind, filename, stat.st_mtime_ns, stat.st_size, params)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+
+        # read outside of the lock: other files can be served meanwhile
+        content = load()
+        size = sizeOf(content)
+
+        with self._lock:
+            if key in self._entries:
+                # read by another thread meanwhile
+                self.nbytes -= self._entries[key][1]
+            self._entries[key] = (content, size)
+            self._entries.move_to_end(key)
+            self.nbytes += size
+            while self._entries and (len(self._entries) > self.maxsize or self.nbytes > self.maxbytes):
+                _content, dropped = self._entries.popitem(last=False)[1]
+                self.nbytes -= dropped
+        return content
+
+    def clear(self):
+        """forget everything and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.nbytes = 0
+
+
+# used by all values of this process
+contentCache = ContentCache()
@@ -0,0 +1,56 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""State of one parse: a master RDF file and everything it includes."""
+
+import sys
+
+from .fileindex import FileIndex
+
+
+class ParseContext:
+    """hold everything that used to be shared by all parses in a process
+
+    one context is created for the master RDF file and handed down to all
+    included files and all tasks created, thus two files can be parsed at
+    the same time (e.g. in threads) without interfering with each other
+
+    - serial: counter for the tasks created
+    - tree: dict of dicts of dicts... of all task paths, see ReportTask.checkPath
+    - allPaths: full path -> first address
+    - newPaths: full path -> list of addresses of all duplicates
+    - depth: current recursion depth of included files
+    - rlimit: limit of that depth
+    - global_settings: *key -> list of (value, file, line) where it is defined
+    - visited: all files read so far, to detect cycles
+    - index: FileIndex of all directories files are looked for
+    - paths: all task paths and addresses, each stored once, see sharedPath
+    """
+
+    def __init__(self, rlimit=10):
+        self.serial = 0
+        self.tree = {}
+        self.allPaths = {}
+        self.newPaths = {}
+        self.depth = 0
+        self.rlimit = rlimit
+        self.global_settings = {}
+        self.visited = set()
+        self.index = FileIndex()
+        self.paths = {}
+
+    def nextSerial(self) -> int:
+        """count the tasks"""
+        self.serial += 1
+        return self.serial
+
+    def sharedPath(self, parts) -> tuple:
+        """one tuple of interned strings for all equal paths"""
+        path = tuple(sys.intern(p) for p in parts)
+        return self.paths.setdefault(path, path)
+
+    def __repr__(self) -> str:
+        return (f'ParseContext(tasks: {self.serial}, files: {len(self.visited)}, '
+                f'depth: {self.depth}/{self.rlimit})')
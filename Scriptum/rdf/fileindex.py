@@ -0,0 +1,85 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Index of the files in the data directories of one parse.
+
+Every directory is read once with os.scandir when it is first asked for,
+all further questions about files in there are answered from memory.
+"""
+
+import fnmatch
+import glob
+import os
+from typing import List
+
+
+class FileIndex:
+    """answer 'does this file exist?' and expand patterns without touching the disk again
+
+    index = FileIndex()
+    index.exists('data/picture.png')
+    index.glob('rdf_big*.rdf')
+    index.refresh()  # forget everything, e.g. after files were created
+    """
+
+    def __init__(self):
+        # normalized directory -> set of normalized names (None if no directory)
+        self._dirs = {}
+        # normalized directory -> names as found on disk
+        self._names = {}
+
+    def __repr__(self) -> str:
+        return f'FileIndex({len(self._dirs)} directories)'
+
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def _listing(self, directory):
+        key = self._key(directory)
+        if key not in self._dirs:
+            try:
+                with os.scandir(key) as entries:
+                    names = sorted(e.name for e in entries)
+            except OSError:
+                self._dirs[key] = None
+                self._names[key] = []
+            else:
+                self._dirs[key] = {os.path.normcase(n) for n in names}
+                self._names[key] = names
+        return key
+
+    def exists(self, path) -> bool:
+        """same as os.path.exists"""
+        directory, name = os.path.split(os.path.abspath(path))
+        if not name:
+            # the root directory
+            return os.path.exists(directory)
+        listing = self._dirs.get(self._listing(directory))
+        return listing is not None and os.path.normcase(name) in listing
+
+    def glob(self, pattern) -> List[str]:
+        """same as glob.glob, sorted; patterns with wildcards in directories are passed to glob"""
+        pattern = str(pattern)
+        directory, name = os.path.split(pattern)
+        if glob.has_magic(directory):
+            return sorted(glob.glob(pattern))
+        if not glob.has_magic(name):
+            return [pattern] if self.exists(pattern) else []
+        names = self._names[self._listing(directory or os.curdir)]
+        if not name.startswith('.'):
+            # like glob: hidden files only if asked for
+            names = [n for n in names if not n.startswith('.')]
+        return sorted(os.path.join(directory, n) for n in fnmatch.filter(names, name))
+
+    def refresh(self, directory=None):
+        """forget one directory or, by default, all of them; they are read again when asked for"""
+        if directory is None:
+            self._dirs.clear()
+            self._names.clear()
+        else:
+            key = self._key(directory)
+            self._dirs.pop(key, None)
+            self._names.pop(key, None)
@@ -0,0 +1,61 @@
+#
+# part of:
+#   S C R I P T U M
+#
+
+"""Load all file-backed values before a document is filled.
+
+Tables, parameter files, texts and images are usually read when the fill
+loop reaches them, one after the other. prefetch reads them all up front in
+a few threads, thus the fill loop finds them in memory (see contentCache).
+
+    errors = prefetch(rdf.tasks, workers=8)
+
+Values of one file are loaded by the same thread, the file is read once.
+A file that cannot be read is reported in errors and left alone, the fill
+loop will meet the same error when it gets there.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 8
+
+
+def fileValues(tasks):
+    """all values (including actions) read from existing files, grouped by filename"""
+    files = {}
+    for task in tasks:
+        for value in [task.value, *task.actions.values()]:
+            if value.type not in ('file', 'parfile'):
+                continue
+            obj = value.object
+            if obj is None or not getattr(obj, 'exists', False):
+                continue
+            files.setdefault(str(obj.filename), []).append(value)
+    return files
+
+
+def _load(values):
+    for value in values:
+        value.load()
+
+
+def prefetch(tasks, workers=None):
+    """load the values of tasks in a pool of threads
+
+    workers - number of threads, None for DEFAULT_WORKERS
+
+    returns {filename: error message} of the files that failed
+    """
+    files = fileValues(tasks)
+    errors = {}
+    if not files:
+        return errors
+    with ThreadPoolExecutor(max_workers=min(workers or DEFAULT_WORKERS, len(files))) as pool:
+        jobs = {filename: pool.submit(_load, values) for filename, values in files.items()}
+        for filename, job in jobs.items():
+            try:
+                job.result()
+            except Exception as e:
+                errors[filename] = f'{type(e).__name__}: {e}'
+    return errors
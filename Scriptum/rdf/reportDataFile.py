@@ -3,7 +3,10 @@
 #   S C R I P T U M 
 
 #
-import os, glob
+import csv
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 MIN_REQUIRED_VERSION = 3
@@ -11,25 +14,80 @@ MIN_REQUIRED_VERSION = 3
 from .._docx import docx_sections
 from .._pptx import pptx_sections
 
-from .common import removeQuotes, getCorrectFile, is_test_debug
+from .common import removeQuotes, getCorrectFile, expandPattern, is_test_debug
 from .settings import SETTINGS
+from .cache import ParseCache, fileDependency, globDependency
+from .context import ParseContext
 from .values import Value
 from .tasks import LogTask, ReportTask
 
 _test_debug = is_test_debug()
 
+# {column} in the lines of a &foreach block
+_COLUMN = re.compile(r'\{([^{}]+)\}')
+
+
+def _splitActions(text):
+    """text split at each '+' outside of quotes: value+name=value+...
+
+    thus a quoted value may hold a '+' or '=' (+query='select a+b from t where c=1')
+    """
+    parts, quote, start = [], None, 0
+    for i, c in enumerate(text):
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in ('"', "'"):
+            quote = c
+        elif c == '+':
+            parts += [text[start:i]]
+            start = i + 1
+    return parts + [text[start:]]
+
+
+def _action(text):
+    """name and value of an action, name=value or a flag like +desc (value 1)"""
+    n, eq, v = text.partition('=')
+    return n.strip(), v if eq else '1'
+
+
+def _csvRows(filename, separator):
+    """the rows of a csv file with header line as dicts, one by one
+
+    blank lines and lines starting with a hash # are ignored
+    """
+    header = None
+    with open(filename, 'r', encoding='utf-8') as f:
+        for row in csv.reader(f, delimiter=separator):
+            row = [v.strip() for v in row]
+            if not any(row) or row[0].startswith('#'):
+                continue
+            if header is None:
+                header = row
+            else:
+                yield dict(zip(header, row))
+
 class ReportDataFile:
     _testmode_=False
-    _rlimit = 10 # limit the recursion depth
-    _depth = 0
-    _global_settings = {}
+    _rlimit = 10 # limit the recursion depth (default for each new ParseContext)
     def __init__(self, filename, debug=False,
                  _root=['___init___'], _mark='', _settings=None,
-                 _visited=None):
+                 _visited=None, cache=None, workers=None, _context=None, _entry=None,
+                 _stream=False, _keeplogs=True):
         """open and read the data and all the subdatas from other files as well
         and create 
         - ReportTasks inside self.tasks
         - LogTasks inside self.logs for debugging and other purposes
+
+        cache - optional ParseCache or directory name: unchanged files (and included 
+                fragments) are loaded from there instead of being parsed again
+        workers - number of processes to parse the files of &include=loopfiles:
+                  in parallel, None or 1 parses them one after the other; the
+                  result is the same in both cases
+
+        all state of one parse (serials, addresses, recursion depth...) lives in
+        self.context which is handed to all included files, thus several files
+        can be parsed at the same time
         """
 
         self.errors = []
@@ -37,9 +95,30 @@ class ReportDataFile:
         self.tasks = []
         self.root=None
 
-        if _visited is None:
-            _visited = set()
-        self._visited = _visited
+        # streaming, see iter_tasks: neither cache nor processes are used then
+        self._stream = _stream
+        self._keeplogs = _keeplogs
+        self._scanning = None
+        if _stream:
+            cache = workers = None
+
+        if cache is not None and not isinstance(cache, ParseCache):
+            cache = ParseCache(cache)
+        self.cache = cache
+        self.workers = workers
+        # what this file depends on, see cache.py
+        self._dependencies = []
+        # the global settings (*key=value) defined in here and in all included files
+        self._usages = []
+        # how deep are the includes starting from this file
+        self._nesting = 1
+
+        if _context is None:
+            _context = ParseContext(rlimit=ReportDataFile._rlimit)
+        self.context = _context
+        if _visited is not None:
+            self.context.visited = _visited
+        self._visited = self.context.visited
 
         filename = os.path.abspath(filename)
 
@@ -48,19 +127,22 @@ class ReportDataFile:
             return
 
         self._visited.add(filename)
+        # this file and all files included by it
+        self._files = [filename]
 
-        if not os.path.exists(filename):
+        if not self.context.index.exists(filename):
             self.errors += [f'Cannot find report data file {filename!r}']
             return 
         
-        ReportDataFile._depth += 1
-        if ReportDataFile._depth > ReportDataFile._rlimit:
+        self.context.depth += 1
+        if self.context.depth > self.context.rlimit:
             self.errors += [
-                f'Too many recursions: the limit of recursive files is set to {ReportDataFile._rlimit}'
+                f'Too many recursions: the limit of recursive files is set to {self.context.rlimit}'
             ]
             return
         
-        baseData = open(filename,'r').readlines()
+        if self.cache is not None:
+            self._dependencies += [fileDependency(filename)]
         self.source = filename
         
         ReportTask.set_debug(debug)
@@ -69,19 +151,14 @@ class ReportDataFile:
         self._currentmark = _mark
         self.namespace = {'order': [], 'mandatory': True, 'names': {}}
 
-        if not self._testmode_:
-            self.logs += [
-                LogTask(f'start file {os.path.normpath(self.source)!r}', comment=True)
-            ]
-
         if _root == ['___init___']:
             # the very first open: define settings
             self.settings = SETTINGS()
             self.root = True
-            # reset internal
-            ReportTask._allPaths = {}
-            ReportTask._newPaths = {}
-            ReportDataFile._global_settings = {}
+            # reset internal (matters only for files included before any root is set)
+            self.context.allPaths = {}
+            self.context.newPaths = {}
+            self.context.global_settings = {}
         else:
             # afterwards take from previous
             self.settings = SETTINGS(_settings)
@@ -92,17 +169,91 @@ class ReportDataFile:
             elif doctype == 'docx':
                 self.namespace = docx_sections
 
-        #print('***********************',filename,self.settings.documenttype)            
-        for i, line in enumerate(baseData):
+        if _entry is not None and self._restore(_entry):
+            # already parsed elsewhere, see _parseFragments
+            return
+
+        self._cachekey = None
+        if self.cache is not None:
+            # keep what is required to look it up again
+            self._cachekey = (filename, list(_root), _mark, SETTINGS(self.settings), self._testmode_)
+            if (entry := self.cache.load(*self._cachekey)) and self._restore(entry):
+                if self.root and self.errors:
+                    raise Exception('\n'.join(self.errors))
+                return
+
+        if _stream:
+            # nothing is read before the iteration starts, see iter_tasks
+            self._scanning = self._streamFile()
+            return
+
+        with open(filename, 'r') as f:
+            self.tasks += list(self._scan(f))
+        self._finish()
+
+    @classmethod
+    def iter_tasks(cls, filename, logs=None, debug=False):
+        """parse filename lazily and yield its ReportTasks section by section
+
+        lines are read one by one and &include files are read when they are reached,
+        a section is handed out as soon as the next one starts, thus memory stays
+        flat and the tasks can be used before the file is read completely
+
+        logs - optional list to collect the LogTasks, they are dropped otherwise
+
+        neither cache nor workers are used, errors are raised at the end
+        """
+        rdf = cls(filename, debug=debug, _stream=True, _keeplogs=logs is not None)
+        section = []
+        for task in rdf._taskSource():
+            # a new section starts with a task without target or with a new root
+            if section and (not task.target or task.path[:1] != section[-1].path[:1]):
+                yield from section
+                section = []
+            section.append(task)
+        yield from section
+        if logs is not None:
+            logs += rdf.logs
+        if rdf.errors:
+            raise Exception('\n'.join(rdf.errors))
+
+    def _taskSource(self):
+        """the tasks of this file: all at once or, when streaming, one after the other"""
+        if self._scanning is not None:
+            return self._scanning
+        return self.tasks
+
+    def _streamFile(self):
+        with open(self.source, 'r') as f:
+            yield from self._scan(f)
+        self._finish()
+
+    def _scan(self, lines):
+        """go line by line, yield the ReportTasks, keep logs and errors"""
+        if not self._testmode_ and self._keeplogs:
+            self.logs += [
+                LogTask(f'start file {os.path.normpath(self.source)!r}', comment=True)
+            ]
+
+        yield from self._scanLines(enumerate(lines))
+
+    def _scanLines(self, numbered):
+        """the work of _scan on pairs of (line number, line)"""
+        for i, line in numbered:
             # go line by line
             # i is used to report line numbers in case or errors
             line=line.strip()
             if not line or line.startswith('#'):
                 # skip comments and empty lines, but log as is
-                self.logs += [line]
+                if self._keeplogs:
+                    self.logs += [line]
                 continue
             
             firstchar = line[0].lower()
+            block = None
+            if line.lower().startswith('&foreach'):
+                # the template up to &endforeach belongs to this line, whatever happens below
+                block = self._foreachBlock(i, numbered)
             ###################################################################
             # filter general errors and restrictions
             if firstchar in ['+','@','&'] and (not self._currentroot or self._currentroot[0] == 'global'):
@@ -152,19 +303,72 @@ class ReportDataFile:
                     f'(@) and (&) cannot be used in the same line. Line with (&) has to follow line (@); see line {i+1} of file {self.source!r}'
                 ]
 
+            ###################################################################
+            # repeat a block of lines for each row of a csv file
+            elif block is not None:
+                # the expanded lines are logged, the directive itself as comment only
+                if self._keeplogs:
+                    self.logs += ['# ' + line]
+                yield from self._foreach(i, line, block)
+                if self._keeplogs:
+                    self.logs += ['# &endforeach']
+
             ###################################################################
             # MAIN DATA SCAN
             elif firstchar.isalpha() or firstchar in '.@+&*':
-                task, log, error = self.extractWork(firstchar, line, i)
-                self.tasks += task
-                self.logs += log
-                self.errors += error
+                logs, errors = [], []
+                yield from self._work(firstchar, line, i, logs, errors)
+                if self._keeplogs:
+                    self.logs += logs
+                self.errors += errors
                 
             else:
                 self.errors += [
                     f'Error parsing line {i+1} of file {self.source!r}, first letter must be in "a-z.@+&*"'
                 ]
 
+    def _foreachBlock(self, i, numbered):
+        """collect the lines after &foreach (line i) up to the matching &endforeach"""
+        block = []
+        depth = 1
+        for j, line in numbered:
+            lline = line.strip().lower()
+            if lline.startswith('&foreach'):
+                depth += 1
+            elif lline == '&endforeach':
+                depth -= 1
+                if depth == 0:
+                    return block
+            block += [(j, line)]
+        self.errors += [f'&foreach in line {i+1} of file {self.source!r} without &endforeach']
+        return block
+
+    def _foreach(self, i, line, block):
+        """&foreach=file:cases.csv ... &endforeach
+
+        the lines in between are read once per row of the csv file, where every {column}
+        is replaced by the value of that column in the row; unknown {names} are kept
+        rows are read one after the other when the tasks are requested
+        """
+        _front, source = line.split('=', 1) if '=' in line else (line, '')
+        if _front.strip().lower() != '&foreach' or not source.lower().startswith('file:'):
+            self.errors += [f'Meaning of line {i+1} in file {self.source!r} not defined']
+            return
+        csvfile = removeQuotes(source.split(':', 1)[1].strip())
+        csvfile, exists = getCorrectFile(csvfile, True, self.settings.datadir, self.context.index)
+        if self.cache is not None:
+            self._dependencies += [fileDependency(csvfile)]
+        if not exists:
+            self.errors += [f'&foreach fails to find file {csvfile!r}']
+            return
+        for row in _csvRows(csvfile, self.settings.csvseparator):
+            # same line numbers for each row, thus errors point to the template
+            yield from self._scanLines(
+                (j, _COLUMN.sub(lambda m: row.get(m[1].strip(), m[0]), tline)) for j, tline in block
+            )
+
+    def _finish(self):
+        """final checks after the last line"""
         if self.settings.version < MIN_REQUIRED_VERSION:
             self.errors += [
                 f'rdf version (*version) lower than {MIN_REQUIRED_VERSION} or not set'
@@ -180,16 +384,75 @@ class ReportDataFile:
             # we cannot work with invalid rdf-files
             raise Exception('\n'.join(self.errors))
             
-        if not self._testmode_:
+        if not self._testmode_ and self._keeplogs:
             self.logs += [
                 LogTask(f'end file {os.path.normpath(self.source)!r}', comment=True)
             ]
         #print(self.logs[-3:])
+
+        if self._cachekey is not None and not self.errors:
+            self.cache.store(*self._cachekey[:4], self._entry(), testmode=self._cachekey[4])
+
+    def _entry(self):
+        """everything required to restore this parse result later or in another process"""
+        return {
+            'tasks': self.tasks,
+            'logs': self.logs,
+            'settings': self.settings,
+            'usages': self._usages,
+            'nesting': self._nesting,
+            'files': self._files,
+            'dependencies': self._dependencies,
+        }
+
+    def _restore(self, entry):
+        """take over a cached parse result, return False if it cannot be used here"""
+
+        # all files, besides this one, must be new in this parse, otherwise
+        # a fresh parse would report a cycle
+        files = entry['files'][1:]
+        if any(f in self._visited for f in files):
+            return False
+        # same with the recursion limit
+        if self.context.depth - 1 + entry['nesting'] > self.context.rlimit:
+            return False
+
+        self._visited.update(files)
+        self._files = entry['files']
+        self._dependencies = entry['dependencies']
+        self._nesting = entry['nesting']
+        self.settings = entry['settings']
+        doctype = self.settings.documenttype
+        if doctype == 'pptx':
+            self.namespace = pptx_sections
+        elif doctype == 'docx':
+            self.namespace = docx_sections
+        self.logs = entry['logs']
+        self.tasks = entry['tasks']
+        # serials and addresses continue from all tasks created before
+        for task in self.tasks:
+            task.replay(self.context)
+        for key, value, source, line in entry['usages']:
+            self.errors += self._registerSetting(key, value, source, line)
+        return True
+
+    def _registerSetting(self, key, value, source, line):
+        """remember where a global setting is defined, it must be unique over all files"""
+        self._usages += [(key, value, source, line)]
+        usage = self.context.global_settings.setdefault(key, [])
+        usage.append((value, source, line))
+        if len(usage) > 1:
+            return [f'Global setting *{key} defined more than once']
+        return []
         
     def extractWork(self, firstchar, line, i):
-        tasks = []
         logs = []
         errors = []
+        tasks = list(self._work(firstchar, line, i, logs, errors))
+        return tasks, logs, errors
+
+    def _work(self, firstchar, line, i, logs, errors):
+        """yield the tasks of one line, add logs and errors to the given lists"""
 
         # "key=value" is supported
         # "key = value" may or may not work
@@ -213,9 +476,9 @@ class ReportDataFile:
                     ]
                 else:
                     if '+' in line:
-                        tasks += self.taskSplitter(root='', line=line)
+                        yield from self.taskSplitter(root='', line=line)
                     else:
-                        tasks += [ReportTask(line=line, settings=self.settings)]
+                        yield ReportTask(line=line, settings=self.settings, context=self.context)
             elif line.lower() == 'global':
                 self.updateRoot(i, line)
             else:
@@ -228,13 +491,13 @@ class ReportDataFile:
                 
                 self.updateRoot(i, line)
                 if self.settings.documenttype == 'pptx':
-                    tasks += [ReportTask(root=self._currentroot, line='=newsection:', what='copy')]
+                    yield ReportTask(root=self._currentroot, line='=newsection:', what='copy', context=self.context)
                 else:
                     # we never copy the sections
                     if len(self._currentroot) == 1:
                         pass
                     else:
-                        tasks += [ReportTask(root=self._currentroot, line='=newsection:', what='copy', ifrequired=True)]
+                        yield ReportTask(root=self._currentroot, line='=newsection:', what='copy', ifrequired=True, context=self.context)
 
             logs += [LogTask(line)]
         
@@ -248,15 +511,16 @@ class ReportDataFile:
             if '=' in line: 
                 # with new full line we create and save the task
                 if '+' in line:
-                    tasks += self.taskSplitter(root=self._currentroot, line=line[1:])
+                    yield from self.taskSplitter(root=self._currentroot, line=line[1:])
                 else:
-                    tasks += [ReportTask(root=self._currentroot, line=line[1:], settings=self.settings)]
+                    yield ReportTask(root=self._currentroot, line=line[1:], settings=self.settings,
+                                     context=self.context)
             else:
                 # enhance currentroot for multilevel roots
                 # and reset it to the correct level if any sublevel is referenced
                 # mostly for docx-files --> doc_sections['order']
                 self.updateRoot(i,line)
-                tasks += [ReportTask(root=self._currentroot,line='=newsection:', what='copy')]
+                yield ReportTask(root=self._currentroot,line='=newsection:', what='copy', context=self.context)
 
             logs += [LogTask(line)]
         
@@ -271,7 +535,7 @@ class ReportDataFile:
         ###################################################################
         elif firstchar == '+':
             # use currentmark    
-            tasks += self.taskSplitter(root=self._currentroot, line=line[1:], 
+            yield from self.taskSplitter(root=self._currentroot, line=line[1:], 
                                        what='add', where=self._currentmark)
             logs += [LogTask(line)]
         
@@ -291,7 +555,7 @@ class ReportDataFile:
                 if toinclude.lower().startswith('file'):
                     # include one file , be aware for cases in tests: C:\wherever
                     incfile = toinclude.split(':',1)[1]
-                    incfile,exists = getCorrectFile(incfile, True)
+                    incfile,exists = getCorrectFile(incfile, True, index=self.context.index)
                     if exists:
                         nfile = os.path.abspath(incfile)
                         if nfile in self._visited:
@@ -300,10 +564,13 @@ class ReportDataFile:
                             #print(self._currentroot)
                             newRdf = ReportDataFile(incfile,_root=self._currentroot,
                                                     _mark=self._currentmark, _settings=self.settings,
-                                                    _visited=self._visited)
+                                                    cache=self.cache, workers=self.workers,
+                                                    _context=self.context, _stream=self._stream,
+                                                    _keeplogs=self._keeplogs)
+                            yield from newRdf._taskSource()
                             #print(self._currentroot)
-                            ReportDataFile._depth -= 1
-                            tasks += newRdf.tasks
+                            self.context.depth -= 1
+                            self._adopt(newRdf)
                             logs += newRdf.logs
                             errors += newRdf.errors
                             # after return we need to reset currentpath and currenmark for the log!
@@ -312,28 +579,35 @@ class ReportDataFile:
                             if self._currentmark:
                                 logs += [LogTask('@'+self._currentmark)]
                     else:
+                        if self.cache is not None:
+                            self._dependencies += [fileDependency(incfile)]
                         errors += [f'&include fails to find file {incfile!r}']
                 elif toinclude.lower().startswith('loopfiles'):
                     # include several files with wildcards
                     #print(toinclude.split(':')[1][1:-1])
                     _pat = toinclude.split(':')[1]
-                    if glob.glob(_pat):
-                        _glob = glob.glob(_pat)
-                    else:
-                        _glob = glob.glob(self.settings.datadir+os.sep+_pat)
+                    _glob = expandPattern(_pat, self.settings.datadir, self.context.index)
+                    if self.cache is not None:
+                        self._dependencies += [globDependency(_pat, self.settings.datadir, _glob)]
                     if not _glob:
                         errors += [f'&include pattern {_pat!r} not found']
-                    for incfile in _glob:
+                    entries = self._parseFragments(_glob)
+                    for incfile, entry in zip(_glob, entries):
                         nfile = os.path.abspath(incfile)
                         if nfile in self._visited:
                             errors += [f'&include cycle detected: {nfile}']
                             continue
                         # glob returns only files that do exist
+                        # a fragment parsed in parallel is merged (or parsed again if it
+                        # cannot be merged) here, in glob order, like any other include
                         newRdf = ReportDataFile(incfile,_root=self._currentroot,
                                                 _mark=self._currentmark, _settings=self.settings,
-                                                _visited=self._visited)
-                        ReportDataFile._depth -= 1
-                        tasks += newRdf.tasks
+                                                cache=self.cache, workers=self.workers,
+                                                _context=self.context, _entry=entry,
+                                                _stream=self._stream, _keeplogs=self._keeplogs)
+                        yield from newRdf._taskSource()
+                        self.context.depth -= 1
+                        self._adopt(newRdf)
                         logs += newRdf.logs
                         errors += newRdf.errors
                         # after return we need to reset currentpath and currenmark for the log!
@@ -352,17 +626,14 @@ class ReportDataFile:
             key = key.strip() # although " = " is not supported
             value = value.strip()
 
-            usage = ReportDataFile._global_settings.setdefault(key, [])
-            if usage:
-                errors += [f'Global setting *{key} defined more than once']
-            usage.append((value, self.source, i+1))
+            errors += self._registerSetting(key, value, self.source, i+1)
 
             if key == 'version':
                 if int(value) < MIN_REQUIRED_VERSION:
                     errors += [
                         f'Cannot read rdf version lower than {MIN_REQUIRED_VERSION}, see line {i+1} in file {self.source!r}'
                     ]
-                    return [],[],errors
+                    return
                 if self.settings.version == 0:
                     # set only once
                     self.settings.version = int(value)
@@ -385,7 +656,7 @@ class ReportDataFile:
                 # location of pictures etc.
                 value = Path(value.replace('\\','/'))
                 #print('PATH', os.getcwd(), value)
-                if value.exists():
+                if self.context.index.exists(value):
                     self.settings.datadir = value
                     logs += [LogTask(line)]
                 else:
@@ -400,8 +671,37 @@ class ReportDataFile:
             else:
                 logs += [LogTask('Ignored entry: '+line, comment=True)]
 
-        ###################################################################
-        return tasks, logs, errors
+
+    def _parseFragments(self, files):
+        """parse the files of one &include=loopfiles: in parallel
+
+        returns one entry (see _entry) per file, None where the file has to be
+        parsed in here; each fragment is parsed on its own in a fresh ParseContext,
+        serials and addresses are assigned when merging them in order
+        """
+        if not self.workers or self.workers < 2 or len(files) < 2:
+            return [None] * len(files)
+        if self._currentroot == ['___init___']:
+            # included files become roots themselves
+            return [None] * len(files)
+        jobs = [
+            (f, self._currentroot, self._currentmark, self.settings, self.context.rlimit,
+             self.context.depth, self._testmode_, self.cache)
+            for f in files
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(files))) as pool:
+                return list(pool.map(_parseFragment, jobs))
+        except Exception as e:
+            print(f'WARNING: parallel parsing of {len(files)} files failed, parse them one by one: {e}')
+            return [None] * len(files)
+
+    def _adopt(self, included):
+        """take over the bookkeeping of an included file"""
+        self._files += included._files
+        self._dependencies += included._dependencies
+        self._usages += included._usages
+        self._nesting = max(self._nesting, included._nesting + 1)
 
     def updateRoot(self, i, line):
         """check and update whether line can be a root and is within the valid namespace
@@ -467,29 +767,29 @@ class ReportDataFile:
 
         """
         if modifier.get('what',None) == 'add':
-            elements = line.split('+') 
-            addition = elements[0].split('=') # that is the rest of the path and the content + n modifiers
+            elements = _splitActions(line)
+            addition = elements[0].split('=', 1) # that is the rest of the path and the content + n modifiers
             # all the rest in the line are somehow modifiers
             actions = {}
             for el in elements[1:]:
-                n,v = el.split('=')
-                n = n.strip()
-                actions[n] = Value(v.strip(),self.settings, target=n)
+                n,v = _action(el)
+                actions[n] = Value(v.strip(),self.settings, target=n, index=self.context.index)
             modifier['actions'] = actions
             task = [ReportTask(root=root, 
-                               line=addition[0].lower().strip()+'='+addition[1], settings=self.settings, **modifier)]    
+                               line=addition[0].lower().strip()+'='+addition[1], settings=self.settings,
+                               context=self.context, **modifier)]    
 
         else:
             path, rawvalue = line.split('=',1)
             path = path.lower().strip()
-            elements = rawvalue.split('+')
+            elements = _splitActions(rawvalue)
             actions = {}
             for el in elements[1:]:
-                n,v = el.split('=')
-                n = n.strip()
-                actions[n] = Value(v.strip(),self.settings, target=n)
+                n,v = _action(el)
+                actions[n] = Value(v.strip(),self.settings, target=n, index=self.context.index)
             modifier['actions'] = actions
-            task = [ReportTask(root=root, line=path+'='+elements[0], settings=self.settings, **modifier)]
+            task = [ReportTask(root=root, line=path+'='+elements[0], settings=self.settings,
+                               context=self.context, **modifier)]
 
         return task
 
@@ -525,14 +825,20 @@ class ReportDataFile:
             r += [t._inspect()]
         return r
 
-    def showFiles(self):
-        """cycle through tasks and show which files are missing"""
+    def showFiles(self, refresh=False):
+        """cycle through tasks and show which files are missing
+
+        refresh - read the directories again, otherwise the state of the parse is shown
+        """
+        index = self.context.index
+        if refresh:
+            index.refresh()
 
         missing = ['Missing files']
         found = ['Existing files']
         for task in self.tasks:
             if task.value.type in ['file', 'parfile']:
-                if not task.value.object.exists:
+                if not index.exists(task.value.object.filename):
                     missing += [task.value.object.filename]
                 else:
                     found += [task.value.object.filename]
@@ -540,3 +846,22 @@ class ReportDataFile:
         print('\n '.join(found))
         print('\n '.join(missing))
 
+
+def _parseFragment(job):
+    """parse one file of an &include=loopfiles: on its own, see ReportDataFile._parseFragments
+
+    returns None in case of any error, the file is then parsed again in
+    the main process to get all errors in context
+    """
+    filename, root, mark, settings, rlimit, depth, testmode, cache = job
+    ReportDataFile._testmode_ = testmode
+    context = ParseContext(rlimit=rlimit)
+    context.depth = depth
+    try:
+        rdf = ReportDataFile(filename, _root=root, _mark=mark, _settings=settings,
+                             cache=cache, _context=context)
+    except Exception:
+        return None
+    if rdf.errors:
+        return None
+    return rdf._entry()
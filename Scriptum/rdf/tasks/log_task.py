@@ -4,6 +4,8 @@
 class LogTask:
     """Log what is written to check output ordering and contents."""
 
+    __slots__ = ('fullLine',)
+
     def __init__(self, task, comment: bool = False):
         if '=' in task:
             path, value = task.split('=', 1)
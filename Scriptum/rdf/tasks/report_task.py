@@ -1,6 +1,9 @@
 """Task definitions for RDF report parsing."""
 
+import sys
+
 from ..values import Value
+from ..context import ParseContext
 
 count_string = '_c%03d'
 
@@ -8,12 +11,12 @@ count_string = '_c%03d'
 class ReportTask:
     """A task is mostly one line in a rdf file with an instruction what to do."""
 
-    # get a list of all already existing tasks to be able to get
-    # a serial and new naming in case of duplicates
-    _serial = 0
-    _tree = {}  # list of dicts of dicts of dicts...
-    _allPaths = {}
-    _newPaths = {}
+    # there are many of them, thus no __dict__; path and address are shared tuples, see ParseContext
+    __slots__ = ('serial', 'target', '_path', 'length', 'value', 'what', 'where', 'actions',
+                 'copyifrequired', 'modified', '_address', 'finaltarget')
+
+    # serial and new naming in case of duplicates are taken from
+    # all tasks created before within the same ParseContext
     _debug = False
 
     @classmethod
@@ -22,40 +25,50 @@ class ReportTask:
 
         cls._debug = bool(enabled)
 
-    def __init__(self, root=[], line: str = '', settings={}, **modifier):
+    def __init__(self, root=[], line: str = '', settings={}, *, context: ParseContext, value=None, **modifier):
         """Create a new task.
 
         Args:
             root: list of strings from _currentroot in ReportDataFile.
             line: string with the line always as 'key=value'.
             settings: dict with configuration options.
+            context: ParseContext shared by all tasks of one parse (required: serials and
+                duplicates are counted there).
+            value: an already evaluated Value, line is then 'key' only, see ReportBuilder.
             modifier: optional modifiers like what/where/actions.
         """
 
         # just a counter for each element
-        ReportTask._serial += 1
-        self.serial = ReportTask._serial
+        self.serial = context.nextSerial()
         
         #self.newPath = None
-        path, value = line.split('=', 1)
+        if value is None:
+            path, value = line.split('=', 1)
+            value = value.strip()  # value is everything behind the '='
+        else:
+            path = line
         path = path.lower().strip().split('.')  # creates a list of strings to be appended to root
 
         # target is the last element before the '='
         # never more than one target with same name in the same section!
-        self.target = path[-1]
+        self.target = sys.intern(path[-1])
         # path is usually empty or the rest between root and target
         path = path[:-1]
-        value = value.strip()  # value is everything behind the '='
 
-        self.path = root[:]  # copy
-        if path:
-            self.path += path
+        # full path including the target
+        targetPath = root + path
+        if self.target:
+            targetPath += [self.target]
+        self._path = context.sharedPath(targetPath)
 
         # required for TaskGroup class only
         self.length = 1
 
         # further evaluate value
-        self.value = Value(value, settings, target=self.target.split(':')[0])
+        if isinstance(value, Value):
+            self.value = value
+        else:
+            self.value = Value(value, settings, target=self.target.split(':')[0], index=context.index)
 
         self.what = ''
         self.where = ''
@@ -79,21 +92,17 @@ class ReportTask:
         # thus chance is high to have multiple of these inside and a
         # numbering is required. Mostly for docx
 
-        targetPath = self.path
-        if self.target:
-            targetPath += [self.target]
-
-        self.checkPath(targetPath)
+        self.checkPath(targetPath, context)
 
         #if self.path[-1] != self.myAddress[-1]:
         # define rewritten, new target
         if self.target:
             self.finaltarget = self.myAddress[-1]
 
-    def checkPath(self, targetPath):
-        """Check if that path exists already in Class._tree."""
+    def checkPath(self, targetPath, context):
+        """Check if that path exists already in context.tree."""
 
-        subtree = ReportTask._tree
+        subtree = context.tree
         rootname = []  # root
         subcount = 0
         for tp in targetPath[:-1]:
@@ -115,14 +124,19 @@ class ReportTask:
             subname, _, _ = subtree[tp]
         rootname += [subname]
 
-        self.myAddress = rootname
+        # mostly the same as the path, all others are unique anyhow
+        rootname = tuple(rootname)
+        if rootname == self._path:
+            self._address = self._path
+        else:
+            self._address = tuple(sys.intern(p) for p in rootname)
 
         # record duplicate paths
         fullpath = '.'.join(targetPath)
-        if fullpath in ReportTask._allPaths:
-            ReportTask._newPaths.setdefault(fullpath, []).append('.'.join(rootname))
+        if fullpath in context.allPaths:
+            context.newPaths.setdefault(fullpath, []).append('.'.join(rootname))
         else:
-            ReportTask._allPaths[fullpath] = '.'.join(rootname)
+            context.allPaths[fullpath] = '.'.join(rootname)
 
         if self.copyifrequired:
             # remove the copy attribute from self.what when myAdress and path are the same
@@ -130,10 +144,33 @@ class ReportTask:
             #print('difference', self.myAddress, self.path)
             # we have to check only the last element as the intermediate element should have been added anyhow?
             # @TODO verify that nothing is lost in complex structures
-            if self.myAddress[-1] == self.path[-1]:
+            if self._address[-1] == self._path[-1]:
                 if self.what == 'copy':
                     self.what = 'apply'
 
+    def replay(self, context):
+        """register a task restored from a cache as if it was created just now
+
+        serial and address (e.g. the _c002 of duplicates) depend on all tasks created before,
+        thus both are evaluated once again
+        """
+        self.serial = context.nextSerial()
+
+        # undo a previous 'copy' -> 'apply' decision, see checkPath
+        if self.copyifrequired and self.what == 'apply':
+            self.what = 'copy'
+
+        # self.path already ends with the target
+        self._path = context.sharedPath(self._path)
+        self.checkPath(self._path, context)
+        if self.target:
+            self.finaltarget = self.myAddress[-1]
+
+        # files may have been created or removed since
+        self.value.refresh(context.index)
+        for action in self.actions.values():
+            action.refresh(context.index)
+
     def __repr__(self) -> str:
         rval = '   ' + '.'.join(self.path) + ' = ' + self.value.__repr__()
         if self.modified:
@@ -165,6 +202,24 @@ class ReportTask:
 
         return r
 
+    @property
+    def path(self):
+        """root, the rest of the path and the target as list"""
+        return list(self._path)
+
+    @path.setter
+    def path(self, value):
+        self._path = tuple(sys.intern(p) for p in value)
+
+    @property
+    def myAddress(self):
+        """path with the names of the duplicates (_c002...) as list"""
+        return list(self._address)
+
+    @myAddress.setter
+    def myAddress(self, value):
+        self._address = tuple(sys.intern(p) for p in value)
+
     @property
     def getPath(self):
         #if self.newPath:
@@ -8,7 +8,7 @@ from .date_value import DateValue
 from .file_value import FileValue
 from .length_value import LengthValue
 from .number_value import NumberValue, FloatValue, IntegerValue
-from .image_value import ImageValue, AnimationValue
+from .image_value import ImageValue, AnimationValue, ImageMetadata
 from .namevalues_value import NameValue
 from .text_value import TextValue, StringValue
 from .table_value import TableValue, Table
@@ -28,6 +28,7 @@ __all__ = [
     'StringValue',
     'ImageValue',
     'AnimationValue',
+    'ImageMetadata',
     'NameValue',
     'ColorValue',
     ]
@@ -1,6 +1,7 @@
 """Base Value implementation and dispatch helpers."""
 
 import os
+import re
 
 #from .. import common
 #from ..common import removeQuotes
@@ -17,12 +18,95 @@ from .color_value import ColorValue
 from .image_value import ImageValue, AnimationValue
 from .namevalues_value import NameValue
 
-from ..common import getCorrectFile, removeQuotes, is_test_debug
+from ..common import getCorrectFile, removeQuotes
+
+# numbers and lengths as written in RDF files: 42, -3, 1.5, .5, 2e-3, 12.3cm, 15 pt
+_LITERAL = re.compile(r"""
+    \s*(?P<number>[+-]?(?:\d+(?P<fraction>\.\d*)?|(?P<point>\.)\d+)(?P<exponent>[eE][+-]?\d+)?)
+    \s*(?P<unit>cm|mm|in|pt)?\s*
+    """, re.VERBOSE | re.IGNORECASE)
+_LENGTHUNITS = ('cm', 'mm', 'in', 'pt')
+
+
+def _fileValue(self, value, lvalue, settings, target, index):
+    # all kind of file-types
+    self.type = 'file'
+    filename = removeQuotes(value[5:].strip())
+    #print(filename, settings.datadir, os.curdir)
+    filename, _exists = getCorrectFile(filename, False, settings.datadir, index)
+
+    if target == 'image' or target == 'image:poster': # strange, should be 'image' only
+        self.object = ImageValue(filename, _exists)
+    elif target == 'text':
+        self.object = TextValue(filename, _exists)
+    elif target == 'video':
+        self.object = AnimationValue(filename, _exists)
+    elif target == 'table':
+        self.object = TableValue(filename, _exists, settings)
+    else:
+        # generic - should lead to error handling only?
+        self.object = FileValue(filename, _exists)
+
+    self.subtype = self.object.subtype
+    self.tostring = False
+
+
+def _parfileValue(self, value, lvalue, settings, target, index):
+    # special type of a parameterfile
+    self.type = 'parfile'
+    restvalue = value[8:]
+    _v = restvalue.split(':')
+    parname = _v[-1]
+    filename = removeQuotes(restvalue[:-(len(parname)+1)])
+    filename, _exists = getCorrectFile(filename, False, settings.datadir, index)
+    if target == 'table':
+        # an array of the parameter file as table
+        self.object = TableValue(filename, _exists, settings, parameter=parname)
+    else:
+        self.object = NameValue(filename, _exists, settings, parname)
+    self.subtype = self.object.subtype
+    self.tostring = False
+
+
+def _newsectionValue(self, value, lvalue, settings, target, index):
+    # this will be automatically created for new section definitions
+    self.type = 'newsection'
+    self.object = ''
+    self.tostring = False
+
+
+def _dateValue(self, value, lvalue, settings, target, index):
+    # date and or time value
+    self.type = 'datetime'
+    v = value.split(':', 1)[1]
+    self.object = DateValue(v, settings)
+    self.tostring = True
+
+
+def _numberingValue(self, value, lvalue, settings, target, index):
+    # numbering for sections, counters etc
+    self.type = 'numbering'
+    self.object = NumberValue(value[10:])
+    self.tostring = True
+
+
+# prefix (in front of the first ':') -> what kind of value
+_PREFIXES = {
+    'file': _fileValue,
+    'parfile': _parfileValue,
+    'newsection': _newsectionValue,
+    'date': _dateValue,
+    'numbering': _numberingValue,
+}
+
 
 class Value:
     """Store the value with all arguments."""
 
-    def __init__(self, value: str, settings, target=None):
+    __slots__ = ('type', 'object', 'subtype', 'tostring', 'content')
+
+    def __init__(self, value: str, settings, target=None, index=None):
+        """index - optional FileIndex to look for files"""
         lvalue = value.lower()
         self.type = 'unknown'
         self.object = None
@@ -30,41 +114,11 @@ class Value:
         self.tostring = None
         self.content = None
 
-        if lvalue.startswith('file:'):
-            # all kind of file-types
-            self.type = 'file'
-            filename = removeQuotes(value[5:].strip())
-            #print(filename, settings.datadir, os.curdir)
-            filename, _exists = getCorrectFile(filename, False, settings.datadir)
-
-            if target == 'image' or target == 'image:poster': # strange, should be 'image' only
-                self.object = ImageValue(filename, _exists)
-            elif target == 'text':
-                self.object = TextValue(filename, _exists)
-            elif target == 'video':
-                self.object = AnimationValue(filename, _exists)
-            elif target == 'table':
-                self.object = TableValue(filename, _exists, settings)
-            else:
-                # generic - should lead to error handling only?
-                self.object = FileValue(filename, _exists)
-            
-            self.subtype = self.object.subtype
-            self.tostring = False
-
-        elif lvalue.startswith('parfile:'):
-            # special type of a parameterfile
-            self.type = 'parfile'
-            restvalue = value[8:]
-            _v = restvalue.split(':')
-            parname = _v[-1]
-            filename = removeQuotes(restvalue[:-(len(parname)+1)])
-            filename, _exists = getCorrectFile(filename, False, settings.datadir)
-            self.object = NameValue(filename, _exists, settings, parname)
-            self.subtype = self.object.subtype
-            self.tostring = False
+        prefix, colon, _ = lvalue.partition(':')
+        if colon and prefix in _PREFIXES:
+            _PREFIXES[prefix](self, value, lvalue, settings, target, index)
 
-        elif (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
+        elif value[:1] in ('"', "'") and value.endswith(value[0]):
             # quoted string
             self.type = 'str'
             self.object = StringValue(value[1:-1].replace('\\n', '\n'))
@@ -77,27 +131,22 @@ class Value:
             self.object = lvalue[1:]
             self.tostring = False
 
-        elif lvalue.startswith('newsection:'):
-            # this will be automatically created for new section definitions
-            self.type = 'newsection'
-            self.object = ''
-            self.tostring = False
-
-        elif lvalue.startswith('date:'):
-            # date and or time value
-            self.type = 'datetime'
-            v = value.split(':', 1)[1]
-            self.object = DateValue(v, settings)
-            self.tostring = True
-
-        elif lvalue.startswith('numbering:'):
-            # numbering for sections, counters etc
-            self.type = 'numbering'
-            self.object = NumberValue(value[10:])
+        elif (literal := _LITERAL.fullmatch(value)) and (literal['unit'] or target != 'color'):
+            if literal['unit']:
+                # length value
+                self.type = 'length'
+                self.object = LengthValue(value.strip())
+                self.object.floatformat = settings.floatformat
+            elif literal['fraction'] is not None or literal['point'] or literal['exponent']:
+                self.type = 'float'
+                self.object = FloatValue(float(literal['number']), settings)
+            else:
+                self.type = 'int'
+                self.object = IntegerValue(int(literal['number']))
             self.tostring = True
 
-        elif value[-2:].lower() in ['cm', 'mm', 'in', 'pt']:
-            # length value
+        elif lvalue[-2:] in _LENGTHUNITS:
+            # length value, but the number is broken: LengthValue tells why
             self.type = 'length'
             self.object = LengthValue(value)
             self.object.floatformat = settings.floatformat
@@ -110,23 +159,67 @@ class Value:
             self.tostring = False
 
         else:
-            # either integer or float or error
-            try:
-                v = eval(value)
-                if type(v) == int:
-                    self.type = 'int'
-                    self.object = IntegerValue(v)
-                elif type(v) == float:
-                    self.type = 'float'
-                    self.object = FloatValue(v, settings)
-                self.tostring = True
+            self.type = 'invalid'
+            if value[:1].isdigit():
+                self.object = f'invalid decimal literal: {value}'
+            else:
+                self.object = f'neither a number nor a known value: {value}'
+            self.tostring = True
 
-            except Exception as e:
-                self.type = 'invalid'
-                self.object = f'{e}: {value}'
-                if not is_test_debug:
-                    print(f'invalid {value!r} {lvalue!r}')
+    @classmethod
+    def of(cls, obj, settings, target=None, index=None):
+        """a Value from a python object instead of a line in a RDF file
+
+        - Value: taken as is
+        - int, float: number
+        - str: read like the text behind the '=' in a RDF file ('1cm', 'date:now', "'text'"...),
+               however, anything that is no valid RDF value there (e.g. 'Again', not a length)
+               is plain text here
+        """
+        if isinstance(obj, Value):
+            return obj
+        if isinstance(obj, bool) or not isinstance(obj, (int, float, str)):
+            raise TypeError(f'cannot use {obj!r} as value of {target!r}')
+        self = cls.__new__(cls)
+        self.subtype = None
+        self.content = None
+        self.tostring = True
+        if isinstance(obj, int):
+            self.type = 'int'
+            self.object = IntegerValue(obj)
+        elif isinstance(obj, float):
+            self.type = 'float'
+            self.object = FloatValue(obj, settings)
+        else:
+            self.__init__(obj, settings, target, index)
+            if self.type == 'invalid' or (self.type == 'length' and isinstance(self.object.value, str)):
+                self.type = 'str'
+                self.object = StringValue(obj)
                 self.tostring = True
+        return self
+
+    @classmethod
+    def fromFile(cls, filename, settings, target=None, index=None):
+        """same as 'file:filename' in a RDF file"""
+        self = cls.__new__(cls)
+        self.type = 'unknown'
+        self.object = None
+        self.subtype = None
+        self.tostring = None
+        self.content = None
+        _fileValue(self, 'file:' + str(filename), None, settings, target, index)
+        return self
+
+    def refresh(self, index=None):
+        """bring a value restored from a cache up to date
+
+        recheck whether the file behind a file-backed value (still) exists
+        and evaluate date:now or date:today again"""
+        if self.type in ['file', 'parfile']:
+            exists = index.exists if index is not None else os.path.exists
+            self.object.exists = exists(self.object.filename)
+        elif self.type == 'datetime':
+            self.object.refresh()
 
     def applyActions(self, actions):
         if hasattr(self.object,'applyActions'):
@@ -60,6 +60,9 @@ class DateValue:
     """
     def __init__(self, v: str, settings={}):
         
+        # now and today depend on the moment of parsing, see refresh()
+        self.volatile = v.startswith('now') or v.startswith('today')
+
         if v.startswith('now'):
             v = v.replace('now', '', 1)
             if v.startswith(':') and len(v) > 1:
@@ -148,6 +151,12 @@ class DateValue:
         self.value = value
         self.dt = dt
 
+    def refresh(self):
+        """evaluate now and today once again, e.g. when restored from a cache"""
+        if self.volatile:
+            self.dt = datetime.now()
+            self.value = self.dt.strftime(self.format)
+
     @property
     def content(self):
         return str(self)
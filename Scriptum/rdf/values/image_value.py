@@ -9,29 +9,81 @@
 
 from PIL import Image
 
+from ..contentcache import contentCache
+
+class ImageMetadata:
+    """what is known from the header of an image, no pixels and no open file"""
+
+    __slots__ = ('format', 'mode', 'size', 'dpi')
+
+    def __init__(self, format=None, mode=None, size=(-1, -1), dpi=None):
+        self.format = format
+        self.mode = mode
+        self.size = tuple(size)
+        self.dpi = dpi
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    def __repr__(self) -> str:
+        return f'ImageMetadata({self.format}, {self.mode}, size={self.size}, dpi={self.dpi})'
+
+
+def probeImage(filename) -> ImageMetadata:
+    """read the header of an image and close the file again
+
+    PIL reads the pixels only when they are used, thus nothing is decoded here
+    """
+    image = Image.open(filename)
+    try:
+        dpi = getattr(image, 'info', {}).get('dpi', None)
+        return ImageMetadata(getattr(image, 'format', None), getattr(image, 'mode', None),
+                             image.size, tuple(dpi) if dpi else None)
+    finally:
+        if hasattr(image, 'close'):
+            image.close()
+
+
 class ImageValue:
-    """from task to content used in elements etc."""
+    """from task to content used in elements etc.
+
+    content is the ImageMetadata (size, dpi...) of the image, the file is closed
+    afterwards; open() gives the image itself if the pixels are required
+    """
     def __init__(self, filename: str, exists: bool):
         self.subtype = 'image' 
         self.filename = filename
         self.exists = exists
         self.width = -1
         self.height = -1
+        self.dpi = None
         self._parsed = None
 
     @property
     def content(self):
         if self.exists:
             if not self._parsed:
-                self._parsed = content = Image.open(self.filename)
+                # the header is shared by all values of this file
+                self._parsed = content = contentCache.get(
+                    'image', self.filename, (), lambda: probeImage(self.filename))
             else:
                 content = self._parsed
             self.width, self.height = content.size
+            self.dpi = content.dpi
             
             return content
         else:
             return str(self)
 
+    def open(self):
+        """the PIL image to work on its pixels, to be closed by the caller (with ...)"""
+        return Image.open(self.filename)
+
     def __str__(self) -> str:
         if self.exists:
             return f'image from file: {self.filename!r}'
@@ -4,8 +4,18 @@
 #   S C R I P T U M 
 #
 
+import contextlib
+import mmap
+import os
+import re
 from datetime import datetime
 from ..common import removeQuotes
+from ..contentcache import CELL_BYTES, contentCache
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # optional: arrays are nested lists then
+    np = None
 
 class NameValue:
     """from task.value to content used in elements etc.
@@ -18,6 +28,9 @@ class NameValue:
     parameter to look for:value
 
     we are interested in the "value" to be extracted and used at position
+
+    arrays (name[0]:..., name[1,2]:...) are given as a whole by their name,
+    an element by its subscripts: parfile:somefile.nv:name[1,2]
     """
     def __init__(self, filename, exists, settings, parname):
         self.subtype = 'parameterfile'
@@ -30,15 +43,23 @@ class NameValue:
         self._parsed = False
            
     @property
-    def content(self):
+    def reader(self):
+        """the NameValueReader of the file, shared by all its parameters"""
         if not self._parsed:
-            self._raw_content = NameValueReader(self)
+            self._raw_content = contentCache.get(
+                'nv', self.filename, (self.exists, self.separator, self.datetimeformat),
+                lambda: NameValueReader(self))
             self._parsed = True
+        return self._raw_content
+
+    @property
+    def content(self):
+        self.reader
         #print(self.parameter, str(self._raw_content))
-        return self._raw_content.parsed.get(
-            self.parameter.lower().replace(' ', ''),
-            f'Not found: {self.parameter!r}'
-        )
+        if not self._raw_content.exists:
+            return f'file does not exist {self.filename!r}'
+        # only this parameter is read and converted
+        return self._raw_content.get(self.parameter, f'Not found: {self.parameter!r}')
 
     def __repr__(self) -> str:
         if self.parameter:
@@ -64,110 +85,159 @@ class NameValueReader:
     """store and handle full file content
     usually not used directly but in tests
     
-    class to manage files with name:value content"""
+    class to manage files with name:value content
+
+    the file is scanned once for the names (memory-mapped beyond MMAP_SIZE),
+    a value is read and converted when it is asked for (get, []); a large file is
+    not kept: its values are read at their offsets, the file is open meanwhile only
+    parsed, unparsed, names... convert all of them at once
+
+    name[i]:..., name[i,j]:... are the elements of an array: get('name') is the
+    array (NumPy if available, nested lists otherwise), get('name[i,j]') one element"""
     def __init__(self, nvobject):
         self.filename = nvobject.filename
         self.timeformat = nvobject.datetimeformat
+        self._values = {}
+        self._arrays = {}
+        self._full = None
         
         if nvobject.exists:
             self.exists = True
-            self.raw_content = _readRawNVfile(self.filename, nvobject.separator)
-            self.names = dict([ (name.replace(' ','').lower(), name) for name, value in self.raw_content ])
-            self.unparsed = dict([ (name.replace(' ','').lower(), value) for name, value in self.raw_content ])
-            self.parsed = {}
-            self.full_to_parsed = dict([ (k,k) for k in self.unparsed.keys() ])
-            
-            self.parseCommon()
-            
-            self.parseTimes()
-                
-            self.parseJobDiagnostics()
-
-            self.parseRest()
+            buffer = _openNVfile(self.filename)
+            self._index, self._elements = _indexNVfile(buffer, nvobject.separator)
+            if isinstance(buffer, mmap.mmap):
+                # readers stay in the cache, a map would keep the file open
+                buffer.close()
+                buffer = None
+            self._buffer = buffer
+            if not self._index and not self._elements:
+                print(f"{self.filename} is empty or does not contain separator '{nvobject.separator}'")
         else:
             self.exists = False
 
+    @contextlib.contextmanager
+    def _reading(self):
+        """read(start, end) for the bytes of the file there, the file is open inside only"""
+        if self._buffer is not None:
+            yield lambda start, end: self._buffer[start:end]
+            return
+        with open(self.filename, 'rb') as f:
+            def read(start, end):
+                f.seek(start)
+                return f.read(end - start)
+            yield read
 
-    def parseTimes(self):
-        del_keys = []
-        for key, value in self.unparsed.items():
-            tv = strToTime(value)
-            if tv:
-                self.parsed[key] = tv.strftime(self.timeformat)
-                del_keys += [key]
-        for key in del_keys:
-            del self.unparsed[key]
-    
-    def parseCommon(self):
-        """parse common identifiers"""
-        ids = ['title','name','createdfrom','revision','description']
-        del_keys = []
-        for key, value in self.unparsed.items():
-            for element in ids:
-                if key.startswith(element) or key.endswith(element):
-                    self.parsed[key] = value
-                    del_keys += [key]
-        for key in del_keys:
-            del self.unparsed[key]
-            
-    def parseJobDiagnostics(self):
-        """parse special identifiers
-        maybe user removed 'jobdiagnosticssummary'?
-        however: we remove it here"""
-        del_keys = []
-        for key, value in self.unparsed.items():
-            nkey = key.replace('_jobdiagnosticsummary_1','')
-            if key.startswith('numberof'):
-                self.parsed[nkey] = int(value)
-                self.full_to_parsed[key] = nkey
-                del_keys += [key]
-            elif key.startswith('wallclocktime'):
-                self.parsed[nkey] = float(value)
-                self.full_to_parsed[key] = nkey
-                del_keys += [key]
-
-        for key in del_keys:
-            del self.unparsed[key]
-    
-    def parseRest(self):
-        """parse all remaining and do what you can"""
-        del_keys = []
-        for key, value in self.unparsed.items():
+    @property
+    def nbytes(self):
+        """about the memory kept by the reader, see ContentCache"""
+        if not self.exists:
+            return 0
+        entries = len(self._index) + sum(len(e) for _name, e in self._elements.values())
+        arrays = sum(getattr(a, 'nbytes', CELL_BYTES * len(a)) for a in self._arrays.values())
+        return len(self._buffer or b'') + CELL_BYTES * (entries + len(self._values)) + arrays
+
+    def _raw(self, key, read=None):
+        """the text of the value of key (condensed name) as written in the file"""
+        _name, start, end, multiline = self._index[key]
+        return self._text(start, end, multiline, read)
+
+    def _text(self, start, end, multiline=False, read=None):
+        if read is None:
+            with self._reading() as read:
+                return self._text(start, end, multiline, read)
+        value = bytes(read(start, end)).decode('utf-8', errors='replace')
+        if multiline:
+            value = value.replace('\r\n', '\n')[1:-1]
+        return value
+
+    def _parse(self, key, read=None):
+        """(key used in parsed, value) of key converted as by the full parse"""
+        if key not in self._values:
+            self._values[key] = _parseNV(key, self._raw(key, read), self.timeformat)
+        return self._values[key]
+
+    def _lookup(self, key):
+        """the key in the file for a condensed key, None if there is none"""
+        if key in self._index:
+            return key
+        # job diagnostics are known without their suffix as well
+        if key.startswith(_DIAGNOSTICS) and (full := key + _JOBSUFFIX) in self._index:
+            return full
+        return None
+
+    def get(self, key, default=None):
+        """the converted value of parameter key (spaces and case do not matter), parsed once"""
+        if not self.exists:
+            return default
+        key = key.replace(' ','').lower()
+        full = self._lookup(key)
+        if full is not None:
+            return self._parse(full)[1]
+        if key in self._elements:
             try:
-                value = int(value)
-            except:
-                try:
-                    value = float(value)
-                except:
-                    if v := strToTime(value):
-                        value = v.strftime(self.timeformat)
-                    else:
-                        pass
-            self.parsed[key] = value
-            self.full_to_parsed[key] = key
-            del_keys += [key]
-
-        for key in del_keys:
-            del self.unparsed[key] 
+                return self.array(key)
+            except ValueError as e:
+                return f'cannot read array {key!r} in {self.filename!r}: {e}'
+        if (element := _ARRAYKEY.fullmatch(key)) and element[1] in self._elements:
+            entry = self._elements[element[1]][1].get(_subscripts(element[2]), None)
+            return default if entry is None else _number(self._text(*entry))
+        return default
+
+    def array(self, key):
+        """all elements of array key (condensed name), missing ones are NaN or empty"""
+        if key not in self._arrays:
+            _name, entries = self._elements[key]
+            with self._reading() as read:
+                self._arrays[key] = _array({s: _number(self._text(*e, read=read)) for s, e in entries.items()})
+        return self._arrays[key]
+
+    def _parseAll(self):
+        if self._full is None:
+            parsed = {}
+            full_to_parsed = {}
+            with self._reading() as read:
+                for key in self._index:
+                    nkey, value = self._parse(key, read)
+                    parsed[nkey] = value
+                    full_to_parsed[key] = nkey
+            for key in self._elements:
+                parsed[key] = self.array(key)
+                full_to_parsed[key] = key
+            self._full = parsed, full_to_parsed
+        return self._full
+
+    @property
+    def parsed(self):
+        return self._parseAll()[0]
+
+    @property
+    def full_to_parsed(self):
+        return self._parseAll()[1]
+
+    @property
+    def unparsed(self):
+        # everything is converted by the full parse
+        self._parseAll()
+        return {}
+
+    @property
+    def names(self):
+        names = {key: entry[0] for key, entry in self._elements.items()}
+        names.update((key, entry[0]) for key, entry in self._index.items())
+        return names
+
+    @property
+    def raw_content(self):
+        with self._reading() as read:
+            return [(entry[0], self._raw(key, read)) for key, entry in self._index.items()]
 
     def __getitem__(self,key):
         
         if not self.exists:
             return f'file does not exist {self.filename!r}'
         else:
-            lkey = key.replace(' ','').lower()
-            try:
-                nkey = self.full_to_parsed[lkey]
-                return self.parsed[nkey]
-            except:
-                try:
-                    return self.parsed[lkey]
-                except:
-                    try:
-                        return self.unparsed[lkey]
-                    except:
-                        # always return something meaningful, exceptions are hard to catch in a process
-                        return f'KeyError in file {self.filename!r} - {key}'
+            # always return something meaningful, exceptions are hard to catch in a process
+            return self.get(key, f'KeyError in file {self.filename!r} - {key}')
     
     def bracket(self,condensed=True, all=True):
         """put everything in brackets, keep condensed/lowered keys
@@ -175,15 +245,11 @@ class NameValueReader:
         which isn't the case"""
         
         result = {}
+        names = self.names
         for key, value in self.parsed.items():
             if not condensed:
-                key = self.names[key]
+                key = names.get(key, key)
             result[f'<{key}>'] = value
-        if all: # add the rest as well
-            for key, value in self.unparsed.items():
-                if not condensed:
-                    key = self.names[key]
-                result[f'<{key}>'] = value
         return result
     
     def translate(self,how={}):
@@ -191,7 +257,7 @@ class NameValueReader:
         result = {}
         # do that for all and for the condensed names only
         for key, nkey in how.items():
-            value = self.parsed.get(key,self.unparsed.get(key,None))
+            value = self.get(key)
             if value:
                 result[nkey] = value
         return result      
@@ -202,6 +268,146 @@ class NameValueReader:
             r += [f" {n} = {v} {type(v)}"]
         return '\n'.join(r)      
 
+
+# names kept as they are, see _parseNV
+_COMMON = ('title','name','createdfrom','revision','description')
+# job diagnostics: int or float, known without _JOBSUFFIX as well
+_DIAGNOSTICS = ('numberof', 'wallclocktime')
+_JOBSUFFIX = '_jobdiagnosticsummary_1'
+# files from this size on are memory-mapped
+MMAP_SIZE = 1 << 20
+# an element of an array (condensed): name[1] or name[1,2]
+_ARRAYKEY = re.compile(r'(.+)\[(\d+(?:,\d+)*)\]')
+
+
+def _subscripts(text):
+    return tuple(int(i) for i in text.split(','))
+
+
+def _number(value):
+    """an element of an array: int, float or the text"""
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value.strip()
+
+
+def _array(elements):
+    """{subscripts: value} as array: NumPy if available, nested lists otherwise
+
+    missing elements are NaN (numbers) or empty (text)"""
+    ndims = {len(s) for s in elements}
+    if len(ndims) != 1:
+        raise ValueError(f'array elements with {sorted(ndims)} subscripts')
+    shape = tuple(max(s[d] for s in elements) + 1 for d in range(ndims.pop()))
+    numbers = all(isinstance(v, (int, float)) for v in elements.values())
+    size = 1
+    for n in shape:
+        size *= n
+    # int if all are there and all are int, float otherwise (NaN for the missing ones)
+    ints = numbers and len(elements) == size and all(isinstance(v, int) for v in elements.values())
+    if np is not None and numbers:
+        array = np.full(shape, 0 if ints else np.nan, dtype=int if ints else float)
+        for s, v in elements.items():
+            array[s] = v
+        return array
+    if numbers and not ints:
+        elements = {s: float(v) for s, v in elements.items()}
+    array = _nested(shape, float('nan') if numbers else '')
+    for s, v in elements.items():
+        row = array
+        for i in s[:-1]:
+            row = row[i]
+        row[s[-1]] = v
+    return array if np is None else np.array(array)
+
+
+def _nested(shape, fill):
+    if len(shape) == 1:
+        return [fill] * shape[0]
+    return [_nested(shape[1:], fill) for _ in range(shape[0])]
+
+
+def _parseNV(key, value, timeformat):
+    """(key used in parsed, value) of one parameter:
+    common identifiers stay text, timestamps become times, job diagnostics
+    int or float, all others int, float or text"""
+    if any(key.startswith(element) or key.endswith(element) for element in _COMMON):
+        return key, value
+    if tv := strToTime(value):
+        return key, tv.strftime(timeformat)
+    nkey = key.replace(_JOBSUFFIX,'')
+    try:
+        if key.startswith('numberof'):
+            return nkey, int(value)
+        if key.startswith('wallclocktime'):
+            return nkey, float(value)
+    except ValueError:
+        pass
+    try:
+        return key, int(value)
+    except ValueError:
+        try:
+            return key, float(value)
+        except ValueError:
+            return key, value
+
+
+def _openNVfile(filename):
+    """the bytes of filename, memory-mapped if it is large"""
+    with open(filename, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_SIZE:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _indexNVfile(buffer, separator=':', ticks="'"):
+    """one pass over the lines (as _readRawNVfile) for the names and where the values are
+
+    returns
+    - {condensed name: (name, start, end, multiline)}
+    - {condensed array name: (name, {subscripts: (start, end)})} of name[i,j]:value lines
+
+    start and end are the offsets of the value in buffer, a multiline value
+    still has its ticks; the last of equal names counts"""
+    separator = separator.encode('utf-8')
+    ticks = ticks.encode('utf-8')
+    index = {}
+    elements = {}
+    opened = None
+    pos, size = 0, len(buffer)
+    while pos < size:
+        end = buffer.find(b'\n', pos)
+        if end < 0:
+            end = size
+        stop = end - 1 if end > pos and buffer[end-1] == 13 else end  # without \r
+        line = buffer[pos:stop]
+        if opened is None:
+            if separator in line and not (line.startswith(b'#') or not line.strip()):
+                i = line.index(separator)
+                v = line[i+len(separator):]
+                name = line[:i].decode('utf-8', errors='replace')
+                if b'[' in line:
+                    # an array value, anything else with brackets is ignored
+                    if element := _ARRAYKEY.fullmatch(name.replace(' ','').lower()):
+                        base = name[:name.index('[')].strip()
+                        entries = elements.setdefault(element[1], (base, {}))[1]
+                        entries[_subscripts(element[2])] = (pos+i+len(separator), stop)
+                elif v.count(ticks) == 0 or (v.startswith(ticks) and v.endswith(ticks)):
+                    index[name.replace(' ','').lower()] = (name, pos+i+len(separator), stop, False)
+                else:
+                    opened = (name, pos+i+len(separator))
+        elif line.endswith(ticks):
+            name, start = opened
+            index[name.replace(' ','').lower()] = (name, start, stop, True)
+            opened = None
+        pos = end + 1
+    return index, elements
+
+
 def _readRawNVfile(filename, separator=':',ticks="'"):
     """read and 'normalize' content, the file parser adapter is a...
     no empty lines or comments but in multiline strings!
@@ -210,7 +416,7 @@ def _readRawNVfile(filename, separator=':',ticks="'"):
     other:2
     #foo:'bar'
 
-    @TODO: how to handle this case:
+    array values are skipped here, NameValueReader reads them (see _indexNVfile):
     str2[0]=hallo
     str2[1]=welt
     str1=hallo
@@ -4,7 +4,23 @@
 #   S C R I P T U M 
 #
 
-import csv, types
+import collections, csv, heapq, itertools, operator, os, re, struct, types, zipfile
+
+from ..contentcache import CELL_BYTES, contentCache
+from ..connections import connectionPool
+from .namevalues_value import NameValue
+
+try:
+    import numpy as np
+except ModuleNotFoundError:  # optional: formatting of float columns is done in python then
+    np = None
+
+# what int() takes as well, these cells stay int in a column of floats
+_INT = re.compile(r'[+-]?\d+(?:_\d+)*')
+# float formats that printf (numpy.char.mod) writes the same way as str.format
+_PRINTF = re.compile(r'[+ 0#]*\d*(?:\.\d+)?[eEfFgG]')
+# actions choosing rows and columns of a CSV table while it is read, see _Selection
+_SELECTION = ('where', 'sort', 'desc', 'limit', 'columns')
 
 class TableValue:
     """always use this class to open the table and provide its content
@@ -12,18 +28,23 @@ class TableValue:
     manages all kind of tables
     
     - csv: csv type
+    - npy, npz: NumPy arrays, one array of a .npz is selected by +key='name'
+    - sqlite, sqlite3, db: SQLite database, the rows of +query='select ...'
+    - nv: an array in a parameter file (parfile:somefile.nv:name)
     - ... further types to be defined
 
     .position.table:generic=file:somefile.csv
 
     """
-    def __init__(self, filename, exists, settings):
+    def __init__(self, filename, exists, settings, parameter=None):
 
         self.subtype = 'table'
         self.separator = settings.csvseparator
         self.floatformat = settings.floatformat
         self.filename = filename
         self.exists = exists
+        # an array of a parameter file, read by the same reader as its other parameters
+        self.parameter = None if parameter is None else NameValue(filename, exists, settings, parameter)
         #self.data = []
         #self.cols=0
         #self.rows=0
@@ -43,7 +64,28 @@ class TableValue:
     @property
     def content(self):
         if not self._parsed:
-            self._raw_content = Table(self, self.actions, dataSource='CSV')
+            # the description may take a row out of the table, thus it is part of the key
+            description = self.actions.get('description', None)
+            if description is not None:
+                description = (description.type, str(description.object))
+            dataSource = 'NV' if self.parameter is not None else _dataSource(self.filename)
+            params = (self.exists, self.separator, self.floatformat, description,
+                      tuple((n, str(self.actions[n].object)) for n in _SELECTION if n in self.actions))
+            if dataSource == 'NPY':
+                # the header may come from a sidecar file, a new one is read again
+                key = _key(self.actions)
+                header = _sidecar(self.filename, key)
+                params += (key, _stamp(header))
+            elif dataSource == 'SQL':
+                params += (_query(self.actions),)
+            elif dataSource == 'NV':
+                params += (self.parameter.parameter, self.parameter.separator)
+            self._raw_content = contentCache.get(
+                dataSource.lower(), self.filename, params,
+                lambda: Table(self, self.actions, dataSource=dataSource))
+            if 'description' in self.actions:
+                # as if it was read here, see CSVTable
+                self.actions['description'] = self._raw_content.caption or ''
             self._parsed = True
         return self._raw_content
         
@@ -53,25 +95,68 @@ class TableValue:
 
 class Table: 
     """wrapper for all the table types below but used as a type elsewhere
-    
-    
+
+    the content is kept by columns:
+    - columns: one list per column, numbers are int or formatted by *floatformat
+    - data: the same as list of rows, created when used
+    - iterRows(): the rows one by one without creating data (a query streams them)
+    - array(j): the numbers of column j (without a header), None if it has text
     """
     def __init__(self, object: TableValue, actions: dict = {}, dataSource: str = 'CSV'):
         if dataSource == 'CSV':
             _raw_content = CSVTable(object, actions)
+        elif dataSource == 'NPY':
+            _raw_content = NPYTable(object, actions)
+        elif dataSource == 'SQL':
+            _raw_content = SQLTable(object, actions)
+        elif dataSource == 'NV':
+            _raw_content = NVTable(object, actions)
         else:
-            _raw_content = types.ClassType('UnknownTable')
-            _raw_content.caption = 'unknown/not implemented TableType'
-            _raw_content.data = []
-            _raw_content.rows = 0
-            _raw_content.cols = 0
+            _raw_content = types.SimpleNamespace(
+                caption='unknown/not implemented TableType', columns=[], arrays={}, rows=0, cols=0)
 
         self.exists = object.exists
         self.filename = object.filename
         self.caption = _raw_content.caption
-        self.rows = _raw_content.rows
         self.cols = _raw_content.cols
-        self.data = _raw_content.data
+        self._source = _raw_content
+        self._data = None
+
+    @property
+    def rows(self):
+        return self._source.rows
+
+    @property
+    def columns(self):
+        return self._source.columns
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = [list(r) for r in self.iterRows()]
+        return self._data
+
+    def iterRows(self):
+        rows = getattr(self._source, 'iterRows', None)
+        return rows() if rows is not None else zip(*self.columns)
+
+    def column(self, j):
+        return self.columns[j]
+
+    def array(self, j):
+        return self._source.arrays.get(j, None)
+
+    @property
+    def nbytes(self):
+        """about the memory kept by the table, see ContentCache"""
+        source = self._source
+        if isinstance(source, SQLTable):
+            # streamed, only what was read as a whole stays
+            columns, arrays = source._columns or [], source._arrays or {}
+        else:
+            columns, arrays = source.columns, source.arrays
+        cells = sum(len(c) for c in columns)
+        return CELL_BYTES * cells + sum(getattr(a, 'nbytes', CELL_BYTES * len(a)) for a in arrays.values())
 
 class CSVTable:
     """try to read a CSV-file
@@ -79,24 +164,40 @@ class CSVTable:
     and replaced by a "insert" and the content
 
     @row can be used with 'description' only for now
+
+    where, sort, desc, limit and columns choose the rows and columns while the
+    file is read (see _Selection), only those are kept in memory
     
     otherwise 
-    ignore blank lines and lines starting with a hash #
-    fill missing values by setting count of columns to the largest value   
+    fill missing values by setting count of columns to the largest value
+    the type of each column is found once: int, float (formatted) or text;
+    a first line with text (header) is kept as it is
     """
     def __init__(self, obj: TableValue, actions: dict):
         self.cols =0
         self.rows = 0
-        self.data = []
+        self.columns = []
+        self.arrays = {}
         self.caption = None
         if obj.exists:
             data = []
+            # the row taken out for the description while the rows are selected
+            described = None
             try:
+                selection = _Selection(actions) if any(n in actions for n in _SELECTION) else None
                 with open(obj.filename, 'r', encoding='utf-8') as f:
-                    for row in csv.reader(f, delimiter=obj.separator):
-                        data += [[v.strip() for v in row]] # clean it
+                    rows = ([v.strip() for v in row] for row in csv.reader(f, delimiter=obj.separator))
+                    if selection is None:
+                        data = list(rows)
+                    else:
+                        described = []
+                        data = selection.rows(_withoutRow(rows, _descriptionRow(actions), described))
+            except _SelectionError as e:
+                data = [[f'Cannot select from csv file {obj.filename!r}: {e}']]
+                described = None
             except Exception as e:
                 data = [[f'Cannot read csv file {obj.filename!r}']]
+                described = None
             
             desc = ''
             #print(actions, 'description' in actions, actions.keys())
@@ -108,36 +209,593 @@ class CSVTable:
                     if v.startswith('row'):
                         i = int(v.replace('row',''))-1 # zero based correction
                         try:
-                            desc = data[i][0]
-                            del data[i]
+                            if described is None:
+                                desc = data[i][0]
+                                del data[i]
+                            else:
+                                desc = described[0][0]
                         except:
                             desc = f'cannot extract description from {v}'
                 elif v.type == 'str':
                     desc = str(v)
                 actions['description'] = desc
             self.rows = len(data)
-            self.cols = max([ len(r) for r in data ])
+            self.cols = max([len(r) for r in data], default=0)
 
             # refill if there is any row shorter than max
             for r in data:
                 if len(r) < self.cols:
-                    r += ['']
-            
-            fformat = (f"{{:{obj.floatformat}}}").format
-            newdata = []
-            for r in data:
-                row = []
-                for v in r:
-                    try:
-                        v = int(v)
-                    except:
-                        try:
-                            v = fformat(float(v))
-                        except:
-                            pass
-                    row += [v]
-                newdata += [row]
-            self.data = newdata
+                    r += [''] * (self.cols - len(r))
+
+            for j, column in enumerate(zip(*data)):
+                self.columns += [self._column(j, list(column), obj.floatformat)]
             if desc:
                 self.caption = desc
-            
+
+    def _column(self, j, column, floatformat):
+        """the column as shown, numbers are kept in self.arrays"""
+        for head in (0, 1):
+            body = column[head:]
+            if not body:
+                break
+            if (numbers := _numbers(body)) is None:
+                continue
+            try:
+                body = _formatted(body, numbers, floatformat)
+            except ValueError:
+                # no valid *floatformat
+                break
+            self.arrays[j] = numbers
+            return [_cell(v, floatformat) for v in column[:head]] + body
+        # text or mixed: cell by cell
+        return [_cell(v, floatformat) for v in column]
+
+
+class NPYTable:
+    """read a NumPy array (.npy) or one array of a .npz file (+key='name' or +key=0)
+
+    the file is opened memory-mapped (as well as not compressed .npz files),
+    the numbers (array(j)) are views into it
+    - 1d: one column, 2d: rows x columns, a structured array: one column per field
+    - header: the field names or the line in a sidecar file, results.header for
+      results.npy and results.name.header for key name in results.npz,
+      separated by *csvseparator
+    - ints are kept, floats are written by *floatformat in one go for the whole array
+
+    @row1 can be used with 'description' only, it takes the header
+    """
+    def __init__(self, obj: TableValue, actions: dict):
+        self.cols = 0
+        self.rows = 0
+        self.columns = []
+        self.arrays = {}
+        self.caption = None
+        if not obj.exists:
+            return
+        header = None
+        key = _key(actions)
+        try:
+            if np is None:
+                raise ModuleNotFoundError('NumPy is required')
+            names = self._columns(_loadArray(obj.filename, key), obj.floatformat)
+            header = _readHeader(_sidecar(obj.filename, key), obj.separator) or names
+        except Exception as e:
+            self.columns = [[f'Cannot read array file {obj.filename!r}: {e}']]
+            self.arrays = {}
+
+        desc, header = _description(actions, header)
+        if header:
+            header = (header + [''] * len(self.columns))[:len(self.columns)]
+            self.columns = [[h] + c for h, c in zip(header, self.columns)]
+        self.cols = len(self.columns)
+        self.rows = len(self.columns[0]) if self.columns else 0
+        if desc:
+            self.caption = desc
+
+    def _columns(self, array, floatformat):
+        """self.columns as shown and self.arrays (views) of the numeric columns
+
+        returns the field names of a structured array, None otherwise
+        """
+        names = None
+        if array.dtype.names:
+            # structured: a column per field
+            if array.ndim != 1:
+                raise ValueError(f'a structured array needs 1 dimension, not {array.ndim}')
+            names = list(array.dtype.names)
+            fields = [array[n] for n in names]
+        else:
+            if array.ndim > 2:
+                raise ValueError(f'cannot show {array.ndim} dimensions as table')
+            fields = [array.reshape(-1, 1) if array.ndim < 2 else array]
+        for field in fields:
+            # formatted as a whole, transposed: one list per column
+            block = field.reshape(field.shape[0], int(np.prod(field.shape[1:]))).T
+            start = len(self.columns)
+            self.columns += _formattedArray(block, floatformat)
+            if block.dtype.kind in 'iuf':
+                for j in range(block.shape[0]):
+                    self.arrays[start + j] = block[j]
+        return names
+
+
+class SQLTable:
+    """the result of +query='select ...' in a SQLite database
+
+    the connection is shared with all other tables of the database (see
+    connectionPool), the rows are streamed from a cursor whenever they are
+    used (iterRows) and counted by the way; rows runs a count(*) only if it is
+    asked for before, arrays reads the numbers when it is asked for
+    - header: the names of the columns
+    - ints are kept, floats are written by *floatformat, NULL is empty
+
+    @row1 can be used with 'description' only, it takes the header
+    """
+    def __init__(self, obj: TableValue, actions: dict):
+        self.cols = 0
+        self.caption = None
+        self.filename = obj.filename
+        self.floatformat = obj.floatformat
+        self.query = _query(actions)
+        self.header = None
+        self._count = None
+        self._columns = None
+        self._arrays = None
+        if not obj.exists:
+            self._columns, self._arrays, self._count = [], {}, 0
+            return
+        try:
+            if not self.query:
+                raise ValueError("no +query='select ...'")
+            cursor, lock = self._execute()
+            with lock:
+                names = [d[0] for d in cursor.description or ()]
+                cursor.close()
+        except Exception as e:
+            self._columns = [[f'Cannot query {obj.filename!r}: {e}']]
+            self._arrays = {}
+            self._count = 1
+            self.query = None
+            names = None
+
+        desc, self.header = _description(actions, names)
+        self.cols = len(names) if names else len(self._columns or ())
+        if desc:
+            self.caption = desc
+
+    @property
+    def rows(self):
+        """the rows with the header, counted by the last pass or by the database"""
+        if self._count is None:
+            with connectionPool.use(self.filename) as db:
+                count = db.execute(f'select count(*) from ({self.query})').fetchone()[0]
+            self._count = count + bool(self.header)
+        return self._count
+
+    @property
+    def columns(self):
+        if self._columns is None:
+            self._columns = [list(c) for c in zip(*self.iterRows())] or [[] for _ in range(self.cols)]
+        return self._columns
+
+    @property
+    def arrays(self):
+        """the numbers of all columns without text, read from the database when asked for"""
+        if self._arrays is None:
+            numbers = {j: [] for j in range(self.cols)}
+            for row in self._stream():
+                for j in list(numbers):
+                    if isinstance(row[j], (int, float)):
+                        numbers[j].append(row[j])
+                    else:
+                        del numbers[j] # text in this column
+            self._arrays = {j: _numbers(c) for j, c in numbers.items() if c}
+        return self._arrays
+
+    def iterRows(self):
+        if self.query is None:
+            return zip(*self.columns)
+        return self._rows()
+
+    def _rows(self):
+        if self.header:
+            yield list(self.header)
+        count = bool(self.header)
+        for row in self._stream():
+            count += 1
+            yield [_sqlCell(v, self.floatformat) for v in row]
+        self._count = count
+
+    def _stream(self):
+        """the rows of the query as they come from the database"""
+        return self._fetch(*self._execute())
+
+    def _execute(self):
+        """a cursor on the query and the lock of its connection"""
+        connection, lock = connectionPool.connect(self.filename)
+        with lock:
+            return connection.execute(self.query), lock
+
+    @staticmethod
+    def _fetch(cursor, lock, size=256):
+        try:
+            while True:
+                with lock:
+                    rows = cursor.fetchmany(size)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+
+class NVTable:
+    """an array of a parameter file: name[i]:... is a column, name[i,j]:... rows x columns
+
+    ints are kept, floats are written by *floatformat, missing elements are empty
+    """
+    def __init__(self, obj: TableValue, actions: dict):
+        self.cols = 0
+        self.rows = 0
+        self.columns = []
+        self.arrays = {}
+        self.caption = None
+        if not obj.exists:
+            return
+        array = obj.parameter.content
+        if np is not None and isinstance(array, np.ndarray):
+            if array.ndim > 2:
+                array = f'cannot show {array.ndim} dimensions as table'
+            else:
+                table = array.reshape(-1, 1) if array.ndim < 2 else array
+                self.columns = _formattedArray(table.T, obj.floatformat)
+                if table.dtype.kind == 'f':
+                    for i, j in zip(*np.nonzero(np.isnan(table.T))):
+                        self.columns[i][j] = ''
+                if table.dtype.kind in 'iuf':
+                    self.arrays = {j: table[:, j] for j in range(table.shape[1])}
+        elif isinstance(array, list):
+            table = [r if isinstance(r, list) else [r] for r in array]
+            if any(isinstance(v, list) for r in table for v in r):
+                array = 'cannot show more than 2 dimensions as table'
+            else:
+                self.columns = [[_nvCell(v, obj.floatformat) for v in c] for c in zip(*table)]
+        if not self.columns:
+            # not an array: a message or a single value
+            self.columns = [[array if isinstance(array, (int, str)) else _nvCell(array, obj.floatformat)]]
+
+        desc, _header = _description(actions, None)
+        self.cols = len(self.columns)
+        self.rows = len(self.columns[0])
+        if desc:
+            self.caption = desc
+
+
+def _nvCell(v, floatformat):
+    if isinstance(v, float):
+        return '' if v != v else f"{{:{floatformat}}}".format(v)
+    return v
+
+
+def _sqlCell(v, floatformat):
+    if v is None:
+        return ''
+    if isinstance(v, float):
+        return f"{{:{floatformat}}}".format(v)
+    if isinstance(v, bytes):
+        return f'<{len(v)} bytes>'
+    return v
+
+
+def _dataSource(filename):
+    """the kind of table in filename"""
+    extension = os.path.splitext(str(filename))[1].lower()
+    if extension in ('.npy', '.npz'):
+        return 'NPY'
+    if extension in ('.sqlite', '.sqlite3', '.db'):
+        return 'SQL'
+    return 'CSV'
+
+
+def _description(actions, header):
+    """(caption, header) as given by +description: a string or @row1 to take the header"""
+    desc = ''
+    if 'description' in actions:
+        v = actions['description']
+        if v.type == 'readfrom':
+            if v.object == 'row1' and header:
+                desc = header[0]
+                header = None
+            else:
+                desc = f'cannot extract description from {v.object}'
+        elif v.type == 'str':
+            desc = str(v)
+        actions['description'] = desc
+    return desc, header
+
+
+def _query(actions):
+    """the SQL of +query='select ...' without a closing ';'"""
+    v = actions.get('query', None)
+    if v is None or v.type != 'str':
+        return None
+    return str(v).strip().rstrip(';').strip() or None
+
+
+def _key(actions):
+    """the name (or index) of the array in a .npz file: +key='name', +key=0"""
+    v = actions.get('key', None)
+    if v is None:
+        return None
+    if v.type == 'int':
+        return v.object.value
+    return str(v) or None
+
+
+def _sidecar(filename, key):
+    """the file with the header of an array, see NPYTable"""
+    stem = os.path.splitext(str(filename))[0]
+    if key is not None and str(filename).lower().endswith('.npz'):
+        return f'{stem}.{key}.header'
+    return f'{stem}.header'
+
+
+def _stamp(filename):
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _readHeader(filename, separator):
+    """the names in the first line of filename, None if there is no such file"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            line = f.readline()
+    except FileNotFoundError:
+        return None
+    return [v.strip() for v in next(csv.reader([line], delimiter=separator), [])]
+
+
+def _loadArray(filename, key):
+    """the array of a .npy file or of a .npz file (by key), memory-mapped if possible"""
+    if not str(filename).lower().endswith('.npz'):
+        return np.load(filename, mmap_mode='r', allow_pickle=False)
+    with zipfile.ZipFile(filename) as archive:
+        names = [n[:-4] for n in archive.namelist() if n.endswith('.npy')]
+    if isinstance(key, int):
+        if not -len(names) <= key < len(names):
+            raise KeyError(f'no array {key} in {len(names)} arrays')
+        key = names[key]
+    elif key is None:
+        if len(names) != 1:
+            raise KeyError(f"select one of {', '.join(names)} by +key='name'")
+        key = names[0]
+    elif key not in names:
+        raise KeyError(f"no array {key!r}, only {', '.join(names)}")
+    array = _mapMember(filename, key + '.npy')
+    if array is None:
+        # compressed: there is nothing to map
+        with np.load(filename, allow_pickle=False) as archive:
+            array = archive[key]
+    return array
+
+
+# local file header of a zip member: signature ... name length, extra length
+_ZIPHEADER = struct.Struct('<4s22xHH')
+
+
+def _mapMember(filename, member):
+    """the array stored (not compressed) as member of a zip file, None otherwise"""
+    with zipfile.ZipFile(filename) as archive:
+        info = archive.getinfo(member)
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    readers = {(1, 0): np.lib.format.read_array_header_1_0,
+               (2, 0): np.lib.format.read_array_header_2_0}
+    with open(filename, 'rb') as f:
+        f.seek(info.header_offset)
+        signature, namelength, extralength = _ZIPHEADER.unpack(f.read(_ZIPHEADER.size))
+        if signature != b'PK\x03\x04':
+            return None
+        f.seek(info.header_offset + _ZIPHEADER.size + namelength + extralength)
+        version = np.lib.format.read_magic(f)
+        if version not in readers:
+            return None
+        shape, fortran, dtype = readers[version](f)
+        offset = f.tell()
+    if dtype.hasobject:
+        return None
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(filename, dtype=dtype, mode='r', shape=shape,
+                     order='F' if fortran else 'C', offset=offset)
+
+
+def _formattedArray(block, floatformat):
+    """the cells of a 2d array as lists of the first axis: ints, formatted floats or text"""
+    kind = block.dtype.kind
+    if kind in 'iu':
+        return block.tolist()
+    if kind == 'f':
+        if _PRINTF.fullmatch(floatformat):
+            return np.char.mod(f'%{floatformat}', block).tolist()
+        return np.frompyfunc(f"{{:{floatformat}}}".format, 1, 1)(block).tolist()
+    return block.astype(str).tolist()
+
+
+class _SelectionError(Exception):
+    pass
+
+
+class _Selection:
+    """rows and columns of a table chosen while it is read, in one pass
+
+    +where='dp > 0.5 and case != "ref"' - conditions joined by 'and', compare a
+                column with a number (or text): == = != <> < <= > >=
+    +sort='dp' - sorted by a column, numbers before text
+    +desc - descending (without sort: from the end of the file)
+    +limit=50 - the first rows only
+    +columns='case,dp' - these columns in this order
+
+    columns are given by name (first line, if it has text) or by number (1 is
+    the first); with limit at most limit rows are kept in memory (a bounded
+    heap if sorted), the header stays on top
+    """
+    def __init__(self, actions):
+        self.where = [_condition(c) for c in _ANDS.split(_actionText(actions, 'where') or '') if c.strip()]
+        self.sort = _actionText(actions, 'sort')
+        self.desc = 'desc' in actions and _actionText(actions, 'desc') not in ('0', 'false', 'no')
+        limit = _actionText(actions, 'limit')
+        try:
+            self.limit = None if limit is None else max(0, int(limit))
+        except ValueError:
+            raise _SelectionError(f'limit has to be a number, not {limit!r}') from None
+        columns = _actionText(actions, 'columns')
+        self.columns = None if columns is None else [c.strip() for c in columns.split(',') if c.strip()]
+
+    def rows(self, rows):
+        """the chosen rows (lists of cells), with the header if the first row has one"""
+        rows = (row for row in rows if any(row))
+        first = next(rows, None)
+        if first is None:
+            return []
+        header = None
+        if any(c and _float(c) is None for c in first):
+            header = first
+        else:
+            rows = itertools.chain([first], rows)
+
+        for j, op, value in self.where:
+            rows = filter(_test(_index(j, header), op, value), rows)
+        if self.sort is not None:
+            j = _index(self.sort, header)
+            key = lambda row: _sortKey(row[j] if j < len(row) else '')
+            if self.limit is not None:
+                rows = (heapq.nlargest if self.desc else heapq.nsmallest)(self.limit, rows, key=key)
+            else:
+                rows = sorted(rows, key=key, reverse=self.desc)
+        elif self.desc:
+            # the last rows, the last one first
+            rows = reversed(collections.deque(rows, maxlen=self.limit))
+        elif self.limit is not None:
+            rows = itertools.islice(rows, self.limit)
+
+        if self.columns is not None:
+            picked = [_index(c, header) for c in self.columns]
+            pick = lambda row: [row[j] if j < len(row) else '' for j in picked]
+            return [pick(row) for row in ([header] if header else [])] + [pick(row) for row in rows]
+        return ([header] if header else []) + list(rows)
+
+
+# conditions of where and the way they compare
+_ANDS = re.compile(r'\s+and\s+', re.IGNORECASE)
+_CONDITION = re.compile(r'\s*("[^"]*"|[^\s<>=!]+)\s*(==|=|!=|<>|<=|>=|<|>)\s*("[^"]*"|\S+)\s*')
+_OPERATORS = {'==': operator.eq, '=': operator.eq, '!=': operator.ne, '<>': operator.ne,
+              '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+
+
+def _actionText(actions, name):
+    """the text of an action: +name='text' or +name=42, '1' for a flag +name"""
+    v = actions.get(name, None)
+    if v is None:
+        return None
+    if v.type in ('str', 'int', 'float'):
+        return str(v.object.value if v.type != 'str' else v).strip()
+    raise _SelectionError(f"use {name}='...' ({v.object})")
+
+
+def _condition(text):
+    """(column, compare, value) of 'column op value'"""
+    match = _CONDITION.fullmatch(text)
+    if not match:
+        raise _SelectionError(f'cannot read condition {text.strip()!r}')
+    column, op, value = (v.strip('"') if v.startswith('"') else v for v in match.groups())
+    return column, _OPERATORS[op], value
+
+
+def _index(column, header):
+    """the index of a column given by name or number"""
+    if header is not None and column in header:
+        return header.index(column)
+    if column.isdigit() and int(column) > 0:
+        return int(column) - 1
+    raise _SelectionError(f'no column {column!r}')
+
+
+def _test(j, op, value):
+    """a filter of rows: compare the cell j with value, as numbers if both are"""
+    number = _float(value)
+    def test(row):
+        cell = row[j] if j < len(row) else ''
+        if number is not None and (x := _float(cell)) is not None:
+            return op(x, number)
+        return op(cell, value)
+    return test
+
+
+def _sortKey(cell):
+    x = _float(cell)
+    return (0, x, '') if x is not None else (1, 0.0, cell)
+
+
+def _float(v):
+    try:
+        return float(v)
+    except ValueError:
+        return None
+
+
+def _descriptionRow(actions):
+    """the index of the row taken for the description (@row1), None if there is none"""
+    v = actions.get('description', None)
+    if v is not None and v.type == 'readfrom' and v.object.startswith('row'):
+        return int(v.object.replace('row', '')) - 1
+    return None
+
+
+def _withoutRow(rows, i, found):
+    """all rows but the one at index i, which goes to found"""
+    for k, row in enumerate(rows):
+        if k == i:
+            found.append(row)
+        else:
+            yield row
+
+
+def _numbers(column):
+    """all cells as float (numpy array if available) or None if there is any text"""
+    if np is not None:
+        try:
+            return np.asarray(column, dtype=float)
+        except ValueError:
+            pass
+    try:
+        return list(map(float, column))
+    except ValueError:
+        return None
+
+
+def _formatted(column, numbers, floatformat):
+    """int stays int, any other number is written by floatformat"""
+    try:
+        return list(map(int, column))
+    except ValueError:
+        pass
+    if np is not None and _PRINTF.fullmatch(floatformat):
+        formatted = np.char.mod(f'%{floatformat}', numbers).tolist()
+    else:
+        formatted = list(map(f"{{:{floatformat}}}".format, numbers))
+    # most floats are written with a '.', only the others need a closer look
+    return [f if '.' in v or not _INT.fullmatch(v) else int(v) for v, f in zip(column, formatted)]
+
+
+def _cell(v, floatformat):
+    try:
+        return int(v)
+    except ValueError:
+        try:
+            return f"{{:{floatformat}}}".format(float(v))
+        except ValueError:
+            return v
@@ -4,6 +4,8 @@
 #   S C R I P T U M 
 #
 
+from ..contentcache import contentCache
+
 
 class StringValue:
     """from rdf/task to content used in elements etc."""
@@ -31,12 +33,15 @@ class TextValue:
     @property
     def content(self):
         if self.exists:
-            with open(self.filename, 'r') as f:
-                content = '\n'.join(f.readlines())
+            content = contentCache.get('text', self.filename, (), self._read)
         else:
             content = str(self)
         return content
 
+    def _read(self):
+        with open(self.filename, 'r') as f:
+            return '\n'.join(f.readlines())
+
     def __str__(self) -> str:
         return f'non existing file {self.filename!r}'
 
@@ -2,6 +2,6 @@
 #   S C R I P T U M 
 #
 
-from .tag import Tag, getReTag, getTag, createTag
+from .tag import Tag, getReTag, getTag, findTags, createTag
 
-__all__ = [ 'Tag', 'getTag', 'getReTag', 'createTag']
\ No newline at end of file
+__all__ = [ 'Tag', 'getTag', 'findTags', 'getReTag', 'createTag']
\ No newline at end of file
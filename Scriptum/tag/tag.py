@@ -9,10 +9,12 @@
 # MODULE .tag.tag - everything to manage Tags <foo>, </foo>, <foo/>
 # PROVIDES 
 #   class Tag - handle <...> tags inside the document template
-#   function getTag
+#   function getTag, findTags
 #
 
+import functools
 import re
+import sys
 
 # how tags look like
 OPENING='</?'
@@ -27,18 +29,24 @@ RECOMPILEFLAGS=re.IGNORECASE|re.UNICODE
 NOT_ALLOWED_IN_ARGS = ':' # not allowed in further args
 NOT_ALLOWED_IN_TAG = '\\'
 #
+# all tags in a text, compiled once
+_TAGPATTERN = re.compile(OPENING + GENERIC_PATTERN + CLOSING, flags=RECOMPILEFLAGS)
+
+class _TagData:
+    """what is read from a raw tag <...>, shared by all tags with the same raw tag (see _tagData)
+
+    never changed in place: a Tag that is changed gets a copy of its own first
+    """
+    __slots__ = ('rawtag', 'tagtype', 'puretag', 'args', 'ns', 'name', 'child', 'tagtext')
 
-class Tag:
     def __init__(self,rawtag):
         self.rawtag = rawtag # as given in document, mostly for printing, or replication
-        self.burned = False # when True it will not be used furthermore
         self.tagtype = '' # open, close, simple, invalid...
         self.puretag = '' # the pure and clean tag, lowercase, e.g. section:foo, whatever:name, etc.
         self.args = []
         self.ns = None
         self.name = None
         self.child = None
-        #self.iwasadded = False
         #self.inElement = -1 # yet not really used
         # further split content
         innertext = rawtag[1:-1]
@@ -62,9 +70,10 @@ class Tag:
         if 'invalid' not in self.tagtype:
             tagcontent = innertext.split()
             # this is the "address" to find a tag in the document
-            self.puretag = tagcontent[0].lower()
+            self.puretag = sys.intern(tagcontent[0].lower())
             # the first part can be split by : or not
             ns_name = self.puretag.split(':')
+            ns_name = [sys.intern(n) for n in ns_name]
             if len(ns_name) == 1:
                 self.ns = ns_name[0]
                 self.name = ns_name[0]
@@ -92,6 +101,71 @@ class Tag:
 
         if 'invalid' in self.tagtype:
             self.puretag = ''
+
+    def copy(self):
+        data = _TagData.__new__(_TagData)
+        for name in _TagData.__slots__:
+            setattr(data, name, getattr(self, name))
+        data.args = type(self.args)(self.args)
+        return data
+
+
+@functools.lru_cache(maxsize=4096)
+def _tagData(rawtag):
+    """the same raw tag is read once, e.g. <image:generic/> in every copy of a section"""
+    return _TagData(rawtag)
+
+
+def _shared(name):
+    """an attribute read from the shared _TagData, written to a copy of its own"""
+    def get(self):
+        return getattr(self._data, name)
+    def set(self, value):
+        self._own()
+        setattr(self._data, name, value)
+    return property(get, set)
+
+
+class Tag:
+    # one per tag in the template, thus no __dict__;
+    # what is read from the raw tag is shared (_data), burned belongs to this tag only
+    __slots__ = ('_data', '_owned', 'burned')
+
+    def __init__(self,rawtag):
+        self._data = _tagData(rawtag)
+        self._owned = False
+        self.burned = False # when True it will not be used furthermore
+
+    rawtag = _shared('rawtag')
+    tagtype = _shared('tagtype')
+    puretag = _shared('puretag')
+    args = _shared('args')
+    ns = _shared('ns')
+    name = _shared('name')
+    child = _shared('child')
+    tagtext = _shared('tagtext')
+
+    def _own(self):
+        """copy on write: a tag that is changed does not change the others"""
+        if not self._owned:
+            self._data = self._data.copy()
+            self._owned = True
+
+    def __copy__(self):
+        tag = Tag.__new__(Tag)
+        tag._data = self._data
+        tag.burned = self.burned
+        # shared from now on, thus both copy before they change
+        tag._owned = self._owned = False
+        return tag
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def setArg(self, name, value):
+        """set an arg of this tag only"""
+        self._own()
+        self._data.args[name] = value
     
     def getLength(self, name, units):
         """try to extract an arg with name name 
@@ -214,23 +288,24 @@ def getTag(text):
     Thus pattern is only the inner part of the tag 'x foo=123' formulated as regular expression
     """
     
-    # denied = [ c for c in _NOT_ALLOWED+opening+closing if c in innertext ]
-    # if denied:
-        # #print(text,innertext,'denied')   
-        # return None, denied, 1
-    # # complete the pattern
-    pattern = OPENING + GENERIC_PATTERN + CLOSING
-    
-    tag = re.compile(pattern,flags=RECOMPILEFLAGS)
-    found = tag.findall(text)
-    #print(found)
-    tags = []
-    for f in found:
-        tags += [Tag(f)]    
-    return tags
+    if '<' not in text:
+        # most paragraphs have no tag at all
+        return []
+    return [Tag(f) for f in _TAGPATTERN.findall(text)]
+
+def findTags(text):
+    """all tags in text as (start, end, puretag), invalid tags have an empty puretag"""
+    if '<' not in text:
+        return
+    for m in _TAGPATTERN.finditer(text):
+        yield m.start(), m.end(), _tagData(m.group()).puretag
 
 def getReTag(tag: Tag):
-    pattern = OPENING+tag.tagtext+CLOSING
+    return _reTag(tag.tagtext)
+
+@functools.lru_cache(maxsize=4096)
+def _reTag(tagtext):
+    pattern = OPENING+tagtext+CLOSING
     return re.compile(pattern,flags=RECOMPILEFLAGS)
 
 def createTag(tagtext:str):
@@ -1,6 +1,7 @@
 """Pytest version of the former CreateDOCforEssay notebook."""
 
 from pathlib import Path
+import io
 import sys
 
 THIS_DIR = Path(__file__).resolve().parent
@@ -31,3 +32,91 @@ def test_document_is_created(tmp_path):
 
     assert result_path.exists(), "Expected final_report.docx to be generated"
     assert result_path.stat().st_size > 0, "Generated document should not be empty"
+
+
+def test_document_with_optimized_images(tmp_path, monkeypatch):
+    import docx
+    import Scriptum
+    from PIL import Image
+    from Scriptum.element import ImageOptimizer
+
+    from common_case import WorkspaceBuilder
+
+    workspace = WorkspaceBuilder(tmp_path, DATA_SOURCE).build(THIS_DIR, ["*.rdf", "template_image.docx"])
+    monkeypatch.chdir(workspace)
+
+    def pictures(name):
+        return [Image.open(io.BytesIO(p.blob)).size for p in docx.Document(name).part.package.image_parts]
+
+    sizes = {}
+    for name, images in [("plain.docx", None), ("small.docx", ImageOptimizer(dpi=50, cache="images", workers=2))]:
+        document = Scriptum.ManagedDocx("template_image.docx")
+        document.typesetting(Scriptum.ReportDataFile("word_images.rdf"), images=images)
+        document.save(name)
+        sizes[name] = sorted(pictures(name))
+
+    # camera.png is placed in two sizes: one picture in plain.docx, two in small.docx
+    assert len(sizes["small.docx"]) == len(sizes["plain.docx"]) + 1
+    assert sum(w * h for w, h in sizes["small.docx"]) < sum(w * h for w, h in sizes["plain.docx"]) / 4
+    assert Path("small.docx").stat().st_size < Path("plain.docx").stat().st_size
+
+    # the next document takes them from the cache
+    cached = {p: p.stat().st_mtime_ns for p in Path("images").iterdir()}
+    document = Scriptum.ManagedDocx("template_image.docx")
+    document.typesetting(Scriptum.ReportDataFile("word_images.rdf"), images=ImageOptimizer(dpi=50, cache="images"))
+    assert {p: p.stat().st_mtime_ns for p in Path("images").iterdir()} == cached
+
+
+def test_image_optimizer(tmp_path):
+    from PIL import Image
+    from Scriptum.element import ImageOptimizer
+    from Scriptum.element.image_optimizer import EMU_PER_INCH
+
+    Image.new("RGB", (3000, 2000), "blue").save(tmp_path / "big.png")
+    Image.new("RGB", (40, 30), "green").save(tmp_path / "small.webp")
+    optimizer = ImageOptimizer(dpi=100, cache=tmp_path / "cache", workers=1)
+
+    # 2 x 1.33 inch at 100 dpi
+    big = optimizer.optimize(tmp_path / "big.png", 2 * EMU_PER_INCH, 2 * EMU_PER_INCH)
+    with Image.open(big) as image:
+        assert (image.format, image.size) == ("PNG", (200, 134))
+    # small enough and readable: as it is
+    assert optimizer.optimize(tmp_path / "big.png", 40 * EMU_PER_INCH, 30 * EMU_PER_INCH) == str(tmp_path / "big.png")
+    # not readable by python-docx: transcoded
+    webp = optimizer.optimize(tmp_path / "small.webp", EMU_PER_INCH, EMU_PER_INCH)
+    with Image.open(webp) as image:
+        assert (image.format, image.size) == ("PNG", (40, 30))
+    # broken files are embedded as they are
+    (tmp_path / "broken.png").write_bytes(b"no picture")
+    assert optimizer.optimize(tmp_path / "broken.png", EMU_PER_INCH, EMU_PER_INCH) == str(tmp_path / "broken.png")
+    assert str(tmp_path / "broken.png") in optimizer.errors
+
+
+def test_optimizer_per_thread():
+    """documents filled in parallel threads keep their pictures apart"""
+    import threading
+    from Scriptum.element import ImageOptimizer
+    from Scriptum.element.image_optimizer import optimizing, placePicture
+
+    optimizers = [ImageOptimizer(), ImageOptimizer()]
+    placed = {0: [], 1: []}
+    pending = {}
+    inside = threading.Barrier(2)
+
+    def fill(n):
+        with optimizing(optimizers[n]):
+            inside.wait()
+            placePicture(f"picture{n}.png", 1, 1, placed[n].append)
+            inside.wait()
+            pending[n] = [p[0] for p in optimizers[n]._pending]
+            optimizers[n]._pending = [] # nothing to embed here
+
+    threads = [threading.Thread(target=fill, args=(n,)) for n in (0, 1)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert pending == {0: ["picture0.png"], 1: ["picture1.png"]} and placed == {0: [], 1: []}
+    # outside: right away
+    placePicture("now.png", 1, 1, placed[0].append)
+    assert placed[0] == ["now.png"]
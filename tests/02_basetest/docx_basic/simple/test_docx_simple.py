@@ -31,3 +31,28 @@ def test_document_is_created(tmp_path):
 
     assert result_path.exists(), "Expected final_report.docx to be generated"
     assert result_path.stat().st_size > 0, "Generated document should not be empty"
+
+
+def test_sections_in_one_pass():
+    """the body is split into the same sections python-docx finds one by one"""
+    import docx
+    from docx.enum.section import WD_SECTION
+    from Scriptum._docx.section.sections import partition, Sections
+
+    document = docx.Document(str(THIS_DIR / "template.docx"))
+    found = [(s._sectPr, [b._element for b in blocks]) for s, blocks in partition(document)]
+    assert found == [(s._sectPr, [b._element for b in s.iter_inner_content()]) for s in document.sections]
+    assert len(found) == 7
+
+    # a table inside, the section break in a paragraph of its own, an empty last section
+    document = docx.Document()
+    document.add_paragraph("<section:a>")
+    document.add_table(rows=1, cols=1)
+    document.add_paragraph("</section:a>")
+    document.add_section(WD_SECTION.NEW_PAGE)
+    parts = [[type(b).__name__ for b in blocks] for s, blocks in partition(document)]
+    assert parts == [["Paragraph", "Table", "Paragraph", "Paragraph"], []]
+    assert [s.error for s in Sections(document)] == [
+        ["Section doesn't end with a 'section'-tag - check your document"],
+        ["Empty section found - check your document"],
+    ]
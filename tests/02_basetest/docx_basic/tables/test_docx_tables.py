@@ -31,3 +31,38 @@ def test_document_is_created(tmp_path):
 
     assert result_path.exists(), "Expected final_report.docx to be generated"
     assert result_path.stat().st_size > 0, "Generated document should not be empty"
+
+
+def test_tags_in_table_cells():
+    """the paragraphs of a table are read once and found by their tags"""
+    import docx
+    from Scriptum._docx.tables import DocTableElement
+
+    table = docx.Document().add_table(rows=40, cols=10)
+    for i, row in enumerate(table.rows):
+        for j, cell in enumerate(row.cells):
+            cell.text = f"<value:r{i}c{j}/> <comment:x/>"
+    merged = table.cell(0, 0).merge(table.cell(0, 1))
+    merged.add_paragraph("<value:r0c0/>")
+
+    element = DocTableElement(table)
+    # merged cells (holding the paragraphs of both) count once, comments are gone
+    assert len(element.tags) == 400 + 1
+    assert table.cell(5, 5).text == "<value:r5c5/> "
+    assert [(cell._tc, obj.thing.text) for cell, obj in element.cells["value:r0c0"]] == [(merged._tc, "<value:r0c0/> "), (merged._tc, "<value:r0c0/>")]
+
+    for i in range(40):
+        for j in range(10):
+            element.replaceTagInAll(f"value:r{i}c{j}", f"{i*j}")
+    # a tag is replaced in the first paragraph holding it
+    assert table.cell(39, 9).text == "351 " and table.cell(0, 1).text == "0 \n0 \n<value:r0c0/>"
+    assert [tag.burned for tag in element.tags].count(False) == 1 and not element.tags[2].burned
+    assert element.hastag("value:r2c3").burned and element.hastag("missing") is False
+
+    # a cell with a new content is left alone
+    element = DocTableElement(docx.Document().add_table(rows=1, cols=1))
+    element.thing.cell(0, 0).text = "<value:a/>"
+    element = DocTableElement(element.thing)
+    element.thing.cell(0, 0).text = "filled"
+    assert element.replaceTagInAll("value:a", "x") is False
+    assert element.thing.cell(0, 0).text == "filled"
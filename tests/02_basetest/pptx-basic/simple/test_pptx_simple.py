@@ -31,3 +31,53 @@ def test_document_is_created(tmp_path):
 
     assert result_path.exists(), "Expected final_report.pptx to be generated"
     assert result_path.stat().st_size > 0, "Generated document should not be empty"
+
+
+def test_deferred_picture_keeps_shape_order(tmp_path):
+    """a picture embedded at the end stays below the shapes added after it"""
+    from pptx import Presentation
+    from pptx.util import Inches
+    from Scriptum.element import ImageOptimizer
+    from Scriptum.element.image_optimizer import optimizing, placePicture
+    from Scriptum._pptx.images import pictureInserter
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    before = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+
+    optimizer = ImageOptimizer(cache=tmp_path / "cache", workers=1)
+    with optimizing(optimizer):
+        placePicture(str(DATA_SOURCE / "camera.png"), Inches(2), Inches(2),
+                     pictureInserter(slide, top=0, left=0, width=Inches(2), height=Inches(2)))
+        after = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        assert len(slide.shapes) == 2
+
+    assert len(slide.shapes) == 3
+    assert slide.shapes[0].shape_id == before.shape_id
+    assert slide.shapes[1].shape_type == 13 # picture
+    assert slide.shapes[2].shape_id == after.shape_id
+    assert not [ c for c in slide.shapes._spTree if not isinstance(c.tag, str) ] # no marker left
+
+
+def test_replace_in_elements():
+    """several tags of a shape in one pass, onlyOne takes the first shape holding a tag"""
+    from pptx import Presentation
+    from pptx.util import Inches
+    from Scriptum.tag import getTag
+    from Scriptum._pptx.base import replaceInElements
+    from Scriptum._pptx.paragraphs.element import PptTextElement
+
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    elements = []
+    for text in ["<name> of <part>", "<name>"]:
+        shape = slide.shapes.add_textbox(0, 0, Inches(1), Inches(1))
+        shape.text_frame.text = text
+        elements.append(PptTextElement(shape, getTag(text)))
+
+    found = replaceInElements(elements, {"name": "screw", "part": "M8", "missing": "-"}, onlyOne=True)
+    assert sorted(found) == ["name", "part"]
+    assert [e.thing.text for e in elements] == ["screw of M8", "<name>"]
+    # burned in the first shape, thus replaced in the second one
+    assert list(replaceInElements(elements, {"name": "nut"})) == ["name"]
+    assert [e.thing.text for e in elements] == ["screw of M8", "nut"]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Micro benchmark: classify all values of the rdf_big_*.rdf files.
+
+Compares Value (prefix table + literal tokenizer) with the former
+startswith chain that fell back to eval() for numbers.
+
+    python bench_value_classifier.py [repeat]
+
+Not collected by pytest.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+THIS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(THIS_DIR.parents[2]))
+
+from Scriptum.rdf.common import getCorrectFile, removeQuotes # pyright: ignore[reportMissingImports]
+from Scriptum.rdf.settings import SETTINGS # pyright: ignore[reportMissingImports]
+from Scriptum.rdf.values import (Value, DateValue, FileValue, FloatValue, IntegerValue, # pyright: ignore[reportMissingImports]
+                                 LengthValue, NumberValue, TextValue, StringValue, TableValue,
+                                 ColorValue, ImageValue, AnimationValue, NameValue)
+
+
+class LegacyValue(Value):
+    """the classifier as it was before, for comparison only"""
+
+    def __init__(self, value, settings, target=None):
+        lvalue = value.lower()
+        self.type = 'unknown'
+        self.object = None
+        self.subtype = None
+        self.tostring = None
+        self.content = None
+        if lvalue.startswith('file:'):
+            self.type = 'file'
+            filename, _exists = getCorrectFile(removeQuotes(value[5:].strip()), False, settings.datadir)
+            if target == 'image' or target == 'image:poster':
+                self.object = ImageValue(filename, _exists)
+            elif target == 'text':
+                self.object = TextValue(filename, _exists)
+            elif target == 'video':
+                self.object = AnimationValue(filename, _exists)
+            elif target == 'table':
+                self.object = TableValue(filename, _exists, settings)
+            else:
+                self.object = FileValue(filename, _exists)
+            self.subtype = self.object.subtype
+            self.tostring = False
+        elif lvalue.startswith('parfile:'):
+            self.type = 'parfile'
+            restvalue = value[8:]
+            parname = restvalue.split(':')[-1]
+            filename = removeQuotes(restvalue[:-(len(parname)+1)])
+            filename, _exists = getCorrectFile(filename, False, settings.datadir)
+            self.object = NameValue(filename, _exists, settings, parname)
+            self.subtype = self.object.subtype
+            self.tostring = False
+        elif (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
+            self.type = 'str'
+            self.object = StringValue(value[1:-1].replace('\\n', '\n'))
+            self.tostring = True
+        elif lvalue.startswith('@'):
+            self.type = 'readfrom'
+            self.object = lvalue[1:]
+            self.tostring = False
+        elif lvalue.startswith('newsection:'):
+            self.type = 'newsection'
+            self.object = ''
+            self.tostring = False
+        elif lvalue.startswith('date:'):
+            self.type = 'datetime'
+            self.object = DateValue(value.split(':', 1)[1], settings)
+            self.tostring = True
+        elif lvalue.startswith('numbering:'):
+            self.type = 'numbering'
+            self.object = NumberValue(value[10:])
+            self.tostring = True
+        elif value[-2:].lower() in ['cm', 'mm', 'in', 'pt']:
+            self.type = 'length'
+            self.object = LengthValue(value)
+            self.object.floatformat = settings.floatformat
+            self.tostring = True
+        elif target == 'color':
+            self.type = 'color'
+            self.object = ColorValue(value)
+            self.tostring = False
+        else:
+            try:
+                v = eval(value)
+                if type(v) == int:
+                    self.type = 'int'
+                    self.object = IntegerValue(v)
+                elif type(v) == float:
+                    self.type = 'float'
+                    self.object = FloatValue(v, settings)
+                self.tostring = True
+            except Exception as e:
+                self.type = 'invalid'
+                self.object = f'{e}: {value}'
+                self.tostring = True
+
+
+def collectValues():
+    """(value, target) of all tasks and actions, the way ReportDataFile splits them"""
+    values = []
+    for rdf in sorted(THIS_DIR.glob('rdf_big_*.rdf')):
+        for line in rdf.read_text().splitlines():
+            line = line.strip().lstrip('+.')
+            if not line or line[0] in '#*&@' or '=' not in line:
+                continue
+            path, rawvalue = line.split('=', 1)
+            elements = rawvalue.split('+')
+            values += [(elements[0].strip(), path.split('.')[-1].split(':')[0].strip())]
+            for el in elements[1:]:
+                if '=' in el:
+                    n, v = el.split('=', 1)
+                    values += [(v.strip(), n.strip())]
+    return values
+
+
+def main(repeat=200):
+    settings = SETTINGS()
+    values = collectValues()
+    for value, target in values:
+        new, old = Value(value, settings, target), LegacyValue(value, settings, target)
+        if new.type != old.type:
+            print(f'differs: {value!r}: {old.type} -> {new.type}')
+
+    results = {}
+    for name, cls in [('eval chain', LegacyValue), ('prefix table', Value)]:
+        seconds = min(timeit.repeat(lambda: [cls(v, settings, t) for v, t in values],
+                                    number=repeat, repeat=5))
+        results[name] = len(values) * repeat / seconds
+        print(f'{name:>14}: {results[name]:12,.0f} values/s')
+    print(f'{len(values)} values, speedup {results["prefix table"] / results["eval chain"]:.1f}x')
+
+    # the part eval was used for
+    literals = [(v, t) for v, t in values if LegacyValue(v, settings, t).type in ('int', 'float', 'length')]
+    literals = literals or [('42', 'value'), ('3.141', 'pi'), ('12cm', 'width')]
+    for name, cls in [('eval chain', LegacyValue), ('prefix table', Value)]:
+        seconds = min(timeit.repeat(lambda: [cls(v, settings, t) for v, t in literals],
+                                    number=repeat * 10, repeat=5))
+        results[name] = len(literals) * repeat * 10 / seconds
+        print(f'{name:>14}: {results[name]:12,.0f} numbers/s')
+    print(f'{len(literals)} numbers and lengths, speedup {results["prefix table"] / results["eval chain"]:.1f}x')
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:2]])
@@ -0,0 +1,49 @@
+import glob
+import os
+from pathlib import Path
+
+from _local_test_setup import *
+
+from Scriptum.rdf.fileindex import FileIndex # pyright: ignore[reportMissingImports]
+
+
+def test_index_answers_like_the_disk(monkeypatch: MonkeyPatch, tmp_path: Path):
+    (tmp_path / "data").mkdir()
+    for name in ["a1.rdf", "a2.rdf", "b.rdf", ".hidden.rdf"]:
+        (tmp_path / "data" / name).write_text("")
+    (tmp_path / "top.rdf").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    index = FileIndex()
+    for path in ["top.rdf", "data", "data/a1.rdf", "data/c.rdf", "nodir/a1.rdf", str(tmp_path / "top.rdf")]:
+        assert index.exists(path) == os.path.exists(path), path
+    for pattern in ["data/a*.rdf", "data/*", "data/.*", "*.rdf", "data/?.rdf", "nodir/*.rdf", "*/a1.rdf"]:
+        assert index.glob(pattern) == sorted(glob.glob(pattern)), pattern
+
+    # new files show up only after a refresh
+    (tmp_path / "data" / "a3.rdf").write_text("")
+    assert not index.exists("data/a3.rdf")
+    index.refresh("data")
+    assert index.exists("data/a3.rdf")
+    assert index.glob("data/a*.rdf") == ["data/a1.rdf", "data/a2.rdf", "data/a3.rdf"]
+
+
+def test_parse_reads_each_directory_once(monkeypatch: MonkeyPatch, tmp_path: Path):
+    workdir = tmp_path / "workspace"
+    workdir.mkdir()
+    for src in THIS_DIR.glob("rdf_big*.rdf"):
+        ensure_link(src, workdir / src.name)
+    ensure_link(DATA_SOURCE, workdir / "data")
+    monkeypatch.chdir(workdir)
+
+    scanned = []
+    scandir = os.scandir
+    def counting_scandir(path):
+        scanned.append(path)
+        return scandir(path)
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+
+    rdf = ReportDataFile("rdf_big_docx.rdf")
+    assert rdf.errors == []
+    assert len(scanned) == len(set(scanned))
+    assert os.path.normcase(str(workdir / "data")) in scanned
@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from _local_test_setup import *
+
+from Scriptum.rdf import prefetch, contentCache # pyright: ignore[reportMissingImports]
+from Scriptum.rdf.prefetch import fileValues # pyright: ignore[reportMissingImports]
+
+
+def test_prefetch_loads_each_file_once(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    Path("results.nv").write_text("\n".join(f"p{i}:{i}" for i in range(20)))
+    Path("table.csv").write_text("a;b\n1;2\n")
+    Path("text.txt").write_text("some text\n")
+    Path("broken.png").write_bytes(b"no image at all")
+    Path("report.rdf").write_text("\n".join(
+        ["*version=3", "*documenttype=docx", "section:a"]
+        + [f".value{i}=parfile:results.nv:p{i}" for i in range(20)]
+        + [".table:one=file:table.csv", ".table:two=file:table.csv+description='x'",
+           ".text=file:text.txt", ".image:broken=file:broken.png",
+           ".missing=parfile:missing.nv:p0"]
+    ))
+    rdf = ReportDataFile("report.rdf")
+
+    files = fileValues(rdf.tasks)
+    # missing files are left to the fill loop
+    assert sorted(Path(f).name for f in files) == ["broken.png", "results.nv", "table.csv", "text.txt"]
+
+    errors = prefetch(rdf.tasks, workers=3)
+    assert [Path(f).name for f in errors] == ["broken.png"]
+    assert "cannot identify image file" in errors["broken.png"]
+    # one read per file, two for the table: the description is part of the key
+    assert contentCache.misses == 5
+
+    # the fill loop finds everything in memory
+    for task in rdf.tasks:
+        if task.target != "image:broken":
+            task.value.load()
+    assert contentCache.misses == 5
+    assert str(next(t for t in rdf.tasks if t.target == "value7").value.content) == "7"
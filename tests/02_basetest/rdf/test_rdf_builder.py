@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from _local_test_setup import *
+
+from Scriptum.rdf import ReportBuilder # pyright: ignore[reportMissingImports]
+
+
+def summary(tasks):
+    return [(t.serial, t.myAddress, t.what, t.where, t.modified,
+             sorted((n, repr(v)) for n, v in t.actions.items()), repr(t.value)) for t in tasks]
+
+
+def test_builder_pptx_like_rdf(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    ensure_link(DATA_SOURCE, tmp_path / "data")
+    Path("report.rdf").write_text("\n".join([
+        "*version=3",
+        "*documenttype=pptx",
+        "*datadir=data",
+        "Results",
+        "  .title='Results'",
+        "  .subtitle=date:today",
+        "  @marker:content",
+        "  +table:generic=file:table1.csv+description='all cases'+width=12cm",
+        "  +table:generic=file:table2.csv+description='more cases'",
+        "Results",
+        "  .title='Again'+size=12",
+        "  .value=42",
+        "",
+    ]))
+    rdf = ReportDataFile("report.rdf")
+    assert not rdf.errors
+
+    report = ReportBuilder(documenttype="pptx", datadir="data")
+    report.slide("Results").set("title", "Results").set("subtitle", "date:today")
+    report.at("marker:content")
+    report.add("table:generic", file="table1.csv", description="all cases", width="12cm")
+    report.add("table:generic", file="table2.csv", description="more cases")
+    report.slide("Results").set("title", "Again", size=12).set("value", 42)
+
+    assert summary(report.tasks) == summary(rdf.tasks)
+    # the second slide and the second table are duplicates
+    assert [t.myAddress[-1] for t in report.tasks if t.target == "table:generic"] == ["table:generic", "table:generic_c002"]
+    assert report.tasks[-1].myAddress[0] == "results_c002"
+
+
+def test_builder_docx_like_rdf(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    Path("report.rdf").write_text("\n".join([
+        "*version=3",
+        "*documenttype=docx",
+        "section:a",
+        " .head='Some heading'",
+        " .subsection:instruction",
+        "  .subsubsection:test",
+        "   .head='Test'",
+        " .subsection:instruction",
+        "   .head='Temperatures'",
+        "section:a.subsection:instruction",
+        "   .head='Again'",
+        "",
+    ]))
+    rdf = ReportDataFile("report.rdf")
+    assert not rdf.errors
+
+    report = ReportBuilder("docx")
+    report.section("a").set("head", "Some heading")
+    report.subsection("instruction").subsubsection("test").set("head", "Test")
+    report.subsection("instruction").set("head", "Temperatures")
+    report.root("section:a.subsection:instruction").set("head", "Again")
+
+    assert summary(report.tasks) == summary(rdf.tasks)
+
+
+def test_builder_values_and_misuse():
+    report = ReportBuilder("docx")
+    with pytest.raises(ValueError, match="without a section root"):
+        report.set("head", "text")
+    report.section("a")
+    with pytest.raises(ValueError, match="without a marked"):
+        report.add("table:generic", file="table1.csv")
+    with pytest.raises(ValueError, match="gap"):
+        report.subsubsection("test")
+    with pytest.raises(ValueError, match="slides"):
+        report.slide("Results")
+    with pytest.raises(TypeError):
+        report.set("value", [1, 2])
+
+    # no valid RDF value: plain text, while python numbers stay numbers
+    report.set("head", "2*3").set("pi", 3.141).set("count", 7).set("width", "2cm")
+    values = {t.target: t.value for t in report.tasks}
+    assert (values["head"].type, str(values["head"])) == ("str", "2*3")
+    assert [values[n].type for n in ("pi", "count", "width")] == ["float", "int", "length"]
+    assert report.inspect()[0]["address"]
+
+    with pytest.raises(ValueError, match="Unknown global setting"):
+        ReportBuilder("docx", unknown=1)
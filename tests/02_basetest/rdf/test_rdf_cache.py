@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+from _local_test_setup import *
+
+from Scriptum.rdf.cache import ParseCache # pyright: ignore[reportMissingImports]
+
+
+def _workspace(tmp_path: Path) -> Path:
+    workdir = tmp_path / "workspace"
+    workdir.mkdir()
+    for src in THIS_DIR.glob("rdf_big*.rdf"):
+        (workdir / src.name).write_text(src.read_text())
+    ensure_link(DATA_SOURCE, workdir / "data")
+    return workdir
+
+
+def _summary(rdf):
+    return [(t.serial, tuple(t.myAddress), t.what, repr(t.value)) for t in rdf.tasks]
+
+
+def test_cache_reproduces_parse(monkeypatch: MonkeyPatch, tmp_path: Path):
+    workdir = _workspace(tmp_path)
+    monkeypatch.chdir(workdir)
+    cache = ParseCache(tmp_path / "cache")
+
+    first = ReportDataFile("rdf_big_docx.rdf", cache=cache)
+    assert cache.hits == 0
+
+    second = ReportDataFile("rdf_big_docx.rdf", cache=cache)
+    assert cache.hits == 1
+    assert _summary(second) == _summary(first)
+    assert [str(l) for l in second.logs] == [str(l) for l in first.logs]
+    assert second._visited == first._visited
+
+
+def test_cache_invalidates_changed_fragment_and_ancestors(monkeypatch: MonkeyPatch, tmp_path: Path):
+    workdir = _workspace(tmp_path)
+    monkeypatch.chdir(workdir)
+    cache = ParseCache(tmp_path / "cache")
+    ReportDataFile("rdf_big_docx.rdf", cache=cache)
+
+    # change one fragment that is included by another one
+    sub = workdir / "rdf_big_preparation01sub.rdf"
+    sub.write_text(sub.read_text() + "\n# changed\n")
+
+    cache.hits = cache.misses = 0
+    rdf = ReportDataFile("rdf_big_docx.rdf", cache=cache)
+    assert rdf.errors == []
+    # root, preparation01 and preparation01sub are parsed again, the
+    # untouched siblings instructions01/02, tool01 and preparation02 are not
+    assert cache.misses == 3
+    assert cache.hits == 4
+    assert "# changed" in [str(l) for l in rdf.logs]
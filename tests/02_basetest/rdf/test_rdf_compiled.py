@@ -0,0 +1,92 @@
+from pathlib import Path
+
+from _local_test_setup import *
+
+from Scriptum.rdf.compiled import CompiledReport, FORMAT, MAGIC # pyright: ignore[reportMissingImports]
+from Scriptum.__main__ import main # pyright: ignore[reportMissingImports]
+
+
+def _workspace(tmp_path: Path) -> Path:
+    workdir = tmp_path / "workspace"
+    workdir.mkdir()
+    for src in THIS_DIR.glob("rdf_big*.rdf"):
+        ensure_link(src, workdir / src.name)
+    ensure_link(DATA_SOURCE, workdir / "data")
+    return workdir
+
+
+def test_compile_and_load(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(_workspace(tmp_path))
+
+    assert main(["compile", "rdf_big_docx.rdf", "-o", "big.rdfc"]) == 0
+    rdf = ReportDataFile("rdf_big_docx.rdf")
+    compiled = CompiledReport.load("big.rdfc")
+
+    def summary(tasks):
+        return [(t.serial, t.myAddress, t.what, t.where, sorted(t.actions), repr(t.value)) for t in tasks]
+
+    assert summary(compiled.tasks) == summary(rdf.tasks)
+    assert compiled.settings.documenttype == "docx"
+    assert compiled.settings.datadir == rdf.settings.datadir
+    assert compiled.inspect()[0]["address"] == rdf.inspect()[0]["address"]
+
+
+def test_load_refuses_other_files(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(_workspace(tmp_path))
+
+    with pytest.raises(ValueError, match="not a compiled RDF file"):
+        CompiledReport.load("rdf_big_docx.rdf")
+
+    assert main(["compile", "rdf_big_docx.rdf"]) == 0
+    data = Path("rdf_big_docx.rdfc").read_bytes()
+    # same layout, written by another format
+    Path("other.rdfc").write_bytes(MAGIC + (FORMAT + 1).to_bytes(2, "big") + data[len(MAGIC) + 2:])
+    with pytest.raises(ValueError, match="compile it again"):
+        CompiledReport.load("other.rdfc")
+
+    # a broken RDF file is reported, nothing is written
+    Path("broken.rdf").write_text("*version=3\n!broken\n")
+    assert main(["compile", "broken.rdf"]) == 1
+    assert not Path("broken.rdfc").exists()
+
+
+def test_values_are_plain_data(monkeypatch: MonkeyPatch, tmp_path: Path):
+    import json
+    import pickle
+    import zlib
+    from Scriptum.rdf import Value # pyright: ignore[reportMissingImports]
+    from Scriptum.rdf.settings import SETTINGS # pyright: ignore[reportMissingImports]
+    from Scriptum.rdf.compiled import _decodeValue, _encodeValue # pyright: ignore[reportMissingImports]
+
+    monkeypatch.chdir(tmp_path)
+    Path("p.nv").write_text("a[0]:1\na[1]:2\nx:3\n")
+    settings = SETTINGS()
+    values = [
+        Value("'text'", settings), Value("42", settings), Value("1.5", settings),
+        Value("12.3cm", settings), Value("#ff0000", settings, target="color"),
+        Value("date:1231231230:'%Y'", settings), Value("date:now", settings),
+        Value("numbering:I:%s.", settings), Value("@row1", settings),
+        Value("file:missing.png", settings, target="image"), Value("file:x.mp4", settings, target="video"),
+        Value("file:x.txt", settings, target="text"), Value("file:x.bin", settings, target="other"),
+        Value("file:x.csv", settings, target="table"), Value("parfile:p.nv:a", settings, target="table"),
+        Value("parfile:p.nv:x", settings), Value("newsection:", settings),
+        Value("nonsense", settings),
+    ]
+    for value in values:
+        copy = _decodeValue(json.loads(json.dumps(_encodeValue(value))))
+        assert (copy.type, copy.subtype, copy.tostring, repr(copy)) == \
+            (value.type, value.subtype, value.tostring, repr(value))
+        assert str(copy) == str(value)
+    numbering = _decodeValue(_encodeValue(values[7]))
+    assert (numbering.object.content, values[7].object.content) == ("I.", "I.")
+
+    # a file with anything but the schema is refused, nothing of it is run
+    Path("report.rdf").write_text("*version=3\n*documenttype=docx\nsection:a\n.text:x='one'\n")
+    assert main(["compile", "report.rdf"]) == 0
+    data = Path("report.rdfc").read_bytes()
+    start = len(MAGIC) + 4 + int.from_bytes(data[len(MAGIC) + 2:len(MAGIC) + 4], "big")
+    payload = json.loads(zlib.decompress(data[start:]))
+    assert payload["tasks"][-1]["value"]["object"] == {"kind": "string", "value": "one"}
+    Path("evil.rdfc").write_bytes(data[:start] + zlib.compress(pickle.dumps(print)))
+    with pytest.raises(ValueError):
+        CompiledReport.load("evil.rdfc")
@@ -18,7 +18,6 @@ def test_marker_behavior(tmp_path):
         os.chdir(cwd)
     images = [t for t in rdf.tasks if t.target == "image:generic"]
     assert len(images) == 3
-    ReportTask._newPaths.clear()
     
 def test_multi_section_paths_and_consistency():
     base = Path(__file__).parent / "rdf_multiSection.rdf"
@@ -85,7 +84,7 @@ def test_repeat_section_generates_unique_addresses():
         ('section:a.subsection:instruction_c003.subsubsection:test_c002', 'copy')
         ]
 
-    assert ReportTask._newPaths == {
+    assert rdf.context.newPaths == {
         'section:a.subsection:instruction': ['section:a.subsection:instruction_c002', 'section:a.subsection:instruction_c003'], 
         'section:a.subsection:instruction.head': ['section:a.subsection:instruction_c003.head'], 
         'section:a.subsection:instruction.subsubsection:test': ['section:a.subsection:instruction_c003.subsubsection:test', 
@@ -93,7 +92,48 @@ def test_repeat_section_generates_unique_addresses():
         'section:a.subsection:instruction.subsubsection:test.head': ['section:a.subsection:instruction_c003.subsubsection:test.head', 
                                                                      'section:a.subsection:instruction_c003.subsubsection:test_c002.head']
         }
-
-    ReportTask._newPaths.clear()
     
-    
\ No newline at end of file
+    
+def test_parallel_parses_do_not_interfere():
+    from concurrent.futures import ThreadPoolExecutor
+
+    base = str(Path(__file__).parent / "rdf_multiSection.rdf")
+
+    def parse(_):
+        rdf = ReportDataFile(base)
+        return [(t.serial, tuple(t.myAddress), t.what) for t in rdf.tasks], rdf.context.newPaths
+
+    expected = parse(0)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(parse, range(8)))
+    assert all(r == expected for r in results)
+    # each parse starts counting at 1
+    assert expected[0][0][0] == 1
+
+def test_tasks_are_compact():
+    import pickle
+    rdf = ReportDataFile(str(Path(__file__).parent / "rdf_multiSection.rdf"))
+    for task in rdf.tasks:
+        assert not hasattr(task, "__dict__")
+        assert not hasattr(task.value, "__dict__")
+        assert isinstance(task.path, list) and isinstance(task.myAddress, list)
+    # equal paths are stored once
+    same = {}
+    for task in rdf.tasks:
+        assert same.setdefault(tuple(task.path), task._path) is task._path
+    # still fine for the cache
+    copies = pickle.loads(pickle.dumps(rdf.tasks))
+    assert [t.myAddress for t in copies] == [t.myAddress for t in rdf.tasks]
+
+def test_tasks_count_in_their_context():
+    from Scriptum.rdf import ReportTask, ParseContext
+
+    with pytest.raises(TypeError):
+        ReportTask(root=['section:a'], line="text:x='one'")
+    context = ParseContext()
+    first = ReportTask(root=['section:a'], line="text:x='one'", context=context)
+    second = ReportTask(root=['section:a'], line="text:x='two'", context=context)
+    assert (first.serial, second.serial) == (1, 2)
+    # the second one is a duplicate of the first one
+    assert second.myAddress != first.myAddress
+    assert context.newPaths
@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+
+from _local_test_setup import *
+
+from Scriptum.rdf.cache import ParseCache # pyright: ignore[reportMissingImports]
+
+
+HEAD = ["*version=3", "*documenttype=pptx"]
+
+
+def _summary(tasks):
+    return [(t.serial, t.myAddress, t.what, t.where, sorted(t.actions), repr(t.value)) for t in tasks]
+
+
+def _write(tmp_path: Path):
+    (tmp_path / "cases.csv").write_text("\n".join([
+        "name;result",
+        "# not a case",
+        "alpha;1.5",
+        "",
+        "beta;2",
+        "gamma;-3",
+        "",
+    ]))
+    (tmp_path / "report.rdf").write_text("\n".join(HEAD + [
+        "Title",
+        "  .title='All cases'",
+        "&foreach=file:cases.csv",
+        "Case",
+        "  .title='Case {name}'",
+        "  .value={result}",
+        "  .other='{unknown}'",
+        "&endforeach",
+        "",
+    ]))
+
+
+def test_foreach_is_the_expanded_block(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    _write(tmp_path)
+    lines = HEAD + ["Title", "  .title='All cases'"]
+    for name, result in [("alpha", "1.5"), ("beta", "2"), ("gamma", "-3")]:
+        lines += ["Case", f"  .title='Case {name}'", f"  .value={result}", "  .other='{unknown}'"]
+    Path("expanded.rdf").write_text("\n".join(lines))
+
+    rdf = ReportDataFile("report.rdf")
+    assert rdf.errors == []
+    assert _summary(rdf.tasks) == _summary(ReportDataFile("expanded.rdf").tasks)
+    assert [t.myAddress[0] for t in rdf.tasks if t.target == "value"] == ["case", "case_c002", "case_c003"]
+    assert [t.value.type for t in rdf.tasks if t.target == "value"] == ["float", "int", "int"]
+
+    # rows are read while the tasks are requested
+    streamed = list(ReportDataFile.iter_tasks("report.rdf"))
+    assert _summary(streamed) == _summary(rdf.tasks)
+
+
+def test_foreach_csv_is_a_cache_dependency(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    _write(tmp_path)
+    cache = ParseCache(tmp_path / "cache")
+    assert len(ReportDataFile("report.rdf", cache=cache).tasks) == 2 + 3 * 4
+
+    with open("cases.csv", "a") as f:
+        f.write("delta;4\n")
+    stat = os.stat("cases.csv")
+    os.utime("cases.csv", (stat.st_atime, stat.st_mtime + 10))
+    rdf = ReportDataFile("report.rdf", cache=cache)
+    assert cache.hits == 0
+    assert len(rdf.tasks) == 2 + 4 * 4
+
+
+def test_foreach_errors(monkeypatch: MonkeyPatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    Path("open.rdf").write_text("\n".join(HEAD + ["Title", "&foreach=file:cases.csv", "  .title='{name}'"]))
+    with pytest.raises(Exception, match="without &endforeach"):
+        ReportDataFile("open.rdf")
+
+    Path("missing.rdf").write_text("\n".join(HEAD + ["Title", "&foreach=file:nothing.csv", "&endforeach"]))
+    with pytest.raises(Exception, match="fails to find file"):
+        ReportDataFile("missing.rdf")
+
+    Path("stray.rdf").write_text("\n".join(HEAD + ["Title", "&endforeach"]))
+    with pytest.raises(Exception, match="not defined"):
+        ReportDataFile("stray.rdf")
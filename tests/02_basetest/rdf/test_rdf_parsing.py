@@ -42,7 +42,6 @@ def test_recursion_depth_limit(tmp_path: Path):
     with pytest.raises(Exception) as excinfo:
         ReportDataFile(str(parent))
     assert "Too many recursions" in str(excinfo.value)
-    ReportDataFile._depth = 0
 
 
 def test_malformed_lines_populate_errors(tmp_path: Path):
@@ -146,3 +145,63 @@ def test_details_on_huge_rdf(monkeypatch: MonkeyPatch, tmp_path: Path):
         ], f'Assertion failed, found {addresses}'
 
 
+
+
+def test_parallel_loopfiles_match_sequential(monkeypatch: MonkeyPatch, tmp_path: Path):
+    report_dir = Path(__file__).parent
+    workdir = tmp_path / "workspace"
+    workdir.mkdir()
+    for src in report_dir.glob("rdf_big*.rdf"):
+        ensure_link(src, workdir / src.name)
+    ensure_link(DATA_SOURCE, workdir / "data")
+    monkeypatch.chdir(workdir)
+
+    def summary(rdf):
+        return [(t.serial, t.myAddress, t.what, repr(t.value)) for t in rdf.tasks]
+
+    sequential = ReportDataFile("rdf_big_docx.rdf")
+    parallel = ReportDataFile("rdf_big_docx.rdf", workers=2)
+
+    assert parallel.errors == []
+    assert summary(parallel) == summary(sequential)
+    assert [str(l) for l in parallel.logs] == [str(l) for l in sequential.logs]
+    assert parallel.context.newPaths == sequential.context.newPaths
+    assert parallel._visited == sequential._visited
+
+
+def test_iter_tasks_streams_same_tasks(monkeypatch: MonkeyPatch, tmp_path: Path):
+    report_dir = Path(__file__).parent
+    workdir = tmp_path / "workspace"
+    workdir.mkdir()
+    for src in report_dir.glob("rdf_big*.rdf"):
+        ensure_link(src, workdir / src.name)
+    ensure_link(DATA_SOURCE, workdir / "data")
+    monkeypatch.chdir(workdir)
+
+    rdf = ReportDataFile("rdf_big_docx.rdf")
+    logs = []
+    streamed = list(ReportDataFile.iter_tasks("rdf_big_docx.rdf", logs=logs))
+
+    assert ([(t.serial, t.myAddress, t.what, repr(t.value)) for t in streamed] ==
+            [(t.serial, t.myAddress, t.what, repr(t.value)) for t in rdf.tasks])
+    assert [str(l) for l in logs] == [str(l) for l in rdf.logs]
+
+
+def test_iter_tasks_yields_before_the_end(tmp_path: Path):
+    lines = ["*version=3", "*documenttype=pptx"]
+    for n in range(50):
+        lines += [f"slide:s{n}", f".text:value='{n}'"]
+    lines += ["!broken"]
+    path = tmp_path / "long.rdf"
+    path.write_text("\n".join(lines))
+
+    tasks = ReportDataFile.iter_tasks(str(path))
+    first = next(tasks)
+    assert first.path == ['slide:s0']
+    seen = [first]
+    with pytest.raises(Exception) as excinfo:
+        for task in tasks:
+            seen.append(task)
+    assert "line 103" in str(excinfo.value)
+    # all but the last section, it is never completed
+    assert len(seen) == 98
@@ -0,0 +1,126 @@
+"""Tests for :mod:`tag.tag`."""
+
+from copy import deepcopy
+
+from _local_test_setup import *
+
+from Scriptum.tag import Tag, getTag, getReTag, createTag # pyright: ignore[reportMissingImports]
+
+
+def test_tags_in_text() -> None:
+    assert getTag("no tag at all") == []
+    tags = getTag("<section:intro template> text </section:intro> <image:generic width=4cm/> <wrong: a:b/>")
+    assert [(t.tagtype, t.puretag, t.ns, t.name) for t in tags] == [
+        ("open", "section:intro", "section", "intro"),
+        ("close", "section:intro", "section", "intro"),
+        ("simple", "image:generic", "image", "generic"),
+        ("invalid:not_allowed", "", "wrong", ""),
+    ]
+    assert tags[0].args == {"template": None}
+    assert tags[2].args == {"width": "4cm"}
+    assert tags[2].tagtext == "image:generic width=4cm"
+    assert createTag("text:title").tagtype == "simple"
+
+
+def test_equal_tags_share_what_is_read() -> None:
+    first, second = getTag("<image:generic width=4cm/> and <image:generic width=4cm/>")
+    assert first._data is second._data
+
+    # burned, changed args or types belong to one tag only
+    first.burn()
+    first.setArg("shape", True)
+    second.tagtype = "invalid:notallowed"
+    assert (first.burned, second.burned) == (True, False)
+    assert first.args == {"width": "4cm", "shape": True} and second.args == {"width": "4cm"}
+    assert (first.tagtype, second.tagtype) == ("simple", "invalid:notallowed")
+    assert getTag("<image:generic width=4cm/>")[0].args == {"width": "4cm"}
+
+    # copies share until they change
+    copy = deepcopy(first)
+    assert copy._data is first._data and copy.burned
+    copy.rewriteTag("image:other")
+    assert (copy.puretag, first.puretag) == ("image:other", "image:generic")
+
+
+def test_compiled_tag_patterns_are_kept() -> None:
+    tag = Tag("<text:title/>")
+    assert getReTag(tag) is getReTag(createTag("text:title"))
+    assert getReTag(tag).sub("Report", "A <TEXT:title/>!") == "A Report!"
+
+
+def test_replace_tags_in_runs() -> None:
+    """all tags of a paragraph in one pass, runs keep their format"""
+    import docx # pyright: ignore[reportMissingImports]
+    import pptx # pyright: ignore[reportMissingImports]
+    from Scriptum.element.base import RunTable # pyright: ignore[reportMissingImports]
+    from Scriptum._docx.paragraphs.element import DocParagraphElement # pyright: ignore[reportMissingImports]
+    from Scriptum._pptx.paragraphs.element import PptTextElement # pyright: ignore[reportMissingImports]
+
+    runs = ["Date: <te", "xt:d", "ate/> by ", "", "<text:who/>", " <comment:x/><c/>", "end<ignore:me/>"]
+    paragraph = docx.Document().add_paragraph()
+    for text in runs:
+        paragraph.add_run(text)
+    element = DocParagraphElement(paragraph)
+    # comments are gone at once
+    assert [t.puretag for t in element.tags] == ["text:date", "text:who", "c", "ignore:me"]
+    assert paragraph.runs[5].text == " <c/>"
+
+    found = element.replaceTagsInAll({"text:date": "today", "text:who": "me", "c": "", "missing": "x"})
+    assert paragraph.text == "Date: today by me end<ignore:me/>"
+    # the replace starts in the run the tag starts in, the last run fully inside a tag is given back
+    assert [r.text for r in paragraph.runs] == ["Date: today", "", " by ", "", "me", " ", "end<ignore:me/>"]
+    assert found["text:date"]._r is paragraph.runs[1]._r and found["text:who"]._r is paragraph.runs[4]._r
+    assert [t.burned for t in element.tags] == [True, True, True, False]
+    assert element.replaceTagsInAll({"text:who": "again"}) == {}
+
+    # the table is kept, a run given back may be changed outside
+    table = element.runTable()
+    assert table.offsets == [0, 11, 11, 15, 15, 17, 18, 33]
+    found["text:who"].text = "nobody"
+    assert element.runTable() is table and table.text == "Date: today by nobody end<ignore:me/>"
+    assert element.replaceTag(element.tags[3], "!")._r is paragraph.runs[6]._r
+    assert paragraph.text == "Date: today by nobody end!"
+    assert table.run(0) == 0 and table.run(11) == 2 and table.run(15) == 4
+
+    # pptx paragraphs: a line break is not part of any run
+    slide = pptx.Presentation().slides.add_slide(pptx.Presentation().slide_layouts[6])
+    shape = slide.shapes.add_textbox(0, 0, 100, 100)
+    frame = shape.text_frame
+    frame.text = "a\vb <text:x/>"
+    frame.add_paragraph().text = "<text:x/> and <text:y/>"
+    text = PptTextElement(shape, getTag(shape.text_frame.text))
+    assert RunTable(frame.paragraphs[0].runs).text == "ab <text:x/>"
+    assert set(text.replaceTagsInAll({"text:x": "X", "text:y": "Y"})) == {"text:x", "text:y"}
+    # as replaceTag: the first paragraph holding a tag only
+    assert [p.text for p in frame.paragraphs] == ["a\vb X", "<text:x/> and Y"]
+
+
+def test_run_table_after_runs_changed() -> None:
+    """runs changed outside the replacements: the table is built again"""
+    import docx # pyright: ignore[reportMissingImports]
+    from Scriptum._docx.paragraphs.element import DocParagraphElement # pyright: ignore[reportMissingImports]
+
+    paragraph = docx.Document().add_paragraph()
+    for text in ["<a/> and ", "<b/>", " and <c/>"]:
+        paragraph.add_run(text)
+    element = DocParagraphElement(paragraph)
+    table = element.runTable()
+
+    # a run nobody was given changes its text
+    paragraph.runs[1].text = "<b/><b/>"
+    assert element.runTable() is not table
+    assert element.replaceTagsInAll({"b": "B"}) and paragraph.text == "<a/> and BB and <c/>"
+
+    # a run is changed and keeps its length
+    table = element.runTable()
+    paragraph.runs[0].text = "zzzz and "
+    assert element.runTable() is not table
+    assert element.replaceTagsInAll({"a": "A"}) == {} and paragraph.text == "zzzz and BB and <c/>"
+
+    # a run is added
+    table = element.runTable()
+    paragraph.add_run(" <d/>")
+    element.tags.extend(getTag("<d/>"))
+    assert element.runTable() is not table
+    assert set(element.replaceTagsInAll({"c": "C", "d": "D"})) == {"c", "d"}
+    assert paragraph.text == "zzzz and BB and C D"
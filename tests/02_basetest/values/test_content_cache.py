@@ -0,0 +1,93 @@
+"""Tests for :mod:`rdf.contentcache`."""
+
+import os
+
+from _local_test_setup import *
+
+from Scriptum.rdf.contentcache import ContentCache, contentCache # pyright: ignore[reportMissingImports]
+
+
+def test_values_of_one_file_share_the_content(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "results.nv").write_text("\n".join(f"p{i}:{i}" for i in range(50)))
+    (tmp_path / "table.csv").write_text("a;b\n1;2.5\n")
+    (tmp_path / "report.rdf").write_text("\n".join(
+        ["*version=3", "*documenttype=docx", "section:a"]
+        + [f".value{i}=parfile:results.nv:p{i}" for i in range(50)]
+        + [".table:one=file:table.csv", ".table:two=file:table.csv",
+           ".table:three=file:table.csv+description=@row1"]
+    ))
+    monkeypatch.chdir(tmp_path)
+
+    rdf = ReportDataFile("report.rdf")
+    for task in rdf.tasks:
+        task.value.load()
+    values = {t.target: t.value for t in rdf.tasks}
+    assert [str(values[f"value{i}"].content) for i in range(50)] == [str(i) for i in range(50)]
+    # one read of the NV file, one per way to read the table
+    assert (contentCache.misses, contentCache.hits) == (3, 50)
+    assert values["table:one"].content is values["table:two"].content
+    assert values["table:three"].content.rows == 1
+    assert values["table:three"].content.caption == "a"
+
+    # a changed file is read again
+    (tmp_path / "results.nv").write_text("p0:new")
+    stat = os.stat("results.nv")
+    os.utime("results.nv", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    again = ReportDataFile("report.rdf").tasks[0].value
+    again.load()
+    assert str(again.content) == "new"
+
+
+def test_least_recently_used_entries_are_dropped(tmp_path: Path) -> None:
+    cache = ContentCache(maxsize=2)
+    names = []
+    for name in "abc":
+        (tmp_path / name).write_text(name)
+        names += [str(tmp_path / name)]
+
+    def read(name):
+        return cache.get("text", name, (), lambda: Path(name).read_text())
+
+    assert [read(n) for n in names[:2]] == ["a", "b"]
+    read(names[0])
+    read(names[2])  # drops b, a was used more recently
+    assert (cache.misses, cache.hits, len(cache)) == (3, 1, 2)
+    read(names[0])
+    read(names[1])
+    assert (cache.misses, cache.hits) == (4, 2)
+    cache.clear()
+    assert (cache.misses, cache.hits, len(cache)) == (0, 0, 0)
+
+
+def test_entries_beyond_the_byte_budget_are_dropped(tmp_path: Path) -> None:
+    cache = ContentCache(maxbytes=250)
+    names = []
+    for name, size in zip("abcd", (100, 100, 100, 300)):
+        (tmp_path / name).write_text(name * size)
+        names += [str(tmp_path / name)]
+
+    def read(name):
+        return cache.get("text", name, (), lambda: Path(name).read_text())
+
+    read(names[0])
+    read(names[1])
+    assert (len(cache), cache.nbytes) == (2, 200)
+    read(names[2])  # drops a
+    assert (len(cache), cache.nbytes) == (2, 200)
+    read(names[1])
+    assert (cache.misses, cache.hits) == (3, 1)
+    # too large to be kept, still read
+    assert read(names[3]) == "d" * 300
+    assert (len(cache), cache.nbytes) == (0, 0)
+
+
+def test_tables_tell_their_size(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    (tmp_path / "table.csv").write_text("a;b\n" + "1;2.5\n" * 100)
+    (tmp_path / "report.rdf").write_text("*version=3\n*documenttype=docx\nsection:a\n.table:one=file:table.csv\n")
+    monkeypatch.chdir(tmp_path)
+
+    value = ReportDataFile("report.rdf").tasks[0].value
+    value.load()
+    # 200 cells and two numeric columns
+    assert value.content.nbytes >= 200 * 8
+    assert contentCache.nbytes == value.content.nbytes
@@ -125,3 +125,41 @@ def test_image_value_propagates_open_errors(monkeypatch: pytest.MonkeyPatch, wor
 
     with pytest.raises(OSError):
         task.value.load()
+
+
+def test_image_value_reads_the_header_only(monkeypatch: pytest.MonkeyPatch, workspace: Path) -> None:
+    """Size and dpi come from the header, no file stays open."""
+
+    PIL_Image = pytest.importorskip("PIL.Image")
+    # not into data: that is the shared test data
+    PIL_Image.new("RGB", (30, 20), "red").save(workspace / "dpi.png", dpi=(300, 300))
+
+    monkeypatch.chdir(workspace)
+    rdf_path = _write_rdf(
+        workspace / "image_dpi.rdf",
+        [
+            "*version=100",
+            "*documenttype=docx",
+            "*datadir=.",
+            "section:figures",
+            ".image:preview=file:dpi.png",
+        ],
+    )
+
+    def open_files():
+        fds = Path("/proc/self/fd")
+        return [p.resolve() for p in fds.iterdir()] if fds.exists() else []
+
+    rdf = ReportDataFile(str(rdf_path), _root=[])
+    task = _image_task(rdf)
+    task.value.load()
+
+    metadata = task.value.content
+    assert (metadata.width, metadata.height, metadata.format) == (30, 20, "PNG")
+    assert [round(d) for d in metadata.dpi] == [300, 300]
+    assert task.value.object.dpi == metadata.dpi
+    assert (workspace / "dpi.png").resolve() not in open_files()
+
+    # pixels only on request
+    with task.value.object.open() as image:
+        assert image.getpixel((0, 0)) == (255, 0, 0)
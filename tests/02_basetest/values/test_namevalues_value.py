@@ -111,3 +111,111 @@ def test_strtotime_edge_cases(timestamp: str, expected: datetime | None) -> None
         assert result is None
     else:
         assert result == expected
+
+
+def test_namevalue_reads_requested_parameters_only(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The file is indexed once, values are converted when they are asked for."""
+    import types
+    from Scriptum.rdf.values import namevalues_value # pyright: ignore[reportMissingImports]
+
+    lines = [
+        "Title:Result 7",
+        "# comment:1",
+        "Number Of Elements_jobdiagnosticsummary_1:4711",
+        "WallClockTime_jobdiagnosticsummary_1:12.5",
+        "Modified:1566996265000",
+        "vector[0]:1.0",
+        "long text:'first",
+        "second:line'",
+        "",
+        "Count:42",
+        "Ratio:0.25",
+        "Remark:'quoted'",
+    ] + [f"p{i}:{i}" for i in range(1000)]
+    (tmp_path / "big.nv").write_bytes("\r\n".join(lines).encode())
+    nv = types.SimpleNamespace(filename=str(tmp_path / "big.nv"), exists=True, datetimeformat="%Y", separator=":")
+
+    for size in (namevalues_value.MMAP_SIZE, 0):
+        monkeypatch.setattr(namevalues_value, "MMAP_SIZE", size)
+        reader = NameValueReader(nv)
+        # a mapped file is closed after the scan, the values are read at their offsets
+        assert (reader._buffer is None) == (size == 0)
+        assert reader["Title"] == "Result 7"
+        assert reader["count"] == 42
+        assert reader.get("numberofelements") == 4711
+        assert reader["Number Of Elements_jobdiagnosticsummary_1"] == 4711
+        assert reader["LongText"] == "first\nsecond:line"
+        assert reader["missing"] == f"KeyError in file {nv.filename!r} - missing"
+        assert reader.get("vector[1]") is None and reader.get("comment") is None
+        # nothing else is converted
+        assert len(reader._values) == 4 and not reader._arrays
+
+        # the full parse gives the same
+        assert reader.parsed["wallclocktime"] == 12.5
+        assert reader.parsed["modified"] == datetime.fromtimestamp(1566996265).strftime("%Y")
+        assert reader.parsed["ratio"] == 0.25 and reader.parsed["remark"] == "'quoted'"
+        assert reader.parsed["p999"] == 999
+        assert reader.full_to_parsed["numberofelements_jobdiagnosticsummary_1"] == "numberofelements"
+        assert reader.unparsed == {}
+        assert reader.names["longtext"] == "long text"
+        # with the array vector
+        assert len(reader.parsed) == 9 + 1000
+
+
+def test_namevalue_arrays(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """name[i]:... and name[i,j]:... are arrays, as a whole, element by element or as table."""
+    from Scriptum.rdf.values import namevalues_value, table_value # pyright: ignore[reportMissingImports]
+
+    (tmp_path / "arrays.nv").write_text("\n".join([
+        "Int2[0]:1",
+        "Int2[1]:5",
+        "Real2[0]:1.0",
+        "Real2[2]:-5.7",
+        "str2[0]:hallo",
+        "str2[1]:welt",
+        "Multi [0, 0]:1",
+        "multi[0,1]:4.4",
+        "multi[1,0]:1.9",
+        "multi[1,1]:2",
+        "multi[1,2]:2.25",
+        "note:see [1]",
+        "broken[0]:1",
+        "broken[0,1]:2",
+    ]))
+    (tmp_path / "report.rdf").write_text("\n".join([
+        "*version=3", "*documenttype=docx", "section:a",
+        ".element=parfile:arrays.nv:multi[1,2]",
+        ".missing=parfile:arrays.nv:multi[5,5]",
+        ".table:multi=parfile:arrays.nv:multi+description='all of multi'",
+        ".table:real=parfile:arrays.nv:Real2",
+        ".table:text=parfile:arrays.nv:str2",
+        ".table:broken=parfile:arrays.nv:broken",
+    ]))
+    monkeypatch.chdir(tmp_path)
+
+    for np in {namevalues_value.np, None}:
+        # same result with and without numpy
+        monkeypatch.setattr(namevalues_value, "np", np)
+        monkeypatch.setattr(table_value, "np", np)
+        contentCache.clear()
+        values = {}
+        for task in ReportDataFile("report.rdf").tasks:
+            task.value.load()
+            values[task.target] = task.value.content
+
+        assert values["element"] == 2.25
+        assert values["missing"] == "Not found: 'multi[5,5]'"
+        multi = values["table:multi"]
+        assert (multi.rows, multi.cols, multi.caption) == (2, 3, "all of multi")
+        # missing elements are empty
+        assert multi.data == [[" 1.0000", " 4.4000", ""], [" 1.9000", " 2.0000", " 2.2500"]]
+        assert values["table:real"].data == [[" 1.0000"], [""], ["-5.7000"]]
+        assert values["table:text"].data == [["hallo"], ["welt"]]
+        assert "1, 2" in values["table:broken"].data[0][0]
+
+        reader = task.value.object.parameter.reader
+        assert list(reader["int2"]) == [1, 5]
+        assert reader.get("int2[1]") == 5
+        # brackets anywhere else: ignored as before
+        assert reader.get("note") is None
+        assert reader.names["multi"] == "Multi"
@@ -5,6 +5,9 @@ import sys
 
 from _local_test_setup import  *
 
+from Scriptum.rdf.values import Value # pyright: ignore[reportMissingImports]
+from Scriptum.rdf.settings import SETTINGS # pyright: ignore[reportMissingImports]
+
 def test_counter_formats(tmp_path: Path):
     base = tmp_path / "testCounters.rdf"
     base.write_text("\n".join([
@@ -65,3 +68,20 @@ def test_number_formats(monkeypatch: MonkeyPatch, tmp_path: Path):
         #print(task.serial, task.value.content)
         if task.serial == 1: assert task.value.content == '42'
         if task.serial == 2: assert task.value.content == ' 3.1410' # 7.4
+
+
+@pytest.mark.parametrize("value,vtype,text", [
+    ("42", "int", "42"),
+    ("-3", "int", "-3"),
+    ("3.141", "float", " 3.1410"),
+    (".5", "float", " 0.5000"),
+    ("2e-3", "float", " 0.0020"),
+    ("12.5cm", "length", "12.5"),
+    ("2*3", "invalid", "invalid decimal literal"),
+    ("__import__('os')", "invalid", "neither a number"),
+    ("12km", "invalid", "invalid decimal literal"),
+])
+def test_literals_without_eval(value, vtype, text):
+    v = Value(value, SETTINGS(), target="value")
+    assert v.type == vtype
+    assert str(v).startswith(text)
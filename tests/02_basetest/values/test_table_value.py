@@ -43,3 +43,239 @@ def test_tables(monkeypatch: MonkeyPatch, tmp_path: Path):
             assert csv.cols == 5
             assert csv.data[1][1] == 'Thrust SSC'
 
+
+
+def test_table_columns(monkeypatch: MonkeyPatch, tmp_path: Path):
+    from Scriptum.rdf.settings import SETTINGS # pyright: ignore[reportMissingImports]
+    from Scriptum.rdf.values import table_value # pyright: ignore[reportMissingImports]
+
+    csvfile = tmp_path / "columns.csv"
+    csvfile.write_text("\n".join([
+        "name;count;speed;note",
+        "a;1;1.5;x",
+        "b;2;2;",
+        "c;3;-0.25",
+        "",
+    ]))
+    settings = SETTINGS()
+
+    def load():
+        return table_value.Table(table_value.TableValue(str(csvfile), True, settings), {})
+
+    for np in {table_value.np, None}:
+        # same result with and without numpy
+        monkeypatch.setattr(table_value, "np", np)
+        table = load()
+        assert (table.rows, table.cols) == (4, 4)
+        assert table.data == [
+            ["name", "count", "speed", "note"],
+            ["a", 1, " 1.5000", "x"],
+            ["b", 2, 2, ""],
+            ["c", 3, "-0.2500", ""],
+        ]
+        assert [list(r) for r in table.iterRows()] == table.data
+        assert table.column(2) == ["speed", " 1.5000", 2, "-0.2500"]
+        assert list(table.array(2)) == [1.5, 2.0, -0.25]
+        assert table.array(0) is None and table.array(3) is None
+
+
+def test_numpy_tables(monkeypatch: MonkeyPatch, tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    np.save(tmp_path / "results.npy", np.array([[1.5, 2.0], [-0.25, 3.125]]))
+    (tmp_path / "results.header").write_text("x;y\n")
+    np.save(tmp_path / "counts.npy", np.array([[1, 2, 3], [4, 5, 6]]))
+    records = np.array([(1, 0.5, "a"), (2, 1.25, "b")], dtype=[("n", "i4"), ("value", "f8"), ("label", "U4")])
+    np.savez(tmp_path / "all.npz", records=records, counts=np.arange(3))
+    np.savez_compressed(tmp_path / "packed.npz", counts=np.arange(3))
+    (tmp_path / "report.rdf").write_text("\n".join([
+        "*version=3", "*documenttype=docx", "section:a",
+        ".table:floats=file:results.npy",
+        ".table:ints=file:counts.npy+description='counts'",
+        ".table:records=file:all.npz+key='records'+description=@row1",
+        ".table:first=file:all.npz+key=1",
+        ".table:packed=file:packed.npz",
+        ".table:none=file:all.npz",
+    ]))
+    monkeypatch.chdir(tmp_path)
+
+    rdf = ReportDataFile("report.rdf")
+    assert rdf.errors == []
+    tables = {}
+    for task in rdf.tasks:
+        task.value.load()
+        tables[task.target] = task.value.content
+
+    floats = tables["table:floats"]
+    assert (floats.rows, floats.cols) == (3, 2)
+    assert floats.data == [["x", "y"], [" 1.5000", " 2.0000"], ["-0.2500", " 3.1250"]]
+    assert isinstance(floats.array(0), np.memmap)
+    assert list(floats.array(1)) == [2.0, 3.125]
+
+    ints = tables["table:ints"]
+    assert ints.caption == "counts"
+    assert ints.data == [[1, 2, 3], [4, 5, 6]]
+
+    # fields of a structured array, not compressed: mapped as well
+    records = tables["table:records"]
+    assert records.caption == "n"
+    assert records.data == [[1, " 0.5000", "a"], [2, " 1.2500", "b"]]
+    assert records.array(2) is None and list(records.array(1)) == [0.5, 1.25]
+    assert isinstance(records.array(1), np.memmap)
+    assert tables["table:first"].column(0) == [0, 1, 2]
+    assert tables["table:packed"].column(0) == [0, 1, 2]
+    assert "select one of" in tables["table:none"].data[0][0]
+
+
+def test_numpy_tables_without_numpy(monkeypatch: MonkeyPatch, tmp_path: Path):
+    from Scriptum.rdf.settings import SETTINGS # pyright: ignore[reportMissingImports]
+    from Scriptum.rdf.values import table_value # pyright: ignore[reportMissingImports]
+
+    (tmp_path / "results.npy").write_bytes(b"\x93NUMPY")
+    monkeypatch.setattr(table_value, "np", None)
+    table = table_value.TableValue(str(tmp_path / "results.npy"), True, SETTINGS()).content
+    assert (table.rows, table.cols) == (1, 1)
+    assert "NumPy is required" in table.data[0][0]
+
+
+def test_sqlite_tables(monkeypatch: MonkeyPatch, tmp_path: Path):
+    import sqlite3
+    from Scriptum.rdf.connections import connectionPool # pyright: ignore[reportMissingImports]
+
+    with sqlite3.connect(tmp_path / "results.sqlite") as db:
+        db.execute("create table runs (name text, steps integer, dp real, note text)")
+        db.executemany("insert into runs values (?, ?, ?, ?)",
+                       [("a", 10, 1.5, None), ("b+c", 20, -0.25, "x"), ("d", 30, 2.0, None)])
+    db.close()
+    (tmp_path / "report.rdf").write_text("\n".join([
+        "*version=3", "*documenttype=docx", "section:a",
+        ".table:all=file:results.sqlite+query='select * from runs order by steps'+description='all runs'",
+        ".table:some=file:results.sqlite+query='select name, dp from runs where steps >= 20 and name <> \"d\";'",
+        ".table:named=file:results.sqlite+query='select name, steps + 1 as next from runs'+description=@row1",
+        ".table:broken=file:results.sqlite+query='select missing from runs'",
+        ".table:none=file:results.sqlite",
+    ]))
+    monkeypatch.chdir(tmp_path)
+
+    rdf = ReportDataFile("report.rdf")
+    assert rdf.errors == []
+    tables = {}
+    for task in rdf.tasks:
+        task.value.load()
+        tables[task.target] = task.value.content
+    # one connection for all queries of the file
+    assert len(connectionPool) == 1
+
+    runs = tables["table:all"]
+    assert (runs.rows, runs.cols, runs.caption) == (4, 4, "all runs")
+    assert list(runs.iterRows()) == [
+        ["name", "steps", "dp", "note"],
+        ["a", 10, " 1.5000", ""],
+        ["b+c", 20, "-0.2500", "x"],
+        ["d", 30, " 2.0000", ""],
+    ]
+    assert runs.column(1) == ["steps", 10, 20, 30]
+    assert list(runs.array(2)) == [1.5, -0.25, 2.0]
+    assert runs.array(0) is None
+    assert tables["table:some"].data == [["name", "dp"], ["b+c", "-0.2500"]]
+    named = tables["table:named"]
+    assert (named.caption, named.rows) == ("name", 3)
+    assert named.column(1) == [11, 21, 31]
+    assert "no such column" in tables["table:broken"].data[0][0]
+    assert "no +query" in tables["table:none"].data[0][0]
+
+    # read only, closed after the render and opened again when used
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        with connectionPool.use("results.sqlite") as db:
+            db.execute("delete from runs")
+    connectionPool.close()
+    assert len(connectionPool) == 0
+    assert len(list(runs.iterRows())) == 4
+
+
+def test_sqlite_query_runs(monkeypatch: MonkeyPatch, tmp_path: Path):
+    import sqlite3
+    from Scriptum.rdf.connections import connectionPool # pyright: ignore[reportMissingImports]
+
+    with sqlite3.connect(tmp_path / "results.sqlite") as db:
+        db.execute("create table runs (name text, steps integer)")
+        db.executemany("insert into runs values (?, ?)", [("a", 10), ("b", 20)])
+    db.close()
+    (tmp_path / "report.rdf").write_text("\n".join([
+        "*version=3", "*documenttype=docx", "section:a",
+        ".table:all=file:results.sqlite+query='select * from runs'",
+    ]))
+    monkeypatch.chdir(tmp_path)
+    queries = []
+    connection, _lock = connectionPool.connect("results.sqlite")
+    connection.set_trace_callback(queries.append)
+
+    task = ReportDataFile("report.rdf").tasks[0]
+    task.value.load()
+    table = task.value.content
+    # the header from the cursor, nothing is read yet
+    assert (table.cols, len(queries)) == (2, 1)
+    # the rows are counted while they are streamed
+    assert list(table.iterRows())[1:] == [["a", 10], ["b", 20]]
+    assert (table.rows, len(queries)) == (3, 2)
+    # the numbers are read when they are asked for, once
+    assert list(table.array(1)) == [10, 20] and table.array(0) is None
+    assert len(queries) == 3
+    table.array(1)
+    assert len(queries) == 3
+
+    # asked for before the rows are streamed: counted by the database
+    contentCache.clear()
+    task = ReportDataFile("report.rdf").tasks[0]
+    task.value.load()
+    assert task.value.content.rows == 3
+    assert queries[-1].startswith("select count(*)")
+
+
+def test_connections_of_concurrent_renders(tmp_path: Path):
+    import sqlite3
+    from Scriptum.rdf.connections import connectionPool # pyright: ignore[reportMissingImports]
+
+    with sqlite3.connect(tmp_path / "results.sqlite") as db:
+        db.execute("create table runs (name text)")
+    db.close()
+
+    with connectionPool:
+        with connectionPool:
+            # a second render ends while the first one still reads
+            connection, _lock = connectionPool.connect(tmp_path / "results.sqlite")
+        assert len(connectionPool) == 1
+        assert connection.execute("select count(*) from runs").fetchone() == (0,)
+    assert len(connectionPool) == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        connection.execute("select count(*) from runs")
+
+
+def test_selected_rows(monkeypatch: MonkeyPatch, tmp_path: Path):
+    lines = ["Worst cases", "case;dp;note"] + [f"c{i};{(i * 37) % 1000 / 10};{'ok' if i % 3 else 'check'}" for i in range(2000)]
+    (tmp_path / "cases.csv").write_text("\n".join(lines) + "\n\n")
+    (tmp_path / "plain.csv").write_text("1;5\n2;3\n3;4\n")
+    (tmp_path / "report.rdf").write_text("\n".join([
+        "*version=3", "*documenttype=docx", "section:a",
+        ".table:worst=file:cases.csv+description=@row1+sort='dp'+desc+limit=3+columns='case,dp'",
+        ".table:checks=file:cases.csv+description=@row1+where='note = check and dp >= 99.8'+columns='dp,case'",
+        ".table:last=file:cases.csv+description=@row1+desc+limit=2+columns='1'",
+        ".table:plain=file:plain.csv+sort=2",
+        ".table:wrong=file:cases.csv+sort='speed'",
+        ".table:broken=file:cases.csv+where='dp >'",
+    ]))
+    monkeypatch.chdir(tmp_path)
+
+    tables = {}
+    for task in ReportDataFile("report.rdf").tasks:
+        task.value.load()
+        tables[task.target] = task.value.content
+
+    worst = tables["table:worst"]
+    assert worst.caption == "Worst cases"
+    # equal values keep the order of the file: c54 before c1054
+    assert worst.data == [["case", "dp"], ["c27", "99.9000"], ["c1027", "99.9000"], ["c54", "99.8000"]]
+    assert tables["table:checks"].data == [["dp", "case"], ["99.9000", "c27"], ["99.8000", "c54"]]
+    assert tables["table:last"].data == [["case"], ["c1999"], ["c1998"]]
+    assert tables["table:plain"].data == [[2, 3], [3, 4], [1, 5]]
+    assert tables["table:wrong"].data == [[f"Cannot select from csv file 'cases.csv': no column 'speed'"]]
+    assert "cannot read condition 'dp >'" in tables["table:broken"].data[0][0]
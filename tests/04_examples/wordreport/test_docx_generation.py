@@ -40,3 +40,93 @@ def test_document_is_created(tmp_path):
 
     assert result_path.exists(), "Expected final_report.docx to be generated"
     assert result_path.stat().st_size > 0, "Generated document should not be empty"
+
+
+def test_document_from_compiled_rdf(tmp_path, monkeypatch):
+    import docx
+    import Scriptum
+    from Scriptum.rdf import compileRdf
+
+    workspace = module.WorkspaceBuilder(tmp_path, THIS_DIR / 'data').build(THIS_DIR, ["*.rdf", "template.docx"])
+    monkeypatch.chdir(workspace)
+
+    compileRdf("word_input.rdf", "word_input.rdfc")
+    texts = []
+    for source in ["word_input.rdf", "word_input.rdfc"]:
+        document = Scriptum.ManagedDocx("template.docx")
+        document.typesetting(source)
+        document.save("out.docx")
+        texts.append([p.text for p in docx.Document("out.docx").paragraphs])
+
+    assert texts[0] == texts[1]
+    assert len(texts[0]) > 10
+
+
+def test_document_with_prefetch(tmp_path, monkeypatch):
+    import docx
+    import Scriptum
+    from Scriptum.rdf import contentCache
+
+    workspace = module.WorkspaceBuilder(tmp_path, THIS_DIR / 'data').build(THIS_DIR, ["*.rdf", "template.docx"])
+    monkeypatch.chdir(workspace)
+
+    texts = []
+    for prefetch in [False, 4]:
+        contentCache.clear()
+        document = Scriptum.ManagedDocx("template.docx")
+        document.typesetting("word_input.rdf", prefetch=prefetch)
+        document.save("out.docx")
+        texts.append([p.text for p in docx.Document("out.docx").paragraphs])
+    # all files were read before, the fill loop found them in memory
+    assert contentCache.misses > 0
+    assert texts[0] == texts[1]
+
+
+def test_document_index(tmp_path, monkeypatch):
+    """the index finds the same as a walk over the document, before and after all copies"""
+    import Scriptum
+    from Scriptum.tag import Tag
+
+    workspace = module.WorkspaceBuilder(tmp_path, THIS_DIR / 'data').build(THIS_DIR, ["*.rdf", "template.docx"])
+    monkeypatch.chdir(workspace)
+
+    def walked(document):
+        addresses, tags = {}, set()
+        for sec in document.sections:
+            for e in [sec] + sec.iterOnStructures():
+                addresses.setdefault(".".join(e.path), e)
+            for t, e in sec:
+                if isinstance(t, Tag):
+                    tags.add(t.puretag)
+                elif t in ["table", "image"]:
+                    tags.update(st.puretag for st, se in e.structure if isinstance(st, Tag))
+                    tags.add(e.path[-1])
+        return addresses, tags
+
+    def compare(document):
+        index = document.index
+        addresses, tags = walked(document)
+        assert all(index.address(a) is not None for a in addresses)
+        for tag in tags:
+            # copies are at the end, each one is filled on its own
+            assert sorted((id(t), id(e)) for t, e in index.findGlobal(tag)) == sorted(
+                (id(t), id(e)) for t, e in document.sections.findGlobal(tag)
+            ), tag
+        for t, e in document.sections.templates:
+            assert index.findTemplate(e.path) is document.sections.findTemplate(e.path)
+        return addresses
+
+    document = Scriptum.ManagedDocx("template.docx")
+    before = compare(document)
+    assert document.index.byName("section:template") is document.sections.byName("template")
+
+    document.typesetting("word_input.rdf", directfill=False, globalfill=False,
+                         cleanup=False, removetemplate=False, cleardust=False, setproperties=False)
+    # the copies are found without building anything again
+    after = compare(document)
+    assert len(after) > len(before)
+
+    document.index.delete("section:template")
+    assert document.index.byName("template") is None
+    assert not [a for a in document.index.addresses if a.startswith("section:template")]
+    assert document.index.findTemplate("text") is None
@@ -63,25 +63,26 @@ import Scriptum.rdf.reportDataFile as rdf_module # pyright: ignore[reportMissing
 
 ReportDataFile = rdf_module.ReportDataFile
 ReportTask = rdf_module.ReportTask
+from Scriptum.rdf.contentcache import contentCache # pyright: ignore[reportMissingImports]
+from Scriptum.rdf.connections import connectionPool # pyright: ignore[reportMissingImports]
 
 @pytest.fixture(autouse=True)
 def reset_state():
-    """Reset global state in ReportDataFile and ReportTask between tests."""
-    ReportTask._serial = 0
-    ReportTask._tree = {}
-    ReportTask._allPaths = {}
-    ReportTask._newPaths = {}
-    ReportDataFile._depth = 0
+    """Reset the remaining class-level configuration between tests.
+
+    all parse state lives in a ParseContext per parsed file,
+    file contents read by values in the process-wide contentCache,
+    database connections of tables in connectionPool
+    """
     ReportDataFile._rlimit = 10
-    ReportDataFile._global_settings = {}
+    ReportTask._debug = False
+    contentCache.clear()
+    connectionPool.close()
     yield
-    ReportTask._serial = 0
-    ReportTask._tree = {}
-    ReportTask._allPaths = {}
-    ReportTask._newPaths = {}
-    ReportDataFile._depth = 0
     ReportDataFile._rlimit = 10
-    ReportDataFile._global_settings = {}
+    ReportTask._debug = False
+    contentCache.clear()
+    connectionPool.close()
 
 def setupTestEnvironment(tmp_path, data_source, report_source, include_patterns):
     """setup the test environment based on and for pytest"""
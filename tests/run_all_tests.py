@@ -25,6 +25,9 @@ runTestInDir(curdir / '02_basetest' / 'values' )
 # %%
 runTestInDir(curdir / '02_basetest' / 'parameter' )
 
+# %%
+runTestInDir(curdir / '02_basetest' / 'tag' )
+
 # %%
 runTestInDir(curdir / '02_basetest' / 'docx_basic' , opt="-v")
 